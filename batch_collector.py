@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - Çoklu Hesap Toplu Toplama
+Hesap listesini sınırlı sayıda eşzamanlı toplayıcıyla işler; kayıtlı oturumu geçerli
+olan hesaplar görünmez toplanır, reCAPTCHA gerektirenler sona bırakılıp tek bir
+etkileşimli turda toplanır
+
+Hesap dosyası (satır başına bir hesap, '#' ile başlayan satırlar yok sayılır):
+    220201001
+    220201002,parola
+
+Kullanım:
+    python batch_collector.py hesaplar.txt --workers 3 --retries 2 --report rapor.json
+"""
+
+import sys
+import json
+import time
+import argparse
+import threading
+import concurrent.futures
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, List, Optional
+
+from rich.table import Table
+
+from config import DATA_DIR, INCREMENTAL_REFRESH, BATCH_MAX_WORKERS, BATCH_RETRIES, BATCH_RETRY_DELAY
+from logger import console, user_message, user_success, user_error, user_warning, internal_progress
+from exceptions import KOUException, CaptchaError, AuthenticationError, DataError, WebDriverError
+from models import LoginCredentials
+from rate_governor import get_governor
+from session_manager import SessionManager
+from utils import load_user_data, save_user_data
+
+
+@dataclass
+class AccountResult:
+    """Tek bir hesabın toplama sonucu"""
+    username: str
+    status: str = "pending"  # 'ok', 'captcha', 'failed'
+    attempts: int = 0
+    duration: float = 0.0
+    semesters: int = 0
+    courses: int = 0
+    error_class: str = ""
+    error: str = ""
+    interactive: bool = False
+    errors: List[str] = field(default_factory=list)
+
+
+def load_accounts(path: str) -> List[LoginCredentials]:
+    """Hesap dosyasını oku (parola isteğe bağlıdır, yalnızca reCAPTCHA turunda gerekir)"""
+    accounts, seen = [], set()
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            username, _, password = line.partition(',')
+            username = username.strip()
+            if username and username not in seen:
+                seen.add(username)
+                accounts.append(LoginCredentials(username, password.strip()))
+    return accounts
+
+
+def classify_error(error: Exception) -> KOUException:
+    """Hatayı exceptions.py sınıflarından birine eşle (özet sınıf bazında gruplanır)"""
+    if isinstance(error, KOUException):
+        return error
+    if type(error).__module__.startswith('selenium'):
+        return WebDriverError(str(error).strip().splitlines()[0] if str(error).strip() else type(error).__name__)
+    return KOUException(f"Beklenmeyen hata: {error}", "UNEXPECTED_ERROR")
+
+
+class BatchCollector:
+    """Hesapları sınırlı havuzda toplayan zamanlayıcı"""
+
+    def __init__(self, accounts: List[LoginCredentials], max_workers: int = BATCH_MAX_WORKERS,
+                 retries: int = BATCH_RETRIES, full_refresh: bool = False, backend: Optional[str] = None):
+        self.accounts = accounts
+        self.max_workers = max(1, max_workers)
+        self.retries = max(0, retries)
+        self.full_refresh = full_refresh
+        self.backend = backend
+        self.results: Dict[str, AccountResult] = {account.username: AccountResult(account.username) for account in accounts}
+        self.captcha_queue: List[LoginCredentials] = []
+        self._queue_lock = threading.Lock()
+
+    def _collect(self, credentials: LoginCredentials, interactive: bool = False) -> Dict[str, Any]:
+        """Bir hesabı topla ve kaydet; reCAPTCHA gerekiyorsa CaptchaError fırlatır"""
+        from main_with_session import KOUDataCollector
+
+        session_manager = SessionManager(credentials.username)
+        if not interactive and not session_manager.has_valid_session():
+            raise CaptchaError("Kayıtlı oturum yok, reCAPTCHA ile giriş gerekli")
+
+        collector = KOUDataCollector(headless=not interactive, backend=self.backend, show_progress=interactive)
+        try:
+            if not collector.login_with_session(credentials):
+                # Geri yükleme başarısızsa oturum temizlenmiştir: sunucuda süresi dolmuş demektir
+                if not interactive and not session_manager.has_valid_session():
+                    raise CaptchaError("Kayıtlı oturumun süresi dolmuş, reCAPTCHA ile giriş gerekli")
+                raise AuthenticationError("Giriş başarısız")
+
+            existing = None if self.full_refresh or not INCREMENTAL_REFRESH else load_user_data(credentials.username, DATA_DIR)
+            data = collector.collect_all_semester_data(existing)
+            if not data:
+                raise DataError("Sunucudan veri alınamadı")
+            if not save_user_data(credentials.username, data, DATA_DIR):
+                raise DataError("Toplanan veriler kaydedilemedi")
+            return data
+        finally:
+            collector.close()
+
+    def _run_account(self, credentials: LoginCredentials, interactive: bool = False) -> AccountResult:
+        """Yeniden denemelerle tek bir hesabı işle"""
+        result = self.results[credentials.username]
+        result.interactive = interactive
+        start = time.time()
+
+        for attempt in range(self.retries + 1):
+            result.attempts += 1
+            try:
+                data = self._collect(credentials, interactive)
+                result.status = "ok"
+                result.semesters = len(data)
+                result.courses = sum(len(semester.get("courses", [])) for semester in data.values())
+                result.error_class = result.error = ""
+                break
+            except CaptchaError as e:
+                # Yeniden denemek anlamsız: etkileşimli tura bırak
+                result.status, result.error_class, result.error = "captcha", type(e).__name__, e.message
+                if not interactive:
+                    with self._queue_lock:
+                        self.captcha_queue.append(credentials)
+                break
+            except Exception as e:
+                error = classify_error(e)
+                result.status, result.error_class, result.error = "failed", type(error).__name__, error.message
+                result.errors.append(f"{result.error_class}: {error.message}")
+                if attempt < self.retries:
+                    delay = BATCH_RETRY_DELAY * (2 ** attempt)
+                    internal_progress(f"{credentials.username}: {result.error_class}, {delay:.0f}s sonra tekrar denenecek")
+                    time.sleep(delay)
+
+        result.duration += time.time() - start
+        return result
+
+    def run(self, interactive_captcha: bool = True) -> Dict[str, AccountResult]:
+        """Tüm hesapları işle, ardından reCAPTCHA kuyruğunu tek turda çalıştır"""
+        user_message(f"📋 {len(self.accounts)} hesap, en fazla {self.max_workers} eşzamanlı toplayıcı")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="kou-batch") as pool:
+            futures = {pool.submit(self._run_account, account): account for account in self.accounts}
+            for future in concurrent.futures.as_completed(futures):
+                result = future.result()
+                marker = {"ok": "✅", "captcha": "🔐"}.get(result.status, "❌")
+                console.print(f"{marker} {result.username}: {result.status} ({result.duration:.1f}s)")
+
+        if self.captcha_queue and interactive_captcha:
+            user_message(f"🔐 {len(self.captcha_queue)} hesap için reCAPTCHA turu başlıyor")
+            for credentials in self.captcha_queue:
+                if not credentials.password:
+                    import getpass
+                    credentials = LoginCredentials(credentials.username,
+                                                   getpass.getpass(f"{credentials.username} parolası: "))
+                user_message(f"➡️ {credentials.username}: tarayıcıda reCAPTCHA'yı tamamlayın")
+                self._run_account(credentials, interactive=True)
+
+        return self.results
+
+    def summary(self) -> Dict[str, Any]:
+        """Sonuç özeti: hesap başına süre/veri ve hata sınıfına göre dağılım"""
+        failures: Dict[str, int] = {}
+        for result in self.results.values():
+            if result.status != "ok" and result.error_class:
+                failures[result.error_class] = failures.get(result.error_class, 0) + 1
+
+        return {
+            "accounts": len(self.results),
+            "succeeded": sum(1 for result in self.results.values() if result.status == "ok"),
+            "captcha_pending": sum(1 for result in self.results.values() if result.status == "captcha"),
+            "failed": sum(1 for result in self.results.values() if result.status == "failed"),
+            "total_duration": round(sum(result.duration for result in self.results.values()), 2),
+            "failures_by_class": failures,
+            "rate_governor": get_governor().stats(),
+            "results": [asdict(result) for result in self.results.values()]
+        }
+
+    def print_summary(self):
+        """Özeti tablo olarak göster"""
+        summary = self.summary()
+
+        table = Table(title="Toplu Toplama Özeti", header_style="bold cyan")
+        for column, justify in (("Hesap", "left"), ("Durum", "left"), ("Deneme", "right"), ("Süre", "right"),
+                                ("Dönem", "right"), ("Ders", "right"), ("Hata", "left")):
+            table.add_column(column, justify=justify)
+
+        styles = {"ok": "[green]başarılı[/green]", "captcha": "[yellow]reCAPTCHA[/yellow]", "failed": "[red]başarısız[/red]"}
+        for result in self.results.values():
+            table.add_row(
+                result.username, styles.get(result.status, result.status), str(result.attempts),
+                f"{result.duration:.1f}s", str(result.semesters), str(result.courses),
+                f"{result.error_class}: {result.error}"[:60] if result.error_class else ""
+            )
+        console.print(table)
+
+        if summary["failures_by_class"]:
+            breakdown = ", ".join(f"{name}: {count}" for name, count in sorted(summary["failures_by_class"].items()))
+            user_warning(f"Hatalar (sınıfa göre): {breakdown}")
+        governor = summary["rate_governor"]
+        if governor["requests"]:
+            user_message(f"📶 {governor['requests']} sunucu isteği, son hız sınırı {governor['rate_limit']:.1f}/s, "
+                         f"{governor['errors']} yük hatası, geri çekilme {governor['backoff']:.1f}s")
+        user_success(f"{summary['succeeded']}/{summary['accounts']} hesap toplandı ({summary['total_duration']:.1f}s)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="KOU çoklu hesap toplu toplama")
+    parser.add_argument("accounts", help="Hesap dosyası (satır başına 'numara' veya 'numara,parola')")
+    parser.add_argument("--workers", type=int, default=BATCH_MAX_WORKERS, help="Eşzamanlı toplayıcı sınırı")
+    parser.add_argument("--retries", type=int, default=BATCH_RETRIES, help="Hesap başına yeniden deneme")
+    parser.add_argument("--full", action="store_true", help="Bitmiş dönemler dahil tam yenileme")
+    parser.add_argument("--backend", choices=["http", "browser"], default=None)
+    parser.add_argument("--no-interactive", action="store_true", help="reCAPTCHA gerektiren hesapları atla")
+    parser.add_argument("--report", default=None, help="Özeti JSON olarak yaz")
+    args = parser.parse_args(argv)
+
+    try:
+        accounts = load_accounts(args.accounts)
+    except OSError as e:
+        user_error(f"Hesap dosyası okunamadı: {e}")
+        return 1
+    if not accounts:
+        user_error("Hesap dosyasında hesap yok")
+        return 1
+
+    batch = BatchCollector(accounts, args.workers, args.retries, args.full, args.backend)
+    try:
+        batch.run(interactive_captcha=not args.no_interactive)
+    except KeyboardInterrupt:
+        user_warning("Toplu toplama yarıda kesildi")
+
+    batch.print_summary()
+    summary = batch.summary()
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    return 0 if summary["succeeded"] == summary["accounts"] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
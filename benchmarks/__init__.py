@@ -0,0 +1,4 @@
+"""
+KOU Not Bilgi Sistemi - Performans ölçüm araçları
+Yerel KOUBS benzeri test sunucusu ve kıyaslama betikleri
+"""
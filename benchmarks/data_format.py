@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - Veri Biçimi Kıyaslaması
+Sentetik kullanıcı verisini eski girintili JSON, boşluksuz JSON ve data_codec sıkı
+biçiminde (sıkıştırmasız, zlib, lzma) kodlar; boyutu, kodlama/çözme sürelerini ve
+dosyadan soğuk yüklemeyi (okuma + çözme) karşılaştırır
+
+Kullanım:
+    python -m benchmarks.data_format --sizes medium,large --repeat 20
+    python -m benchmarks.data_format --json
+"""
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+from benchmarks.fake_koubs import generate_dataset
+from benchmarks.run_benchmarks import SIZES
+from data_codec import pack, unpack
+
+FORMATS: Dict[str, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    "json-indent": (
+        lambda value: json.dumps(value, ensure_ascii=False, indent=2, separators=(',', ':')).encode('utf-8'),
+        json.loads
+    ),
+    "json": (lambda value: json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), json.loads),
+    "compact": (lambda value: pack(value, "none"), unpack),
+    "compact+zlib": (lambda value: pack(value, "zlib"), unpack),
+    "compact+lzma": (lambda value: pack(value, "lzma"), unpack)
+}
+REFERENCE = "json-indent"
+
+
+def build_user_data(semesters: int, courses: int, activities: int) -> Dict[str, Any]:
+    """Test sunucusu veri setini save_user_data'nın yazdığı yapıya çevir"""
+    return {
+        "metadata": {"username": "bench000000", "last_updated": time.time(), "version": "6.1.4"},
+        "semesters": {
+            semester["value"]: {
+                "semester_name": semester["text"],
+                "courses": [
+                    {key: value for key, value in course.items() if key != "detail_params"}
+                    for course in semester["courses"]
+                ]
+            }
+            for semester in generate_dataset(semesters, courses, activities)
+        }
+    }
+
+
+def _best_time(fn: Callable, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_format(name: str, value: Any, repeat: int, work_dir: Path) -> Dict[str, Any]:
+    """Tek biçimin boyut ve sürelerini ölç"""
+    encode, decode = FORMATS[name]
+    payload = encode(value)
+    if decode(payload) != value:
+        raise RuntimeError(f"{name}: çözülen veri özgün veriyle aynı değil")
+
+    file_path = work_dir / f"{name}.bin"
+    file_path.write_bytes(payload)
+
+    return {
+        "size": len(payload),
+        "encode_ms": round(_best_time(lambda: encode(value), repeat) * 1000, 3),
+        "decode_ms": round(_best_time(lambda: decode(payload), repeat) * 1000, 3),
+        "load_ms": round(_best_time(lambda: decode(file_path.read_bytes()), repeat) * 1000, 3)
+    }
+
+
+def run(sizes: List[str], repeat: int) -> Dict[str, Any]:
+    """Tüm boyut ve biçimleri ölç; oranlar eski girintili JSON'a göredir"""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="kou_format_") as temp_dir:
+        for size in sizes:
+            value = build_user_data(*SIZES[size])
+            rows = {name: measure_format(name, value, repeat, Path(temp_dir)) for name in FORMATS}
+            reference = rows[REFERENCE]
+            for row in rows.values():
+                row["size_ratio"] = round(row["size"] / reference["size"], 3)
+                row["load_ratio"] = round(row["load_ms"] / reference["load_ms"], 3) if reference["load_ms"] else None
+            results[size] = {"dataset": dict(zip(("semesters", "courses", "activities"), SIZES[size])), "formats": rows}
+    return results
+
+
+def print_report(results: Dict[str, Any]):
+    """Sonuçları tablo olarak göster"""
+    from rich.table import Table
+    from logger import console
+
+    table = Table(title="Veri Biçimi Kıyaslaması", header_style="bold cyan")
+    table.add_column("Veri seti", style="yellow")
+    table.add_column("Biçim")
+    for column in ("Boyut", "Oran", "Kodlama", "Çözme", "Soğuk yükleme"):
+        table.add_column(column, justify="right")
+
+    for size, result in results.items():
+        for name, row in result["formats"].items():
+            table.add_row(
+                size, name, f"{row['size'] / 1024:.1f}KB", f"x{row['size_ratio']:.2f}",
+                f"{row['encode_ms']:.2f} ms", f"{row['decode_ms']:.2f} ms", f"{row['load_ms']:.2f} ms"
+            )
+
+    console.print(table)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Kullanıcı verisi biçim kıyaslaması")
+    parser.add_argument("--sizes", default="small,medium,large", help=f"Virgülle ayrılmış: {','.join(SIZES)}")
+    parser.add_argument("--repeat", type=int, default=10, help="Her ölçüm için tekrar (en hızlısı alınır)")
+    parser.add_argument("--json", action="store_true", help="Sonucu JSON olarak yaz")
+    args = parser.parse_args(argv)
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    unknown = [size for size in sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"Bilinmeyen boyut: {', '.join(unknown)}")
+
+    results = run(sizes, args.repeat)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        print_report(results)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
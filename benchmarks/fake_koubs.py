@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - Yerel KOUBS Test Sunucusu
+Toplayıcının beklediği sayfa yapısını sentetik verilerle sunar; gecikme eklenebilir
+
+Kullanım:
+    python -m benchmarks.fake_koubs --semesters 8 --courses 8 --activities 6 --latency 50
+    KOU_SERVER_URL=http://127.0.0.1:8765 python start.py
+"""
+
+import html
+import time
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse, parse_qs
+
+SESSION_COOKIE = "CFID"
+DEFAULT_SESSION_TOKEN = "bench-session"
+
+COURSE_PREFIXES = ["BLM", "MAT", "FIZ", "TDB", "ATA", "YDB", "ELK", "END"]
+COURSE_TOPICS = [
+    "Programlama", "Veri Yapıları", "Algoritma Analizi", "Diferansiyel Denklemler", "Lineer Cebir",
+    "Olasılık ve İstatistik", "Sayısal Analiz", "Bilgisayar Ağları", "İşletim Sistemleri",
+    "Veritabanı Yönetim Sistemleri", "Yazılım Mühendisliği", "Mantık Devreleri", "Mikroişlemciler",
+    "Türk Dili", "Atatürk İlkeleri ve İnkılap Tarihi", "Yapay Zekâ", "Görüntü İşleme", "Fizik"
+]
+COURSE_LEVELS = ["I", "II", "Laboratuvarı", "Giriş", "Uygulamaları"]
+INSTRUCTOR_TITLES = ["Prof. Dr.", "Doç. Dr.", "Dr. Öğr. Üyesi", "Öğr. Gör."]
+FIRST_NAMES = ["Ayşe", "Mehmet", "Zeynep", "Mustafa", "Elif", "Hüseyin", "Gülşen", "İbrahim", "Şükrü", "Özlem"]
+LAST_NAMES = ["Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Öztürk", "Aydın", "Arslan", "Doğan", "Kılıç"]
+ACTIVITY_TYPES = ["Ara Sınav", "Kısa Sınav", "Ödev", "Proje", "Laboratuvar", "Sözlü Sınav", "Uygulama", "Yarıyıl Sonu Sınavı"]
+LETTER_GRADES = [(90, "AA"), (85, "BA"), (80, "BB"), (75, "CB"), (65, "CC"), (58, "DC"), (50, "DD"), (0, "FF")]
+
+
+def _letter_grade(score: float) -> str:
+    for threshold, letter in LETTER_GRADES:
+        if score >= threshold:
+            return letter
+    return "FF"
+
+
+def generate_dataset(semesters: int = 8, courses: int = 8, activities: int = 6, seed: int = 42) -> List[Dict[str, Any]]:
+    """N dönem × M ders × K aktiviteli sentetik not verisi üret (ilk dönem güncel, notları eksik)"""
+    rng = random.Random(seed)
+    start_year = 2025
+    dataset = []
+
+    for semester_index in range(semesters):
+        year = start_year - (semester_index + 1) // 2
+        is_fall = semester_index % 2 == 0
+        value = f"{year}{1 if is_fall else 2}"
+        text = f"{year}-{year + 1} {'Güz' if is_fall else 'Bahar'}"
+        is_current = semester_index == 0
+
+        semester_courses = []
+        for course_index in range(courses):
+            code = f"{rng.choice(COURSE_PREFIXES)}{100 + semester_index * 10 + course_index}"
+            name = f"{rng.choice(COURSE_TOPICS)} {rng.choice(COURSE_LEVELS)}"
+            instructor = f"{rng.choice(INSTRUCTOR_TITLES)} {rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+            weights = [rng.randint(1, 4) for _ in range(activities)]
+            total_weight = sum(weights)
+            course_activities = []
+            effect_sum = 0.0
+            for activity_index in range(activities):
+                percentage = round(100 * weights[activity_index] / total_weight)
+                graded = not (is_current and activity_index >= activities // 2)
+                score = rng.randint(35, 100) if graded else None
+                effect = round(score * percentage / 100, 2) if graded else None
+                effect_sum += effect or 0
+                course_activities.append({
+                    "activity_type": ACTIVITY_TYPES[activity_index % len(ACTIVITY_TYPES)],
+                    "score": str(score) if graded else "",
+                    "percentage": f"%{percentage}",
+                    "semester_effect": f"{effect:.2f}".replace(".", ",") if graded else ""
+                })
+
+            yio = round(effect_sum)
+            final_score = rng.randint(40, 100)
+            bn = round(yio * 0.4 + final_score * 0.6)
+
+            semester_courses.append({
+                "sequence": str(course_index + 1),
+                "code": code,
+                "name": name,
+                "attendance": rng.choice(["Devamlı", "Devamsız"]) if not is_current else "",
+                "language": rng.choice(["TR", "TR", "EN"]),
+                "ects": str(rng.choice([2, 3, 4, 5, 6])),
+                "yio": str(yio),
+                "yys": "" if is_current else str(final_score),
+                "but": "",
+                "bn": "" if is_current else str(bn),
+                "bd": "" if is_current else _letter_grade(bn),
+                "instructor": instructor,
+                "activities": course_activities,
+                "semester_average": f"{effect_sum:.2f}".replace(".", ","),
+                "detail_params": f"DersKodu={code}&Donem={value}"
+            })
+
+        dataset.append({"value": value, "text": text, "courses": semester_courses})
+
+    return dataset
+
+
+# Sayfa iskeleti: jQuery/Bootstrap yerine toplayıcının kullandığı kadarını taklit eden küçük bir betik
+PAGE_SCRIPT = """
+<script>
+window.jQuery = window.$ = function(selector) {
+    return {modal: function(action) {
+        var e = document.querySelector(selector);
+        if (e) { e.style.display = action === 'hide' ? 'none' : 'block'; }
+    }};
+};
+window.jQuery.active = 0;
+function kouLoad(url, callback) {
+    var xhr = new XMLHttpRequest();
+    xhr.open('GET', url);
+    xhr.onload = function() { callback(xhr.responseText); };
+    xhr.send();
+}
+document.addEventListener('click', function(ev) {
+    var link = ev.target.closest('a');
+    if (!link) { return; }
+    if (link.id === 'DersIslemleri') {
+        ev.preventDefault();
+        var menu = document.getElementById('DersIslemleriMenu');
+        menu.style.display = menu.style.display === 'block' ? 'none' : 'block';
+    } else if (link.getAttribute('name') === 'YariyilNotDurumuYeni/DersIslemleri') {
+        ev.preventDefault();
+        kouLoad('YariyilNotDurumuYeni/DersIslemleri.cfm', function(body) {
+            document.getElementById('Icerik').innerHTML = body;
+        });
+    } else if (link.classList.contains('ders-detay')) {
+        ev.preventDefault();
+        kouLoad('YariyilNotDurumuYeni/DersDetay.cfm?' + link.getAttribute('name'), function(body) {
+            document.getElementById('ModalBody').innerHTML = body;
+            document.getElementById('Modal').style.display = 'block';
+        });
+    }
+});
+document.addEventListener('change', function(ev) {
+    if (ev.target.id !== 'Donem') { return; }
+    kouLoad('YariyilNotDurumuYeni/DersIslemleri.cfm?Donem=' + encodeURIComponent(ev.target.value), function(body) {
+        var doc = new DOMParser().parseFromString(body, 'text/html');
+        document.getElementById('AlinanDersler').innerHTML = doc.getElementById('AlinanDersler').innerHTML;
+    });
+});
+</script>
+"""
+
+
+def render_login_page() -> str:
+    return """<!DOCTYPE html>
+<html lang="tr"><head><meta charset="utf-8"><title>KOUBS Öğrenci Girişi</title></head>
+<body>
+<form method="post" action="index.cfm">
+    <input type="text" id="OgrNo" name="OgrNo">
+    <input type="password" id="Sifre" name="Sifre">
+    <div class="g-recaptcha">reCAPTCHA</div>
+    <button type="submit" id="Giris">Giriş</button>
+</form>
+</body></html>"""
+
+
+def render_main_page(username: str) -> str:
+    return f"""<!DOCTYPE html>
+<html lang="tr"><head><meta charset="utf-8"><title>KOUBS Ana Giriş</title></head>
+<body>
+<nav>
+    <a id="OgrenciBilgileri" href="#">Öğrenci Bilgileri</a>
+    <a id="DersIslemleri" href="#">Ders İşlemleri</a>
+    <div id="DersIslemleriMenu" style="display:none">
+        <a name="YariyilNotDurumuYeni/DersIslemleri" href="#">Yarıyıl Not Durumu</a>
+    </div>
+    <span>{html.escape(username)}</span> <a href="index.cfm">Çıkış</a>
+</nav>
+<div id="Icerik"></div>
+<div id="Modal" class="modal" style="display:none"><div id="ModalBody"></div></div>
+{PAGE_SCRIPT}
+</body></html>"""
+
+
+def render_grade_table(semester: Dict[str, Any]) -> str:
+    rows = []
+    for course in semester["courses"]:
+        cells = [
+            course["sequence"], course["code"],
+            f'<a class="ders-detay" href="#" name="{html.escape(course["detail_params"])}">{html.escape(course["name"])}</a>\n'
+            f'<small>{"Zorunlu" if int(course["sequence"]) % 3 else "Seçmeli"}</small>',
+            course["attendance"], course["language"], course["ects"], course["yio"],
+            course["yys"], course["but"], course["bn"], course["bd"]
+        ]
+        rows.append("<tr>" + "".join(
+            f"<td>{cell if index == 2 else html.escape(cell)}</td>" for index, cell in enumerate(cells)
+        ) + "</tr>")
+
+    header = "".join(f"<th>{title}</th>" for title in
+                     ["No", "Ders Kodu", "Ders Adı", "Devam", "Dil", "AKTS", "YİO", "YYS", "BÜT", "BN", "BD"])
+    return (
+        '<table class="table table-condensed table-bordered" border="1">'
+        f"<tr>{header}</tr>{''.join(rows)}</table>"
+    )
+
+
+def render_grades_fragment(dataset: List[Dict[str, Any]], semester_value: Optional[str]) -> str:
+    selected = next((s for s in dataset if s["value"] == semester_value), dataset[0] if dataset else None)
+    options = "".join(
+        f'<option value="{s["value"]}"{" selected" if selected and s["value"] == selected["value"] else ""}>'
+        f'{html.escape(s["text"])}</option>'
+        for s in dataset
+    )
+    table = render_grade_table(selected) if selected else ""
+    return (
+        '<div class="panel"><h3>Yarıyıl Not Durumu</h3>'
+        f'<select id="Donem" name="Donem">{options}</select>'
+        f'<div id="AlinanDersler">{table}</div></div>'
+    )
+
+
+def render_detail_fragment(course: Dict[str, Any]) -> str:
+    rows = []
+    for activity in course["activities"]:
+        rows.append(
+            '<div class="row bg-warning">'
+            f'<div class="col-lg-3">{html.escape(activity["activity_type"])}</div>'
+            f'<div class="col-lg-1">{activity["score"]}</div>'
+            '<div class="col-lg-2">Tarih</div>'
+            f'<div class="col-lg-2">{activity["percentage"]}</div>'
+            '<div class="col-lg-2">Katkı</div>'
+            f'<div class="col-lg-2">{activity["semester_effect"]}</div>'
+            '</div>'
+        )
+    return (
+        f'<h4 class="alert alert-info">Dersin Öğretim Elemanı: {html.escape(course["instructor"])}</h4>'
+        f'{"".join(rows)}'
+        f'<div class="alert alert-success">Yarıyıl İçi Ortalaması: {course["semester_average"]}</div>'
+    )
+
+
+class FakeKOUBSServer:
+    """İş parçacığında çalışan yerel KOUBS taklidi"""
+
+    def __init__(self, dataset: List[Dict[str, Any]], host: str = "127.0.0.1", port: int = 0,
+                 latency_ms: float = 0, jitter_ms: float = 0, session_token: str = DEFAULT_SESSION_TOKEN):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.session_token = session_token
+        self.request_count = 0
+        self._count_lock = threading.Lock()
+        self.set_dataset(dataset)
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _authenticated(self) -> bool:
+                return f"{SESSION_COOKIE}={server.session_token}" in self.headers.get("Cookie", "")
+
+            def _send(self, status: int, body: str, extra_headers: Optional[Dict[str, str]] = None):
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in (extra_headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                server._delay()
+                parsed = urlparse(self.path)
+                path = parsed.path.lower()
+                query = parse_qs(parsed.query)
+
+                if path in ("/", "/koubs/ogrenci/index.cfm"):
+                    self._send(200, render_login_page())
+                elif not self._authenticated():
+                    self._send(200, render_login_page())
+                elif path == "/koubs/ogrenci/anagiris.cfm":
+                    self._send(200, render_main_page("ogrenci"))
+                elif path == "/koubs/ogrenci/yariyilnotdurumuyeni/dersislemleri.cfm":
+                    self._send(200, render_grades_fragment(server.dataset, query.get("Donem", [None])[0]))
+                elif path == "/koubs/ogrenci/yariyilnotdurumuyeni/dersdetay.cfm":
+                    course = server._courses.get(parsed.query)
+                    if course:
+                        self._send(200, render_detail_fragment(course))
+                    else:
+                        self._send(404, "<p>Ders bulunamadı</p>")
+                else:
+                    self._send(404, "<p>Sayfa bulunamadı</p>")
+
+            def do_POST(self):
+                server._delay()
+                length = int(self.headers.get("Content-Length", 0))
+                form = parse_qs(self.rfile.read(length).decode("utf-8"))
+                if form.get("OgrNo") and form.get("Sifre"):
+                    self._send(302, "", {
+                        "Set-Cookie": f"{SESSION_COOKIE}={server.session_token}; Path=/",
+                        "Location": "/KOUBS/Ogrenci/AnaGiris.cfm"
+                    })
+                else:
+                    self._send(200, render_login_page())
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    def set_dataset(self, dataset: List[Dict[str, Any]]):
+        """Sunulan veri setini değiştir (aynı adreste farklı boyutlarla ölçüm için)"""
+        self.dataset = dataset
+        self._courses = {
+            course["detail_params"]: course
+            for semester in dataset for course in semester["courses"]
+        }
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _delay(self):
+        """Yapılandırılmış sunucu gecikmesini uygula"""
+        with self._count_lock:
+            self.request_count += 1
+        delay = self.latency_ms + (random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    def session_cookies(self) -> List[Dict[str, Any]]:
+        """SessionManager çerez dosyasına yazılabilecek Selenium biçimli oturum çerezi"""
+        host = self.httpd.server_address[0]
+        return [{"name": SESSION_COOKIE, "value": self.session_token, "domain": host, "path": "/"}]
+
+    def start(self) -> "FakeKOUBSServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="fake-koubs", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yerel KOUBS test sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--semesters", type=int, default=8)
+    parser.add_argument("--courses", type=int, default=8)
+    parser.add_argument("--activities", type=int, default=6)
+    parser.add_argument("--latency", type=float, default=0, help="İstek başına gecikme (ms)")
+    parser.add_argument("--jitter", type=float, default=0, help="Gecikme sapması (± ms)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    dataset = generate_dataset(args.semesters, args.courses, args.activities, args.seed)
+    server = FakeKOUBSServer(dataset, args.host, args.port, args.latency, args.jitter)
+
+    print(f"Test sunucusu: {server.url} ({args.semesters} dönem × {args.courses} ders × {args.activities} aktivite)")
+    print(f"Toplayıcıyı bağlamak için: KOU_SERVER_URL={server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - İçe Aktarma Süresi Bütçesi
+Çevrimdışı mod giriş noktasını `python -X importtime` ile temiz bir süreçte içe aktarır,
+toplam süreyi bütçeyle karşılaştırır ve tarayıcı yığınının yüklenmediğini doğrular
+
+Kullanım:
+    python -m benchmarks.import_budget --budget-ms 250
+    python -m benchmarks.import_budget --module kou_main --top 15
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Çevrimdışı modda yüklenmemesi gereken ağır paketler
+FORBIDDEN_PREFIXES = ("selenium", "webdriver_manager", "lxml", "requests", "urllib3")
+
+
+def measure_imports(module: str, repeat: int = 3) -> Dict[str, Any]:
+    """Modülü ayrı süreçlerde içe aktar ve en hızlı çalıştırmanın ölçümlerini döndür"""
+    best = None
+
+    for _ in range(max(1, repeat)):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True,
+            env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"{module} içe aktarılamadı:\n{result.stderr[-2000:]}")
+
+        entries = []
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            if not self_us.strip().isdigit():
+                continue  # Başlık satırı
+            # Her iç içe düzey iki boşluk girintilidir (ilk boşluk ayraçtır)
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            entries.append({
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "name": name.strip(),
+                "depth": depth
+            })
+
+        # Alt modüller üst modülden önce yazılır; hedefin kırılımı bir önceki üst düzey satıra kadardır
+        index = next((i for i, entry in enumerate(entries) if entry["name"] == module and entry["depth"] == 0), None)
+        if index is None:
+            total_us, children = sum(entry["self_us"] for entry in entries), []
+        else:
+            start = index
+            while start > 0 and entries[start - 1]["depth"] > 0:
+                start -= 1
+            total_us, children = entries[index]["cumulative_us"], entries[start:index]
+        run = {"total_ms": total_us / 1000, "entries": entries, "children": children}
+        if best is None or run["total_ms"] < best["total_ms"]:
+            best = run
+
+    return best
+
+
+def check_budget(module: str, budget_ms: float, repeat: int, top: int) -> Dict[str, Any]:
+    """Bütçe ve yasaklı paket kontrollerini yap"""
+    run = measure_imports(module, repeat)
+    names = {entry["name"] for entry in run["entries"]}
+    forbidden = sorted(name for name in names if name.split(".")[0] in FORBIDDEN_PREFIXES)
+
+    # Giriş modülünün doğrudan içe aktardıkları (derinlik 1) en anlamlı kırılımı verir
+    heaviest = sorted(
+        (entry for entry in run["children"] if entry["depth"] == 1),
+        key=lambda entry: entry["cumulative_us"], reverse=True
+    )[:top]
+
+    return {
+        "module": module,
+        "total_ms": round(run["total_ms"], 2),
+        "budget_ms": budget_ms,
+        "within_budget": run["total_ms"] <= budget_ms,
+        "forbidden_imports": forbidden,
+        "heaviest": [
+            {"name": entry["name"], "cumulative_ms": round(entry["cumulative_us"] / 1000, 2)}
+            for entry in heaviest
+        ]
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="İçe aktarma süresi bütçe kontrolü")
+    parser.add_argument("--module", default="kou_main", help="Ölçülecek giriş modülü")
+    parser.add_argument("--budget-ms", type=float, default=250, help="İzin verilen toplam süre (ms)")
+    parser.add_argument("--repeat", type=int, default=3, help="Ölçüm tekrarı (en hızlısı alınır)")
+    parser.add_argument("--top", type=int, default=10, help="Gösterilecek en ağır modül sayısı")
+    parser.add_argument("--json", action="store_true", help="Sonucu JSON olarak yaz")
+    args = parser.parse_args(argv)
+
+    report = check_budget(args.module, args.budget_ms, args.repeat, args.top)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        status = "✅" if report["within_budget"] else "❌"
+        print(f"{status} {report['module']}: {report['total_ms']:.1f} ms (bütçe {report['budget_ms']:.0f} ms)")
+        for entry in report["heaviest"]:
+            print(f"   {entry['cumulative_ms']:8.1f} ms  {entry['name']}")
+        if report["forbidden_imports"]:
+            print(f"❌ Çevrimdışı modda yüklenmemesi gereken modüller: {', '.join(report['forbidden_imports'][:10])}")
+
+    return 0 if report["within_budget"] and not report["forbidden_imports"] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - Uçtan Uca Toplama Kıyaslaması
+KOUDataCollector.collect_all_semester_data'yı yerel test sunucusuna karşı çalıştırır,
+aşama bazında süreleri JSON olarak yazar ve kayıtlı taban çizgisiyle karşılaştırır
+
+Kullanım:
+    python -m benchmarks.run_benchmarks --sizes small,medium --backends http,browser --latency 30
+    python -m benchmarks.run_benchmarks --save-baseline
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from benchmarks.fake_koubs import FakeKOUBSServer, generate_dataset
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+BENCH_USERNAME = "bench000000"
+
+# Veri seti boyutları: (dönem, ders, aktivite)
+SIZES = {
+    "small": (2, 4, 3),
+    "medium": (8, 8, 6),
+    "large": (12, 10, 8)
+}
+
+STAGES = ["driver_startup", "login", "navigation", "semester_switch", "table_parse", "detail_extraction"]
+
+
+def seed_session(server: FakeKOUBSServer):
+    """Test kullanıcısı için geçerli bir kayıtlı oturum yaz (reCAPTCHA adımı atlanır)"""
+    from session_manager import SessionManager
+    SessionManager(BENCH_USERNAME).save_cookie_list(server.session_cookies())
+
+
+def run_collection(server: FakeKOUBSServer, backend: str) -> Dict[str, Any]:
+    """Tek bir toplama çalıştır ve ölçümleri döndür"""
+    from main_with_session import KOUDataCollector, LoginCredentials
+    from utils import clear_checkpoint
+    from config import DATA_DIR
+
+    seed_session(server)
+    # Önceki (yarıda kalmış ya da başka arka uçla yapılmış) çalıştırmanın kontrol noktasından
+    # sürdürülürse dönemler ağdan çekilmez ve ölçüm anlamsızlaşır
+    clear_checkpoint(BENCH_USERNAME, DATA_DIR)
+    requests_before = server.request_count
+    collector = None
+    wall_start = time.time()
+
+    try:
+        collector = KOUDataCollector(headless=True, backend=backend)
+        rate_wait_before = collector.governor.waited
+        if not collector.login_with_session(LoginCredentials(BENCH_USERNAME, "bench")):
+            raise RuntimeError("Test sunucusuna giriş başarısız")
+
+        # Her çalıştırma ağdan ölçülsün diye kalıcı detay önbelleği boşaltılır
+        collector.detail_cache.clear()
+        data = collector.collect_all_semester_data()
+        wall = time.time() - wall_start
+
+        return {
+            "wall": round(wall, 4),
+            "stages": {stage: round(collector.stage_timings.get(stage, 0.0), 4) for stage in STAGES},
+            "idle_wait": round(collector.waiter.total_wait(), 4) if collector.waiter else 0.0,
+            "semesters": len(data),
+            "courses": sum(len(semester.get("courses", [])) for semester in data.values()),
+            "requests": server.request_count - requests_before,
+            "rate_wait": round(collector.governor.waited - rate_wait_before, 4),
+            "rate_limit": round(collector.governor.rate, 2)
+        }
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}", "wall": round(time.time() - wall_start, 4)}
+    finally:
+        if collector:
+            collector.close()
+
+
+def compare_with_baseline(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Taban çizgisine göre tolerans dışı yavaşlamaları bul"""
+    regressions = []
+    for result in results:
+        reference = baseline.get(result["key"])
+        if not reference or "error" in result or "error" in reference:
+            continue
+
+        ratio = result["wall"] / reference["wall"] if reference["wall"] else 1.0
+        result["baseline_wall"] = reference["wall"]
+        result["ratio"] = round(ratio, 3)
+        if ratio > 1 + tolerance:
+            regressions.append(f"{result['key']}: {reference['wall']:.2f}s → {result['wall']:.2f}s (x{ratio:.2f})")
+    return regressions
+
+
+def print_report(results: List[Dict[str, Any]]):
+    """Sonuçları aşama kırılımıyla tablo olarak göster"""
+    from rich.table import Table
+    from logger import console
+
+    table = Table(title="Toplama Kıyaslaması", header_style="bold cyan")
+    table.add_column("Senaryo", style="yellow")
+    table.add_column("Toplam", justify="right")
+    for stage in STAGES:
+        table.add_column(stage, justify="right")
+    table.add_column("Bekleme", justify="right")
+    table.add_column("İstek", justify="right")
+    table.add_column("Taban", justify="right")
+
+    for result in results:
+        if "error" in result:
+            table.add_row(result["key"], "[red]hata[/red]", *[""] * len(STAGES), "", "", result["error"][:40])
+            continue
+        ratio = result.get("ratio")
+        ratio_text = "—" if ratio is None else (f"[red]x{ratio:.2f}[/red]" if ratio > 1 else f"[green]x{ratio:.2f}[/green]")
+        table.add_row(
+            result["key"],
+            f"{result['wall']:.2f}s",
+            *[f"{result['stages'][stage]:.2f}" for stage in STAGES],
+            f"{result['idle_wait']:.2f}",
+            str(result["requests"]),
+            ratio_text
+        )
+
+    console.print(table)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="KOU toplama kıyaslaması")
+    parser.add_argument("--sizes", default="small,medium", help=f"Virgülle ayrılmış: {','.join(SIZES)}")
+    parser.add_argument("--backends", default="http,browser")
+    parser.add_argument("--latency", type=float, default=30, help="Sunucu gecikmesi (ms)")
+    parser.add_argument("--repeat", type=int, default=1, help="Her senaryo için tekrar (en iyisi alınır)")
+    parser.add_argument("--output", default=None, help="Sonuç JSON dosyası (varsayılan: stdout)")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--save-baseline", action="store_true", help="Sonuçları taban çizgisi olarak kaydet")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="İzin verilen yavaşlama oranı")
+    args = parser.parse_args(argv)
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    unknown = [size for size in sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"Bilinmeyen boyut: {', '.join(unknown)}")
+
+    server = FakeKOUBSServer([], latency_ms=args.latency).start()
+    # Yapılandırma içe aktarılmadan önce toplayıcı yerel sunucuya yönlendirilir
+    os.environ["KOU_SERVER_URL"] = server.url
+
+    results = []
+    try:
+        for size in sizes:
+            server.set_dataset(generate_dataset(*SIZES[size]))
+            for backend in [b.strip() for b in args.backends.split(",") if b.strip()]:
+                runs = [run_collection(server, backend) for _ in range(max(1, args.repeat))]
+                successful = [run for run in runs if "error" not in run]
+                best = min(successful, key=lambda run: run["wall"]) if successful else runs[-1]
+                best.update({"key": f"{backend}/{size}/{args.latency:g}ms", "backend": backend, "size": size,
+                             "dataset": dict(zip(("semesters", "courses", "activities"), SIZES[size]))})
+                results.append(best)
+    finally:
+        server.stop()
+
+    baseline_path = Path(args.baseline)
+    regressions = []
+    if baseline_path.exists() and not args.save_baseline:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            regressions = compare_with_baseline(results, json.load(f).get("results", {}), args.tolerance)
+
+    print_report(results)
+
+    report = {
+        "created_at": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "latency_ms": args.latency,
+        "results": {result["key"]: result for result in results},
+        "regressions": regressions
+    }
+
+    if args.save_baseline:
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Taban çizgisi kaydedildi: {baseline_path}")
+    elif args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    else:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    for regression in regressions:
+        print(f"⚠️ Yavaşlama: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - Arka Plan Toplayıcı Servisi
+Girişi yapılmış KOUDataCollector oturumunu süreçler arasında açık tutar ve
+Unix soket üzerinden JSON satırlarıyla komut kabul eder
+
+Komutlar:
+    status                          Oturum ve son yenileme bilgisi
+    refresh_all   {"full": false}    Tüm (artımlı) dönemleri yenile ve kaydet
+    refresh_semester {"semester": "20251", "fresh_details": false}  Tek dönemi yenile ve kaydet
+    refresh_current  {"fresh_details": false}   Sunucudaki güncel dönemi yenile ve kaydet
+    shutdown                        Servisi kapat
+
+Kullanım:
+    python collector_daemon.py start      # Giriş yapar (gerekirse reCAPTCHA) ve hizmete başlar
+    python collector_daemon.py status
+    python collector_daemon.py refresh [--semester 20251] [--full]
+    python collector_daemon.py stop
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import threading
+import socketserver
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+
+from config import DATA_DIR, DAEMON_SOCKET, DAEMON_KEEPALIVE_INTERVAL, INCREMENTAL_REFRESH
+from logger import user_message, user_success, user_error, user_warning, log_error
+from exceptions import KOUException, NetworkError, SessionExpiredError, DataError
+from models import LoginCredentials
+from utils import load_user_data, save_user_data
+
+# Yenileme komutları tüm dönemleri toplayabilir; istemci uzun süre bekler
+REFRESH_TIMEOUT = 900
+CONTROL_TIMEOUT = 30
+
+
+def is_supported() -> bool:
+    """Platform Unix soketlerini destekliyor mu (Windows'ta servis kullanılamaz)"""
+    return hasattr(socket, "AF_UNIX")
+
+
+class CollectorDaemon:
+    """Tek bir kullanıcının toplayıcısını tutan ve komutları sırayla işleyen servis"""
+
+    def __init__(self, username: str, socket_path: Path = DAEMON_SOCKET,
+                 keepalive_interval: int = DAEMON_KEEPALIVE_INTERVAL):
+        self.username = username
+        self.socket_path = Path(socket_path)
+        self.keepalive_interval = keepalive_interval
+        self.collector = None
+        self.started_at = time.time()
+        self.last_refresh: Optional[Dict[str, Any]] = None
+        self.last_keepalive: Optional[float] = None
+        self.session_ok = False
+        self.server = None
+        # Selenium sürücüsü iş parçacığı güvenli değildir: komutlar ve canlı tutma sırayla çalışır
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def login(self, credentials: LoginCredentials, headless: bool = False) -> bool:
+        """Toplayıcıyı oluştur ve giriş yap (kayıtlı oturum yoksa reCAPTCHA gerekir)"""
+        from main_with_session import KOUDataCollector
+
+        self.collector = KOUDataCollector(headless=headless)
+        self.session_ok = self.collector.login_with_session(credentials)
+        if not self.session_ok:
+            self.collector.close()
+            self.collector = None
+        return self.session_ok
+
+    # Komutlar
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "username": self.username,
+            "pid": os.getpid(),
+            "uptime": round(time.time() - self.started_at, 1),
+            "session_ok": self.session_ok,
+            "backend": self.collector.backend if self.collector else None,
+            "browser": bool(self.collector and self.collector.driver),
+            "last_keepalive": self.last_keepalive,
+            "last_refresh": self.last_refresh
+        }
+
+    def refresh(self, full: bool = False, semester: Optional[str] = None, fresh_details: bool = False,
+                current: bool = False) -> Dict[str, Any]:
+        """Dönemleri topla, kullanıcı dosyasına kaydet ve özet döndür (current: yalnızca sunucudaki güncel dönem)"""
+        if not self.session_ok or not self.collector:
+            raise SessionExpiredError("Servis oturumu düştü, servisi yeniden başlatıp giriş yapın")
+
+        start = time.time()
+        existing = load_user_data(self.username, DATA_DIR)
+        if (semester or current) and not existing:
+            # Kayıtlı veri yokken tek dönem kaydedilirse dosya yalnızca o dönemden oluşur: tümü toplanır
+            user_warning(f"{semester or 'Güncel dönem'} için birleştirilecek kayıtlı veri yok, tüm dönemler toplanıyor")
+            semester, current, full = None, False, True
+        base = existing if (semester or current or (INCREMENTAL_REFRESH and not full)) else None
+
+        data = self.collector.collect_all_semester_data(
+            base, only_semesters=[semester] if semester else None, refresh_details=fresh_details,
+            current_only=current
+        )
+        if not data:
+            raise DataError("Sunucudan veri alınamadı")
+        if not save_user_data(self.username, data, DATA_DIR):
+            raise DataError("Toplanan veriler kaydedilemedi")
+
+        self.last_refresh = {
+            "at": time.time(),
+            "duration": round(time.time() - start, 2),
+            "semesters": len(data),
+            "courses": sum(len(semester_data.get("courses", [])) for semester_data in data.values()),
+            "scope": semester or ("current" if current else "full" if full else "incremental"),
+            "current_semester": self.collector.current_semester
+        }
+        return self.last_refresh
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Tek bir isteği işle ve yanıt sözlüğü döndür"""
+        command = request.get("command")
+
+        if command == "status":
+            return {"ok": True, "result": self.status()}
+        if command == "shutdown":
+            self._stop.set()
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return {"ok": True, "result": "kapanıyor"}
+
+        with self._lock:
+            if command == "refresh_all":
+                return {"ok": True, "result": self.refresh(full=bool(request.get("full")))}
+            if command == "refresh_semester":
+                if not request.get("semester"):
+                    raise KOUException("refresh_semester için 'semester' gerekli")
+                return {"ok": True, "result": self.refresh(semester=str(request["semester"]),
+                                                           fresh_details=bool(request.get("fresh_details")))}
+            if command == "refresh_current":
+                return {"ok": True, "result": self.refresh(current=True,
+                                                           fresh_details=bool(request.get("fresh_details")))}
+
+        raise KOUException(f"Bilinmeyen komut: {command}")
+
+    # Canlı tutma
+
+    def _keepalive_loop(self):
+        """Oturumu düzenli hafif isteklerle canlı tut ve kayıtlı çerezlerin süresini uzat"""
+        while not self._stop.wait(self.keepalive_interval):
+            with self._lock:
+                if not self.collector:
+                    continue
+                try:
+                    self.session_ok = self.collector.health_check()
+                except Exception as e:
+                    log_error(f"Canlı tutma hatası: {e}")
+                    self.session_ok = False
+
+                if self.session_ok:
+                    self._extend_saved_session()
+                else:
+                    user_warning("Servis oturumu düştü; yenilemeler yeniden girişe kadar reddedilecek")
+                self.last_keepalive = time.time()
+
+    def _extend_saved_session(self):
+        """Sunucu oturumu açık kaldığı sürece kayıtlı oturumun geçerlilik süresini yenile"""
+        session_manager = self.collector.session_manager
+        if self.collector.driver is not None:
+            session_manager.save_cookies(self.collector.driver)
+        else:
+            cookies = session_manager.get_saved_cookies()
+            if cookies:
+                session_manager.save_cookie_list(cookies)
+
+    # Sunucu
+
+    def serve_forever(self):
+        """Soketi aç ve kapatma komutu gelene kadar hizmet ver"""
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    try:
+                        response = daemon.handle(json.loads(line))
+                    except KOUException as e:
+                        response = {"ok": False, "error": str(e), "type": type(e).__name__}
+                    except Exception as e:
+                        log_error(f"Servis komut hatası: {e}", exc_info=True)
+                        response = {"ok": False, "error": str(e), "type": type(e).__name__}
+                    self.wfile.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+                    self.wfile.flush()
+
+        # Yeni oluşturulan dizin yalnızca sahibine açık (var olan dizinin izinlerine dokunulmaz)
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            if DaemonClient(self.socket_path).is_running():
+                raise KOUException(f"Servis zaten çalışıyor: {self.socket_path}")
+            self.socket_path.unlink()
+
+        # Soket bağlanırken 0600 izinle oluşur: bind ile chmod arasında başka kullanıcının
+        # bağlanabileceği bir an kalmaz (umask süreç genelidir, hemen geri alınır)
+        previous_umask = os.umask(0o177)
+        try:
+            self.server = socketserver.ThreadingUnixStreamServer(str(self.socket_path), Handler)
+        finally:
+            os.umask(previous_umask)
+        self.server.daemon_threads = True
+        os.chmod(self.socket_path, 0o600)  # Yalnızca aynı kullanıcı bağlanabilir
+
+        keepalive = threading.Thread(target=self._keepalive_loop, name="kou-keepalive", daemon=True)
+        keepalive.start()
+
+        user_success(f"Toplayıcı servisi hazır: {self.socket_path}")
+        try:
+            self.server.serve_forever()
+        finally:
+            self._stop.set()
+            self.server.server_close()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+            if self.collector:
+                self.collector.close()
+            user_message("Toplayıcı servisi kapatıldı")
+
+
+class DaemonClient:
+    """Çalışan servise komut gönderen ince istemci"""
+
+    def __init__(self, socket_path: Path = DAEMON_SOCKET):
+        self.socket_path = Path(socket_path)
+
+    def request(self, command: str, timeout: float = CONTROL_TIMEOUT, **params) -> Dict[str, Any]:
+        """Komut gönder ve sonucu döndür; servis hata bildirirse KOUException fırlatır"""
+        if not is_supported() or not self.socket_path.exists():
+            raise NetworkError("Toplayıcı servisi çalışmıyor")
+
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(timeout)
+                sock.connect(str(self.socket_path))
+                sock.sendall((json.dumps({"command": command, **params}) + "\n").encode("utf-8"))
+                with sock.makefile("rb") as stream:
+                    line = stream.readline()
+        except OSError as e:
+            raise NetworkError(f"Servise bağlanılamadı: {e}") from e
+
+        if not line:
+            raise NetworkError("Servis yanıt vermedi")
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise KOUException(response.get("error", "Bilinmeyen servis hatası"))
+        return response["result"]
+
+    def is_running(self) -> bool:
+        try:
+            self.request("status", timeout=2)
+            return True
+        except KOUException:
+            return False
+
+    def status(self) -> Optional[Dict[str, Any]]:
+        """Servis durumu; çalışmıyorsa None"""
+        try:
+            return self.request("status", timeout=2)
+        except KOUException:
+            return None
+
+    def refresh(self, full: bool = False, semester: Optional[str] = None, fresh_details: bool = False,
+                current: bool = False) -> Dict[str, Any]:
+        if current:
+            return self.request("refresh_current", timeout=REFRESH_TIMEOUT, fresh_details=fresh_details)
+        if semester:
+            return self.request("refresh_semester", timeout=REFRESH_TIMEOUT, semester=semester,
+                                fresh_details=fresh_details)
+        return self.request("refresh_all", timeout=REFRESH_TIMEOUT, full=full)
+
+    def shutdown(self) -> bool:
+        try:
+            self.request("shutdown")
+            return True
+        except KOUException:
+            return False
+
+
+def running_daemon_for(username: str, socket_path: Path = DAEMON_SOCKET) -> Optional[DaemonClient]:
+    """Bu kullanıcı için oturumu açık bir servis çalışıyorsa istemcisini döndür"""
+    client = DaemonClient(socket_path)
+    status = client.status()
+    if status and status.get("username") == username and status.get("session_ok"):
+        return client
+    return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="KOU toplayıcı servisi")
+    parser.add_argument("action", choices=["start", "status", "refresh", "stop"])
+    parser.add_argument("--socket", default=str(DAEMON_SOCKET))
+    parser.add_argument("--semester", default=None, help="Yalnızca bu dönemi yenile (ör. 20251)")
+    parser.add_argument("--full", action="store_true", help="Bitmiş dönemler dahil tam yenileme")
+    parser.add_argument("--headless", action="store_true", help="Yalnızca kayıtlı oturumla, pencere açmadan başlat")
+    args = parser.parse_args(argv)
+
+    if not is_supported():
+        user_error("Toplayıcı servisi bu platformda desteklenmiyor (Unix soketi gerekli)")
+        return 1
+
+    client = DaemonClient(Path(args.socket))
+
+    try:
+        if args.action == "start":
+            import getpass
+            username = input("Okul Numarası: ").strip()
+            password = getpass.getpass("Parola: ")
+
+            daemon = CollectorDaemon(username, Path(args.socket))
+            if not daemon.login(LoginCredentials(username, password), headless=args.headless):
+                user_error("Giriş başarısız, servis başlatılmadı")
+                return 1
+            daemon.serve_forever()
+
+        elif args.action == "status":
+            status = client.status()
+            if not status:
+                user_message("Servis çalışmıyor")
+                return 1
+            print(json.dumps(status, ensure_ascii=False, indent=2))
+
+        elif args.action == "refresh":
+            result = client.refresh(full=args.full, semester=args.semester)
+            user_success(f"{result['semesters']} dönem, {result['courses']} ders güncellendi ({result['duration']}s)")
+
+        elif args.action == "stop":
+            if not client.shutdown():
+                user_message("Servis çalışmıyor")
+                return 1
+            user_success("Servis kapatılıyor")
+
+    except KOUException as e:
+        user_error(str(e))
+        return 1
+    except KeyboardInterrupt:
+        return 130
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -16,15 +16,84 @@ APP_DESCRIPTION = "Kocaeli Üniversitesi öğrenci bilgi sistemi için otomatik
 # Üretim/Geliştirme Modu
 PRODUCTION_MODE = os.getenv('KOU_PRODUCTION', 'true').lower() == 'true'
 
-# URL'ler
-BASE_URL = 'https://ogr.kocaeli.edu.tr/KOUBS/ogrenci/index.cfm'
-MAIN_PAGE_URL = 'https://ogr.kocaeli.edu.tr/KOUBS/Ogrenci/AnaGiris.cfm'
+# URL'ler (yerel test sunucusu için KOU_SERVER_URL ile değiştirilebilir)
+SERVER_URL = os.getenv('KOU_SERVER_URL', 'https://ogr.kocaeli.edu.tr').rstrip('/')
+BASE_URL = f'{SERVER_URL}/KOUBS/ogrenci/index.cfm'
+MAIN_PAGE_URL = f'{SERVER_URL}/KOUBS/Ogrenci/AnaGiris.cfm'
+
+# HTTP arka ucu uç noktaları (menü ve ders bağlantılarının 'name' özniteliklerinden türetilir)
+GRADES_PAGE_URL = f'{SERVER_URL}/KOUBS/Ogrenci/YariyilNotDurumuYeni/DersIslemleri.cfm'
+SEMESTER_GRADES_URL = GRADES_PAGE_URL + '?Donem={semester}'
+COURSE_DETAIL_URL = f'{SERVER_URL}/KOUBS/Ogrenci/YariyilNotDurumuYeni/DersDetay.cfm?{{params}}'
+
+# Veri toplama arka ucu: 'browser' (Selenium) veya 'http' (tarayıcısız, çerezlerle).
+# HTTP uç noktaları menü bağlantılarından türetilmiştir, gerçek sunucuda doğrulanana kadar varsayılan tarayıcıdır
+COLLECTION_BACKEND = os.getenv('KOU_BACKEND', 'browser').lower()
+
+# Paralel ders detayı çekme
+DETAIL_MAX_WORKERS = int(os.getenv('KOU_DETAIL_WORKERS', '6'))
+DETAIL_WORKER_TIMEOUT = 10  # Tek bir detay isteği için üst sınır (saniye)
+HTTP_POOL_SIZE = max(8, DETAIL_MAX_WORKERS)
+
+# Sunucu istek hızı düzenleyici: başlangıç/alt/üst sınır (istek/s), ani istek payı, hedef gecikme (saniye),
+# hata sonrası geri çekilme (saniye, her ardışık hatada ikiye katlanır) ve yük hatalarında yeniden deneme
+RATE_LIMIT_ENABLED = os.getenv('KOU_RATE_LIMIT', 'true').lower() == 'true'
+RATE_LIMIT = float(os.getenv('KOU_RATE', '10'))
+RATE_LIMIT_MIN = float(os.getenv('KOU_RATE_MIN', '1'))
+RATE_LIMIT_MAX = float(os.getenv('KOU_RATE_MAX', '40'))
+RATE_BURST = int(os.getenv('KOU_RATE_BURST', '10'))
+RATE_TARGET_LATENCY = float(os.getenv('KOU_RATE_TARGET_LATENCY', '2'))
+RATE_BACKOFF_BASE = 1.0
+RATE_BACKOFF_MAX = 60.0
+RATE_RETRIES = int(os.getenv('KOU_RATE_RETRIES', '2'))
+
+# Görünür tarayıcı yalnızca reCAPTCHA girişi için açılır; toplama görünmez tarayıcıda
+# veya (HTTP arka ucunda) tarayıcısız sürer. Geçerli kayıtlı oturumla Chrome hiç açılmayabilir.
+HEADLESS_HANDOFF = os.getenv('KOU_HANDOFF', 'true').lower() == 'true'
+
+# Etkileşimli oturumda girişi yapılmış toplayıcı bu kadar saniye boşta kalınca kapatılır (0: yeniden kullanma)
+WARM_COLLECTOR_IDLE_TIMEOUT = int(os.getenv('KOU_WARM_IDLE', '600'))
+
+# Not takibi: güncel dönemi yoklama aralığı (saniye), değişiklik yoksa çarpanla üst sınıra kadar seyrekleşir
+WATCH_INTERVAL = float(os.getenv('KOU_WATCH_INTERVAL', '120'))
+WATCH_MAX_INTERVAL = float(os.getenv('KOU_WATCH_MAX_INTERVAL', '1800'))
+WATCH_BACKOFF = float(os.getenv('KOU_WATCH_BACKOFF', '1.5'))
+
+# Toplu toplama: eşzamanlı toplayıcı sınırı, hesap başına yeniden deneme ve ilk bekleme (saniye, her denemede ikiye katlanır)
+BATCH_MAX_WORKERS = int(os.getenv('KOU_BATCH_WORKERS', '3'))
+BATCH_RETRIES = int(os.getenv('KOU_BATCH_RETRIES', '2'))
+BATCH_RETRY_DELAY = float(os.getenv('KOU_BATCH_RETRY_DELAY', '5'))
+
+# Tarayıcı modunda detay stratejisi: 'http' (paralel havuz), 'async_script' (sayfa içi fetch) veya 'click' (modal)
+DETAIL_STRATEGY = os.getenv('KOU_DETAIL_STRATEGY', 'http').lower()
+
+# Tarayıcı modunda tablo ayrıştırma: 'page_source' (lxml, arka planda) veya 'script' (sayfa içi JavaScript)
+TABLE_PARSE_MODE = os.getenv('KOU_PARSE_MODE', 'page_source').lower()
+
+# Artımlı yenileme: yalnızca güncel ve notları tamamlanmamış dönemleri yeniden topla
+INCREMENTAL_REFRESH = os.getenv('KOU_INCREMENTAL', 'true').lower() == 'true'
+
+# Kontrol noktası: her dönem toplandığı anda diske eklenir, yarıda kalan toplama bu süre (saniye) içinde kaldığı yerden sürer
+CHECKPOINT_ENABLED = os.getenv('KOU_CHECKPOINT', 'true').lower() == 'true'
+CHECKPOINT_MAX_AGE = int(os.getenv('KOU_CHECKPOINT_MAX_AGE', str(6 * 3600)))
+
+# Kalıcı ders detayı önbelleği: politika başına geçerlilik süresi (saniye) ve kayıt sınırı
+DETAIL_CACHE_TTL = {
+    'frozen': 30 * 24 * 3600,  # Notları tamamlanmış geçmiş dönemler
+    'current': 30 * 60         # Güncel veya notları eksik dönemler
+}
+DETAIL_CACHE_MAX_ENTRIES = 2000
 
 # Zaman Aşımları (saniye)
 DEFAULT_TIMEOUT = 15
 PAGE_LOAD_TIMEOUT = 30
 SESSION_TIMEOUT_HOURS = 2
 
+# Olay tabanlı bekleme: yoklama aralığı (saniye) ve DOM'un sakin sayılacağı süre (ms)
+WAIT_POLL_INTERVAL = 0.05
+WAIT_QUIET_MS = 150
+WAIT_SETTLE_MS = 600  # AJAX sonrası içerik değişmediyse (ör. boş dönem) kabul süresi
+
 # Chrome Seçenekleri
 CHROME_OPTIONS = {
     'headless': False,
@@ -35,6 +104,26 @@ CHROME_OPTIONS = {
     'log_level': 3
 }
 
+# ChromeDriver: önceden kurulmuş sürücü yolu ve isteğe bağlı Chrome ikili dosyası
+CHROMEDRIVER_PATH = os.getenv('KOU_CHROMEDRIVER', '')
+CHROME_BINARY = os.getenv('KOU_CHROME_BINARY', '')
+
+# Giriş sonrasında CDP (Network.setBlockedURLs) ile engellenecek kaynaklar.
+# Kategoriler KOU_BLOCK_RESOURCES ile seçilir; boş değer engellemeyi kapatır.
+# Giriş sayfası (reCAPTCHA) hiçbir zaman engellenmez.
+BLOCKED_URL_PATTERNS = {
+    'images': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.ico', '*.webp', '*.bmp'],
+    'fonts': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot', '*fonts.googleapis.com*', '*fonts.gstatic.com*'],
+    'media': ['*.mp4', '*.webm', '*.mp3'],
+    'analytics': ['*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*hotjar.com*'],
+    'stylesheets': ['*.css', '*.css?*']
+}
+BLOCKED_RESOURCE_CATEGORIES = [
+    category.strip() for category in
+    os.getenv('KOU_BLOCK_RESOURCES', 'images,fonts,media,analytics,stylesheets').split(',')
+    if category.strip()
+]
+
 # Kullanıcı Ajanı
 USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.7151.41 Safari/537.36'
 
@@ -42,11 +131,9 @@ USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 # Ana dizin yerine yerel dizini kullan
 PROJECT_ROOT = Path(__file__).parent
 SESSION_DIR = PROJECT_ROOT / ".kou_sessions"
-SESSION_DIR.mkdir(exist_ok=True)
 
-# Veri Depolama
+# Veri Depolama (dizinler ilk yazmada oluşturulur, içe aktarma sırasında değil)
 DATA_DIR = SESSION_DIR / "data"
-DATA_DIR.mkdir(exist_ok=True)
 
 # Günlük Kaydı Yapılandırması
 if PRODUCTION_MODE:
@@ -58,6 +145,31 @@ else:
 
 LOG_FILE = SESSION_DIR / "kou_client.log"
 
+# Arka plan toplayıcı servisi: Unix soketi ve oturumu canlı tutma aralığı (saniye)
+DAEMON_SOCKET = Path(os.getenv('KOU_DAEMON_SOCKET', str(SESSION_DIR / "collector.sock")))
+DAEMON_KEEPALIVE_INTERVAL = int(os.getenv('KOU_DAEMON_KEEPALIVE', '900'))
+
+# Chrome sürümüne göre çözümlenmiş sürücü yolları
+DRIVER_CACHE_FILE = SESSION_DIR / "driver_cache.json"
+
+# Engellenen kaynakların bayt tahmini için öğrenilen boyutlar
+RESOURCE_SIZES_FILE = SESSION_DIR / "resource_sizes.json"
+
+# Kullanıcı verisi depolama motoru: 'json' (kullanıcı başına dosya) veya 'sqlite' (DATA_DIR altında tek veritabanı)
+STORAGE_ENGINE = os.getenv('KOU_STORAGE', 'json').lower()
+SQLITE_DB_FILE = DATA_DIR / "grades.db"
+
+# JSON motorunda dosya düzeni: 'segmented' (dönem başına segment, dönemler ilk erişimde çözülür) veya 'monolithic'
+DATA_LAYOUT = os.getenv('KOU_DATA_LAYOUT', 'segmented').lower()
+
+# Kullanıcı verisi kodlaması: 'compact' (anahtar tablolu, data_codec) veya 'json' (okunabilir);
+# sıkıştırma yalnızca 'compact' için: 'zlib', 'lzma' veya 'none'. Okurken biçim dosyadan tanınır.
+DATA_FORMAT = os.getenv('KOU_DATA_FORMAT', 'compact').lower()
+DATA_COMPRESSION = os.getenv('KOU_DATA_COMPRESSION', 'zlib').lower()
+
+# Aynı kullanıcının dosyalarına süreçler arası erişimde kilit bekleme sınırı (saniye)
+FILE_LOCK_TIMEOUT = float(os.getenv('KOU_LOCK_TIMEOUT', '30'))
+
 # Dışa Aktarma Ayarları
 DEFAULT_EXPORT_FORMAT = 'json'
 EXPORT_TIMESTAMP = True
@@ -68,20 +180,67 @@ def get_env_config() -> Dict[str, Any]:
     return {
         'headless': os.getenv('KOU_HEADLESS', 'false').lower() == 'true',
         'timeout': int(os.getenv('KOU_TIMEOUT', str(DEFAULT_TIMEOUT))),
+        'backend': COLLECTION_BACKEND,
         'production': PRODUCTION_MODE
     }
 
 # Yapılandırmayı doğrula
 def validate_config():
     """Yapılandırma ayarlarını doğrula"""
-    if not SESSION_DIR.exists():
-        SESSION_DIR.mkdir(parents=True, exist_ok=True)
-    
-    if not DATA_DIR.exists():
-        DATA_DIR.mkdir(parents=True, exist_ok=True)
-    
     if DEFAULT_TIMEOUT <= 0:
         raise ValueError("Timeout değeri pozitif olmalı")
 
+    if WARM_COLLECTOR_IDLE_TIMEOUT < 0:
+        raise ValueError("KOU_WARM_IDLE negatif olamaz")
+
+    if DAEMON_KEEPALIVE_INTERVAL <= 0:
+        raise ValueError("KOU_DAEMON_KEEPALIVE pozitif olmalı")
+
+    if WATCH_INTERVAL <= 0 or WATCH_MAX_INTERVAL < WATCH_INTERVAL or WATCH_BACKOFF < 1:
+        raise ValueError("KOU_WATCH_* ayarları geçersiz (aralık > 0, üst sınır >= aralık, çarpan >= 1)")
+
+    if BATCH_MAX_WORKERS <= 0 or BATCH_RETRIES < 0 or BATCH_RETRY_DELAY < 0:
+        raise ValueError("KOU_BATCH_* ayarları geçersiz (toplayıcı > 0, deneme ve bekleme >= 0)")
+
+    if not 0 < RATE_LIMIT_MIN <= RATE_LIMIT <= RATE_LIMIT_MAX or RATE_BURST < 1 or RATE_RETRIES < 0:
+        raise ValueError("KOU_RATE_* ayarları geçersiz (0 < alt sınır <= başlangıç <= üst sınır, burst >= 1)")
+
+    if RATE_TARGET_LATENCY <= 0:
+        raise ValueError("KOU_RATE_TARGET_LATENCY pozitif olmalı")
+
+    if STORAGE_ENGINE not in ('json', 'sqlite'):
+        raise ValueError("KOU_STORAGE 'json' veya 'sqlite' olmalı")
+
+    if DATA_LAYOUT not in ('segmented', 'monolithic'):
+        raise ValueError("KOU_DATA_LAYOUT 'segmented' veya 'monolithic' olmalı")
+
+    if DATA_FORMAT not in ('compact', 'json'):
+        raise ValueError("KOU_DATA_FORMAT 'compact' veya 'json' olmalı")
+
+    if DATA_COMPRESSION not in ('zlib', 'lzma', 'none'):
+        raise ValueError("KOU_DATA_COMPRESSION 'zlib', 'lzma' veya 'none' olmalı")
+
+    if FILE_LOCK_TIMEOUT <= 0:
+        raise ValueError("KOU_LOCK_TIMEOUT pozitif olmalı")
+
+    if CHECKPOINT_MAX_AGE <= 0:
+        raise ValueError("KOU_CHECKPOINT_MAX_AGE pozitif olmalı")
+
+    if DETAIL_MAX_WORKERS <= 0:
+        raise ValueError("KOU_DETAIL_WORKERS pozitif olmalı")
+
+    if DETAIL_STRATEGY not in ('http', 'async_script', 'click'):
+        raise ValueError("KOU_DETAIL_STRATEGY 'http', 'async_script' veya 'click' olmalı")
+
+    if TABLE_PARSE_MODE not in ('page_source', 'script'):
+        raise ValueError("KOU_PARSE_MODE 'page_source' veya 'script' olmalı")
+
+    unknown_categories = set(BLOCKED_RESOURCE_CATEGORIES) - set(BLOCKED_URL_PATTERNS)
+    if unknown_categories:
+        raise ValueError(f"KOU_BLOCK_RESOURCES bilinmeyen kategori: {', '.join(sorted(unknown_categories))}")
+
+    if COLLECTION_BACKEND not in ('http', 'browser'):
+        raise ValueError("KOU_BACKEND 'http' veya 'browser' olmalı")
+
 # Yapılandırmayı başlat
 validate_config() 
\ No newline at end of file
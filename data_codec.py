@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - Sıkı Veri Kodlaması
+Kullanıcı verisindeki aynı anahtarlı sözlük listeleri (dersler, aktiviteler) tek anahtar
+listesi ve sütunlar olarak, az sayıda farklı değer alan metin sütunları (aktivite türü,
+dil, harf notu...) ise değer sözlüğü ve indekslerle yazılır. Sonuç boşluksuz JSON'a
+çevrilip isteğe bağlı zlib/lzma ile sıkıştırılır; ayrıştırma C tabanlı json modülünde kalır.
+
+Kodlanmış veri başlığından tanınır:
+    KOUB1 | sıkıştırma (n: yok, z: zlib, x: lzma) | gövde
+Başlığı olmayan veri düz JSON kabul edilir, böylece eski dosyalar aynı yoldan okunur.
+"""
+
+import json
+import zlib
+from typing import Any, Dict
+
+MAGIC = b"KOUB1"
+
+# Gövde içindeki işaretler. İç içe yapı içeren listeler NESTED ile işaretlenir, işaretsiz
+# listeler yalnızca düz değer taşır ve çözülürken dolaşılmaz; ilk öğesi '\x00' ile başlayan
+# düz listeler LIST ile kaçırılır
+TABLE = "\x00T"
+STRINGS = "\x00S"
+NESTED = "\x00N"
+LIST = "\x00L"
+
+# Değer sözlüğü yalnızca bu uzunluktan itibaren ve farklı değerler yarıdan azsa kullanılır
+MIN_DICTIONARY_COLUMN = 4
+
+COMPRESSION_CODES = {"none": b"n", "zlib": b"z", "lzma": b"x"}
+
+
+def _compress(body: bytes, compression: str) -> bytes:
+    if compression == "zlib":
+        return zlib.compress(body, 6)
+    if compression == "lzma":
+        import lzma
+        return lzma.compress(body)
+    return body
+
+
+def _decompress(body: bytes, code: bytes) -> bytes:
+    if code == b"z":
+        return zlib.decompress(body)
+    if code == b"x":
+        import lzma
+        return lzma.decompress(body)
+    if code == b"n":
+        return body
+    raise ValueError(f"Bilinmeyen sıkıştırma kodu: {code!r}")
+
+
+def encode_value(value: Any) -> Any:
+    """Veriyi anahtar tablolu JSON uyumlu yapıya çevir"""
+    if isinstance(value, dict):
+        return {key: encode_value(item) for key, item in value.items()}
+    if not isinstance(value, list):
+        return value
+
+    if len(value) >= 2 and all(isinstance(item, dict) for item in value):
+        keys = list(value[0])
+        if keys and all(list(item) == keys for item in value):
+            return [TABLE, keys, [encode_value([item[key] for item in value]) for key in keys]]
+
+    if len(value) >= MIN_DICTIONARY_COLUMN and all(isinstance(item, str) for item in value):
+        lookup: Dict[str, int] = {}
+        for item in value:
+            lookup.setdefault(item, len(lookup))
+        if len(lookup) * 2 <= len(value):
+            return [STRINGS, list(lookup), [lookup[item] for item in value]]
+
+    if any(isinstance(item, (dict, list)) for item in value):
+        return [NESTED] + [encode_value(item) for item in value]
+    if value and isinstance(value[0], str) and value[0][:1] == "\x00":
+        return [LIST] + value
+    return value
+
+
+def decode_value(value: Any) -> Any:
+    """encode_value çıktısını özgün yapıya geri çevir"""
+    if isinstance(value, dict):
+        return {key: decode_value(item) if isinstance(item, (dict, list)) else item for key, item in value.items()}
+    if not isinstance(value, list) or not value or not isinstance(value[0], str) or value[0][:1] != "\x00":
+        return value
+
+    tag = value[0]
+    if tag == TABLE:
+        keys, columns = value[1], [decode_value(column) for column in value[2]]
+        return [dict(zip(keys, row)) for row in zip(*columns)]
+    if tag == STRINGS:
+        strings = value[1]
+        return [strings[index] for index in value[2]]
+    if tag == NESTED:
+        return [decode_value(item) if isinstance(item, (dict, list)) else item for item in value[1:]]
+    if tag == LIST:
+        return value[1:]
+    raise ValueError(f"Bilinmeyen kodlama işareti: {tag!r}")
+
+
+def pack(value: Any, compression: str = "zlib") -> bytes:
+    """Veriyi başlıklı sıkı biçime kodla"""
+    if compression not in COMPRESSION_CODES:
+        raise ValueError(f"Bilinmeyen sıkıştırma: {compression}")
+
+    body = json.dumps(encode_value(value), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return MAGIC + COMPRESSION_CODES[compression] + _compress(body, compression)
+
+
+def unpack(raw: bytes) -> Any:
+    """Sıkı biçimi veya düz JSON'u çöz; bozuk veride ValueError fırlatır"""
+    if not raw.startswith(MAGIC):
+        return json.loads(raw)
+
+    code = raw[len(MAGIC):len(MAGIC) + 1]
+    try:
+        body = _decompress(raw[len(MAGIC) + 1:], code)
+    except ValueError:
+        raise
+    except Exception as e:
+        # zlib.error ve lzma.LZMAError ortak bir üst sınıf paylaşmıyor
+        raise ValueError(f"Sıkıştırılmış veri çözülemedi: {e}") from e
+    return decode_value(json.loads(body))
+
+
+def is_packed(raw: bytes) -> bool:
+    """Veri sıkı biçimde mi"""
+    return raw.startswith(MAGIC)
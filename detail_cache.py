@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - Kalıcı Ders Detayı Önbelleği
+detail_params anahtarlı, dönem bazlı süre (TTL) politikalı ve boyut sınırlı disk önbelleği
+"""
+
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from config import DATA_DIR, DETAIL_CACHE_TTL, DETAIL_CACHE_MAX_ENTRIES
+from file_io import atomic_write_json
+from logger import internal_progress
+from models import CourseActivity
+
+
+def _serialize_details(details: Dict[str, Any]) -> Dict[str, Any]:
+    """CourseActivity nesnelerini JSON uyumlu sözlüklere çevir"""
+    return {
+        "instructor": details.get("instructor", ""),
+        "semester_average": details.get("semester_average", ""),
+        "activities": [
+            vars(activity) if isinstance(activity, CourseActivity) else dict(activity)
+            for activity in details.get("activities", [])
+        ]
+    }
+
+
+def _content_hash(serialized: Dict[str, Any]) -> str:
+    """Detay içeriğinin kararlı özetini üret"""
+    canonical = json.dumps(serialized, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+class DetailCache:
+    """Süreç yeniden başlatmalarında da korunan ders detayı önbelleği
+
+    Sözlük gibi kullanılır: süresi dolmuş kayıtlar 'in' kontrolünde yok sayılır.
+    Yeni kayıtlar active_policy ('frozen' veya 'current') ile etiketlenir.
+    """
+
+    def __init__(self, username: Optional[str] = None, data_dir: Path = DATA_DIR):
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.active_policy = "current"
+        self.file_path = None
+        self.hits = 0
+        self.unchanged = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        if username:
+            username_hash = hashlib.md5(username.encode()).hexdigest()[:12]
+            self.file_path = Path(data_dir) / f"details_{username_hash}.json"
+            self._load()
+
+    def _load(self):
+        """Disk önbelleğini yükle"""
+        if not self.file_path or not self.file_path.exists():
+            return
+
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.entries = data.get("entries", {})
+            internal_progress(f"Detay önbelleği yüklendi: {len(self.entries)} kayıt")
+        except Exception as e:
+            internal_progress(f"Detay önbelleği okunamadı, sıfırdan başlanıyor: {e}")
+            self.entries = {}
+
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        ttl = DETAIL_CACHE_TTL.get(entry.get("policy", "current"), DETAIL_CACHE_TTL["current"])
+        return time.time() - entry.get("saved_at", 0) < ttl
+
+    def __contains__(self, detail_params: str) -> bool:
+        entry = self.entries.get(detail_params)
+        return entry is not None and self._is_fresh(entry)
+
+    def __getitem__(self, detail_params: str) -> Dict[str, Any]:
+        entry = self.entries[detail_params]
+        self.hits += 1
+        details = entry["details"]
+        return {
+            "instructor": details.get("instructor", ""),
+            "semester_average": details.get("semester_average", ""),
+            "activities": [CourseActivity(**activity) for activity in details.get("activities", [])]
+        }
+
+    def __setitem__(self, detail_params: str, details: Dict[str, Any]):
+        serialized = _serialize_details(details)
+        content_hash = _content_hash(serialized)
+
+        with self._lock:
+            previous = self.entries.get(detail_params)
+            if previous and previous.get("hash") == content_hash:
+                self.unchanged += 1
+
+            self.entries[detail_params] = {
+                "saved_at": time.time(),
+                "hash": content_hash,
+                "policy": self.active_policy,
+                "details": serialized
+            }
+            self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _evict(self):
+        """Süresi dolanları at, sonra en eski kayıtlardan boyut sınırına in"""
+        self.entries = {key: entry for key, entry in self.entries.items() if self._is_fresh(entry)}
+
+        overflow = len(self.entries) - DETAIL_CACHE_MAX_ENTRIES
+        if overflow > 0:
+            oldest = sorted(self.entries, key=lambda key: self.entries[key].get("saved_at", 0))[:overflow]
+            for key in oldest:
+                del self.entries[key]
+
+    def flush(self) -> bool:
+        """Değişiklikleri diske yaz"""
+        if not self.file_path or not self._dirty:
+            return False
+
+        with self._lock:
+            try:
+                self._evict()
+                atomic_write_json(self.file_path, {"entries": self.entries}, separators=(',', ':'))
+                self._dirty = False
+                internal_progress(
+                    f"💾 Detay önbelleği: {len(self.entries)} kayıt, {self.hits} isabet, {self.unchanged} değişmeyen"
+                )
+                return True
+            except Exception as e:
+                internal_progress(f"Detay önbelleği yazılamadı: {e}")
+                return False
+
+    def clear(self):
+        """Önbelleği bellekten ve diskten temizle"""
+        with self._lock:
+            self.entries = {}
+            self._dirty = False
+            if self.file_path and self.file_path.exists():
+                self.file_path.unlink()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - ChromeDriver Çözümleme
+Sürücü yolunu kurulu Chrome sürümüne göre diskte önbelleğe alır; her toplayıcı
+oluşturulduğunda webdriver-manager'a (ve ağa) gidilmesini önler
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import subprocess
+from typing import Optional, Dict, Any, Tuple
+
+from config import CHROMEDRIVER_PATH, CHROME_BINARY, DRIVER_CACHE_FILE
+from file_io import atomic_write_json
+from logger import internal_progress, user_warning
+
+VERSION_PATTERN = re.compile(r'(\d+\.\d+\.\d+\.\d+)')
+
+# Platforma göre Chrome çalıştırılabilir adayları
+CHROME_CANDIDATES = {
+    'linux': ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser'],
+    'darwin': [
+        '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+        '/Applications/Chromium.app/Contents/MacOS/Chromium'
+    ]
+}
+
+WINDOWS_REGISTRY_KEYS = [
+    (r'Software\Google\Chrome\BLBeacon', 'version'),
+    (r'Software\Chromium\BLBeacon', 'version')
+]
+
+
+def _windows_chrome_version() -> Optional[str]:
+    """Windows'ta Chrome sürümünü kayıt defterinden oku (chrome.exe --version çıktı vermez)"""
+    try:
+        import winreg
+    except ImportError:
+        return None
+
+    for root in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        for key_path, value_name in WINDOWS_REGISTRY_KEYS:
+            try:
+                with winreg.OpenKey(root, key_path) as key:
+                    return winreg.QueryValueEx(key, value_name)[0]
+            except OSError:
+                continue
+    return None
+
+
+def detect_chrome_version() -> Optional[str]:
+    """Kurulu Chrome sürümünü ağa çıkmadan tespit et"""
+    if sys.platform.startswith('win'):
+        return _windows_chrome_version()
+
+    platform_key = 'darwin' if sys.platform == 'darwin' else 'linux'
+    candidates = ([CHROME_BINARY] if CHROME_BINARY else []) + CHROME_CANDIDATES[platform_key]
+
+    for candidate in candidates:
+        binary = candidate if os.path.isabs(candidate) else shutil.which(candidate)
+        if not binary or not os.path.exists(binary):
+            continue
+        try:
+            output = subprocess.run(
+                [binary, '--version'], capture_output=True, text=True, timeout=5
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+
+        match = VERSION_PATTERN.search(output)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _load_cache() -> Dict[str, Any]:
+    try:
+        with open(DRIVER_CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: Dict[str, Any]):
+    try:
+        atomic_write_json(DRIVER_CACHE_FILE, cache, indent=2)
+    except OSError as e:
+        internal_progress(f"Sürücü önbelleği yazılamadı: {e}")
+
+
+def _is_executable(path: Optional[str]) -> bool:
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def resolve_chromedriver() -> Tuple[Optional[str], str]:
+    """ChromeDriver yolunu çözümle
+
+    Sıra: yapılandırılmış yol (KOU_CHROMEDRIVER) → Chrome sürümüne göre disk önbelleği →
+    webdriver-manager. Hiçbiri olmazsa (None, 'selenium') döner ve Selenium Manager'a bırakılır.
+
+    Returns:
+        (sürücü yolu, kaynak) - kaynak: 'config', 'cache', 'download', 'stale_cache' veya 'selenium'
+    """
+    if CHROMEDRIVER_PATH:
+        if _is_executable(CHROMEDRIVER_PATH):
+            return CHROMEDRIVER_PATH, 'config'
+        user_warning(f"KOU_CHROMEDRIVER geçersiz, otomatik çözümlemeye dönülüyor: {CHROMEDRIVER_PATH}")
+
+    cache = _load_cache()
+    drivers = cache.setdefault('drivers', {})
+    chrome_version = detect_chrome_version()
+    version_key = chrome_version or 'unknown'
+
+    cached = drivers.get(version_key, {}).get('path')
+    if chrome_version and _is_executable(cached):
+        return cached, 'cache'
+
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+        drivers[version_key] = {'path': path, 'resolved_at': time.time()}
+        cache['drivers'] = drivers
+        _save_cache(cache)
+        return path, 'download'
+    except Exception as e:
+        internal_progress(f"webdriver-manager başarısız: {e}")
+
+    # Ağ yoksa sürüm tutmasa bile son bilinen sürücüyü dene
+    known = sorted(
+        (entry for entry in drivers.values() if _is_executable(entry.get('path'))),
+        key=lambda entry: entry.get('resolved_at', 0), reverse=True
+    )
+    if known:
+        return known[0]['path'], 'stale_cache'
+
+    return None, 'selenium'
+
+
+def record_startup(source: str, elapsed: float) -> Dict[str, float]:
+    """Sürücü başlatma süresini soğuk/sıcak olarak kaydet ve son ölçümleri döndür
+
+    Sürücünün indirilmesi/çözümlenmesi gereken başlangıçlar 'cold', önbellekten
+    veya yapılandırmadan gelenler 'warm' sayılır.
+    """
+    cache = _load_cache()
+    kind = 'cold' if source in ('download', 'selenium') else 'warm'
+    startup = cache.setdefault('startup', {})
+    startup[kind] = round(elapsed, 3)
+    _save_cache(cache)
+    return startup
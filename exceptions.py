@@ -70,6 +70,14 @@ class ParseError(DataError):
         self.error_code = "PARSE_ERROR"
 
 
+class FileLockError(DataError):
+    """Dosya kilidi süresinde alınamadı (aynı kullanıcı için başka bir süreç yazıyor)"""
+    
+    def __init__(self, message: str = "Dosya kilidi alınamadı"):
+        super().__init__(message)
+        self.error_code = "FILE_LOCKED"
+
+
 class ValidationError(KOUException):
     """Giriş doğrulama hataları"""
     
@@ -160,6 +168,7 @@ ERROR_MESSAGES = {
     "DATA_ERROR": "Veri işleme hatası",
     "PARSE_ERROR": "Veri ayrıştırma hatası",
     "NO_DATA_FOUND": "Veri bulunamadı",
+    "FILE_LOCKED": "Dosya kilidi alınamadı",
     "VALIDATION_ERROR": "Geçersiz veri girişi",
     "CONFIG_ERROR": "Konfigürasyon hatası",
     "WEBDRIVER_ERROR": "WebDriver hatası",
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - Çökmeye Dayanıklı Dosya Yazımı ve Kilitleme
+Kalıcı dosyalar aynı dizindeki geçici dosyaya yazılıp fsync edilir ve os.replace ile
+tek adımda yerine taşınır; yazım yarıda kalırsa eski dosya olduğu gibi kalır. İstenirse
+önceki sürüm '.bak' olarak saklanır (bozulma halinde geri dönülecek son sağlam nesil).
+
+Aynı kullanıcının dosyalarına birden çok süreçten (CLI, servis, toplu toplama) erişim
+'.lock' dosyası üzerinde tavsiye niteliğinde kilitle sıralanır: POSIX'te fcntl.flock,
+Windows'ta msvcrt.locking (Windows'ta paylaşımlı kilit de özel kilit olarak alınır).
+"""
+
+import os
+import json
+import time
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from config import FILE_LOCK_TIMEOUT
+from exceptions import FileLockError
+
+LOCK_POLL_INTERVAL = 0.05
+
+# Aynı iş parçacığının tuttuğu kilitler yeniden alınmaz (iç içe çağrılarda kendini beklemesin)
+_held = threading.local()
+
+
+def backup_path(path: Path) -> Path:
+    """Son sağlam neslin yolu"""
+    return path.with_name(path.name + ".bak")
+
+
+def _fsync_directory(directory: Path):
+    """Yeniden adlandırmanın kalıcı olması için dizin girdisini diske yaz (POSIX)"""
+    if os.name == 'nt':
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _keep_backup(path: Path):
+    """Mevcut dosyayı '.bak' olarak sakla; sabit bağlantı kopyalamadan ve boşluk bırakmadan eski içeriği tutar"""
+    if not path.exists():
+        return
+    backup = backup_path(path)
+    try:
+        if backup.exists():
+            backup.unlink()
+        os.link(path, backup)
+    except OSError:
+        # Sabit bağlantı desteklenmeyen dosya sistemleri
+        shutil.copy2(path, backup)
+
+
+def atomic_write(path: Path, data: bytes, keep_backup: bool = False):
+    """Baytları geçici dosya + fsync + os.replace ile yaz"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if keep_backup:
+            _keep_backup(path)
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+    _fsync_directory(path.parent)
+
+
+def atomic_write_text(path: Path, text: str, keep_backup: bool = False):
+    """Metni UTF-8 olarak atomik yaz"""
+    atomic_write(path, text.encode('utf-8'), keep_backup)
+
+
+def atomic_write_json(path: Path, value: Any, keep_backup: bool = False, **dumps_kwargs):
+    """JSON'u atomik yaz (json.dumps argümanları aynen geçer)"""
+    dumps_kwargs.setdefault("ensure_ascii", False)
+    atomic_write_text(path, json.dumps(value, **dumps_kwargs), keep_backup)
+
+
+def _try_lock(f, shared: bool) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(f):
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    except OSError:
+        pass
+
+
+@contextmanager
+def file_lock(lock_path: Path, shared: bool = False, timeout: Optional[float] = None) -> Iterator[None]:
+    """Kilit dosyası üzerinde süreçler arası kilit; süresinde alınamazsa FileLockError"""
+    lock_path = Path(lock_path)
+    key = str(lock_path.resolve())
+    held = getattr(_held, "paths", None)
+    if held is None:
+        held = _held.paths = set()
+    if key in held:
+        yield
+        return
+
+    timeout = FILE_LOCK_TIMEOUT if timeout is None else timeout
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    f = open(lock_path, 'a+b')
+    try:
+        deadline = time.monotonic() + timeout
+        while not _try_lock(f, shared):
+            if time.monotonic() >= deadline:
+                raise FileLockError(f"{lock_path.name} {timeout:g}s içinde kilitlenemedi, başka bir işlem sürüyor")
+            time.sleep(LOCK_POLL_INTERVAL)
+
+        held.add(key)
+        try:
+            yield
+        finally:
+            held.discard(key)
+            _unlock(f)
+    finally:
+        f.close()
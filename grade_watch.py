@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - Not Takibi
+Yalnızca güncel dönemi düzenli aralıklarla yeniden toplar, önbellekteki veriyle
+ders ve aktivite bazında karşılaştırır ve yalnızca değişiklikleri yazdırır. Güncel dönem
+her yoklamada sunucunun dönem listesinden alınır; yeni dönem açılınca takip ona geçer
+"""
+
+import json
+import time
+import hashlib
+from pathlib import Path
+from typing import Dict, Any, List, Callable, Optional, Tuple
+
+from config import DATA_DIR, WATCH_INTERVAL, WATCH_MAX_INTERVAL, WATCH_BACKOFF
+from logger import console, user_message, user_warning, user_error, internal_progress
+from exceptions import KOUException, SessionExpiredError
+
+# Karşılaştırılan ders alanları (etiketleri konsol çıktısı için)
+COURSE_FIELDS = {
+    "yio": "Yıl içi",
+    "yys": "Yarıyıl sonu",
+    "but": "Bütünleme",
+    "bn": "Başarı notu",
+    "bd": "Başarı durumu",
+    "attendance": "Devam",
+    "semester_average": "Yarıyıl ortalaması",
+    "instructor": "Öğretim elemanı"
+}
+ACTIVITY_FIELDS = ("score", "percentage", "semester_effect")
+
+
+def _activity_keys(activities: List[Dict[str, Any]]) -> Dict[Tuple[str, int], Dict[str, Any]]:
+    """Aktiviteleri (tür, sıra) anahtarıyla eşle; aynı türden birden çok aktivite olabilir"""
+    keyed, seen = {}, {}
+    for activity in activities or []:
+        activity_type = activity.get("activity_type", "")
+        index = seen.get(activity_type, 0)
+        seen[activity_type] = index + 1
+        keyed[(activity_type, index)] = activity
+    return keyed
+
+
+def _activity_label(key: Tuple[str, int]) -> str:
+    activity_type, index = key
+    return activity_type if index == 0 else f"{activity_type} #{index + 1}"
+
+
+def diff_semester(old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """İki dönem verisini ders ve aktivite bazında karşılaştır
+
+    Returns:
+        Değişiklik listesi; her öğe kind ('course_added', 'course_removed', 'field',
+        'activity_added', 'activity_removed', 'activity'), course, name ve gerekirse
+        field/activity/old/new alanlarını içerir
+    """
+    old_courses = {course.get("code"): course for course in (old or {}).get("courses", [])}
+    new_courses = {course.get("code"): course for course in (new or {}).get("courses", [])}
+    changes = []
+
+    for code, course in new_courses.items():
+        previous = old_courses.get(code)
+        base = {"course": code, "name": course.get("name", "")}
+
+        if previous is None:
+            changes.append({**base, "kind": "course_added"})
+            continue
+
+        for field in COURSE_FIELDS:
+            if (previous.get(field) or "") != (course.get(field) or ""):
+                changes.append({**base, "kind": "field", "field": field,
+                                "old": previous.get(field, ""), "new": course.get(field, "")})
+
+        old_activities = _activity_keys(previous.get("activities"))
+        new_activities = _activity_keys(course.get("activities"))
+        for key, activity in new_activities.items():
+            before = old_activities.get(key)
+            label = _activity_label(key)
+            if before is None:
+                changes.append({**base, "kind": "activity_added", "activity": label, "new": activity.get("score", "")})
+                continue
+            for field in ACTIVITY_FIELDS:
+                if (before.get(field) or "") != (activity.get(field) or ""):
+                    changes.append({**base, "kind": "activity", "activity": label, "field": field,
+                                    "old": before.get(field, ""), "new": activity.get(field, "")})
+        for key in old_activities.keys() - new_activities.keys():
+            changes.append({**base, "kind": "activity_removed", "activity": _activity_label(key)})
+
+    for code in old_courses.keys() - new_courses.keys():
+        changes.append({"course": code, "name": old_courses[code].get("name", ""), "kind": "course_removed"})
+
+    return changes
+
+
+def format_change(change: Dict[str, Any]) -> str:
+    """Değişikliği tek satırlık konsol metnine çevir"""
+    prefix = f"[bold]{change['course']}[/bold] {change['name']}"
+    kind = change["kind"]
+
+    if kind == "course_added":
+        return f"➕ {prefix}: yeni ders"
+    if kind == "course_removed":
+        return f"➖ {prefix}: ders listeden çıktı"
+    if kind == "activity_added":
+        return f"➕ {prefix} · {change['activity']}: {change['new'] or '—'}"
+    if kind == "activity_removed":
+        return f"➖ {prefix} · {change['activity']} kaldırıldı"
+
+    label = COURSE_FIELDS.get(change["field"], change["field"]) if kind == "field" else \
+        f"{change['activity']} ({change['field']})"
+    return f"📈 {prefix} · {label}: [dim]{change['old'] or '—'}[/dim] → [green]{change['new'] or '—'}[/green]"
+
+
+class GradeWatcher:
+    """Güncel dönemi geri çekilmeli (backoff) aralıklarla yoklayan izleyici
+
+    refresh_fn(current_data) sunucudaki güncel dönemi (dönem listesinin ilk seçeneği) tazeleyip
+    (güncel dönem anahtarı, birleştirilmiş tüm veri) döndürmeli ve veriyi kullanıcı dosyasına
+    kaydetmelidir; veri load_user_data biçimindedir.
+    """
+
+    def __init__(self, username: str,
+                 refresh_fn: Callable[[Dict[str, Any]], Tuple[Optional[str], Optional[Dict[str, Any]]]],
+                 cached_data: Dict[str, Any], interval: float = WATCH_INTERVAL,
+                 max_interval: float = WATCH_MAX_INTERVAL, backoff: float = WATCH_BACKOFF,
+                 jsonl_path: Optional[Path] = None):
+        self.username = username
+        self.refresh_fn = refresh_fn
+        self.cached_data = cached_data or {}
+        # İlk yoklamaya kadar önbellekteki ilk dönem; sonra sunucunun bildirdiği güncel dönem
+        self.semester_key: Optional[str] = next(iter(self.cached_data), None)
+        self.base_interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = interval
+        self.polls = 0
+        self.total_changes = 0
+
+        if jsonl_path is None:
+            username_hash = hashlib.md5(username.encode()).hexdigest()[:12]
+            jsonl_path = Path(DATA_DIR) / f"watch_{username_hash}.jsonl"
+        self.jsonl_path = Path(jsonl_path)
+
+    def _emit(self, semester_key: str, changes: List[Dict[str, Any]]):
+        """Değişiklikleri konsola ve JSON satırları dosyasına yaz"""
+        semester_name = self.cached_data.get(semester_key, {}).get("semester_name", semester_key)
+        console.print(f"[yellow]🔔 {semester_name}: {len(changes)} değişiklik[/yellow]")
+        for change in changes:
+            console.print(f"   {format_change(change)}")
+
+        try:
+            self.jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.jsonl_path, 'a', encoding='utf-8') as f:
+                for change in changes:
+                    f.write(json.dumps({"at": time.time(), "semester": semester_key, **change},
+                                       ensure_ascii=False) + "\n")
+        except OSError as e:
+            internal_progress(f"Değişiklik günlüğü yazılamadı: {e}")
+
+    def poll_once(self) -> List[Dict[str, Any]]:
+        """Güncel dönemi bir kez tazele ve değişiklikleri döndür"""
+        self.polls += 1
+        semester_key, fresh = self.refresh_fn(self.cached_data)
+        if not fresh or semester_key is None:
+            raise KOUException("Güncel dönem alınamadı")
+
+        if semester_key != self.semester_key:
+            user_message(f"📅 Güncel dönem değişti ({self.semester_key or '—'} → {semester_key}), takip yeni döneme taşındı")
+            self.semester_key = semester_key
+
+        changes = diff_semester(self.cached_data.get(semester_key), fresh.get(semester_key))
+        self.cached_data = fresh
+        if changes:
+            self.total_changes += len(changes)
+            self._emit(semester_key, changes)
+        return changes
+
+    def _next_interval(self, changed: bool) -> float:
+        """Değişiklik varsa temel aralığa dön, yoksa aralığı üst sınıra kadar büyüt"""
+        if changed:
+            self.interval = self.base_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+        return self.interval
+
+    def run(self, max_polls: Optional[int] = None):
+        """Ctrl+C veya max_polls'a kadar yokla"""
+        user_message(f"👀 Not takibi başladı ({self.base_interval:.0f}s aralıkla, değişiklik yoksa "
+                     f"{self.max_interval:.0f}s'ye kadar seyrekleşir). Durdurmak için Ctrl+C")
+
+        try:
+            while max_polls is None or self.polls < max_polls:
+                try:
+                    changed = bool(self.poll_once())
+                    if not changed:
+                        internal_progress("Değişiklik yok")
+                except SessionExpiredError:
+                    user_error("Oturum sona erdi, takip durduruldu")
+                    break
+                except KOUException as e:
+                    user_warning(f"Yoklama başarısız: {e}")
+                    changed = False
+
+                if max_polls is not None and self.polls >= max_polls:
+                    break
+
+                wait = self._next_interval(changed)
+                console.print(f"[dim]⏳ Sonraki kontrol {wait:.0f}s sonra ({time.strftime('%H:%M:%S')})[/dim]")
+                time.sleep(wait)
+        except KeyboardInterrupt:
+            console.print()
+
+        user_message(f"Not takibi bitti: {self.polls} kontrol, {self.total_changes} değişiklik")
+        return self.cached_data
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - Çevrimdışı HTML Ayrıştırıcı
+Not tablosu ve ders detay HTML'ini tarayıcı olmadan CourseInfo/CourseActivity nesnelerine dönüştürür
+"""
+
+import re
+import sys
+import json
+from typing import Dict, Any, List, Optional
+
+from lxml import html as lxml_html
+
+from utils import clean_text
+from models import CourseInfo, CourseActivity
+
+
+# _load_semester_grades_fast içindeki CSS seçicilerinin XPath karşılıkları (aynı öncelik sırası)
+TABLE_XPATHS = [
+    "//table[contains(concat(' ', normalize-space(@class), ' '), ' table ')"
+    " and contains(concat(' ', normalize-space(@class), ' '), ' table-condensed ')]",
+    "//table[@border='1']",
+    "//div[@id='AlinanDersler']//table",
+    "//table"
+]
+
+INSTRUCTOR_LABEL = "Dersin Öğretim Elemanı:"
+SEMESTER_AVERAGE_PATTERN = re.compile(r'(?:Yarıyıl|Dönem)\s+(?:İçi\s+)?Ortalaması?\s*:?\s*([\d.,]+)', re.IGNORECASE)
+
+
+def _has_class(class_name: str) -> str:
+    """Sınıf adı için XPath koşulu üret"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def is_login_page(body: str) -> bool:
+    """Oturum düştüğünde dönen giriş formunu algıla"""
+    return 'id="OgrNo"' in body and 'id="Sifre"' in body
+
+
+def parse_semester_options(page_html: str) -> List[Dict[str, str]]:
+    """Donem açılır menüsündeki dönemleri ayrıştır"""
+    # Boş yanıtta lxml ParserError fırlatır; diğer ayrıştırıcılar gibi boş sonuç döner
+    if not page_html or not page_html.strip():
+        return []
+
+    document = lxml_html.fromstring(page_html)
+    semesters = []
+
+    for option in document.xpath("//select[@id='Donem']/option"):
+        value = option.get("value")
+        text = option.text_content().strip()
+        if value and text:
+            semesters.append({"value": value, "text": text})
+
+    return semesters
+
+
+def parse_selected_semester(page_html: str) -> Optional[str]:
+    """Sayfadaki Donem menüsünde seçili dönem (seçili seçenek yoksa tarayıcı gibi ilk seçenek)"""
+    if not page_html or not page_html.strip():
+        return None
+
+    document = lxml_html.fromstring(page_html)
+    options = document.xpath("//select[@id='Donem']/option")
+    if not options:
+        return None
+
+    selected = [option for option in options if option.get("selected") is not None]
+    return (selected[0] if selected else options[0]).get("value")
+
+
+def has_detail_markup(fragment_html: str) -> bool:
+    """Parça ders detay modalı içeriği mi (modal gövdesi, öğretim elemanı başlığı veya aktivite satırı)"""
+    if not fragment_html or not fragment_html.strip():
+        return False
+
+    document = lxml_html.fromstring(fragment_html)
+    return bool(
+        document.xpath("//*[@id='ModalBody']")
+        or document.xpath(f"//h4[{_has_class('alert-info')}]")
+        or document.xpath(f"//div[{_has_class('bg-warning')}]")
+    )
+
+
+def parse_grade_table(page_html: str) -> List[CourseInfo]:
+    """Not tablosunu _fast_table_parse ile aynı sütun eşlemesiyle ayrıştır"""
+    if not page_html or not page_html.strip():
+        return []
+
+    document = lxml_html.fromstring(page_html)
+
+    table = None
+    for xpath in TABLE_XPATHS:
+        for candidate in document.xpath(xpath):
+            if len(candidate.xpath(".//tr")) > 1:
+                table = candidate
+                break
+        if table is not None:
+            break
+
+    if table is None:
+        return []
+
+    courses = []
+    for row in table.xpath(".//tr")[1:]:
+        cells = row.xpath(".//td")
+        if len(cells) < 11:
+            continue
+
+        texts = [cell.text_content().strip() for cell in cells[:11]]
+        links = cells[2].xpath(".//a")
+        detail_params = links[0].get("name", "") if links else ""
+
+        course = CourseInfo(
+            sequence=clean_text(texts[0]),
+            code=clean_text(texts[1]),
+            name=clean_text(texts[2].split('\n')[0]),
+            attendance=clean_text(texts[3]),
+            language=clean_text(texts[4]),
+            ects=clean_text(texts[5]),
+            yio=clean_text(texts[6]),
+            yys=clean_text(texts[7]),
+            but=clean_text(texts[8]),
+            bn=clean_text(texts[9]),
+            bd=clean_text(texts[10]),
+            detail_params=detail_params or ""
+        )
+
+        if course.code and course.name:
+            courses.append(course)
+
+    return courses
+
+
+def parse_course_details(fragment_html: str) -> Dict[str, Any]:
+    """Ders detay modalını _quick_extract_course_details ile aynı yapıda ayrıştır"""
+    details = {
+        "instructor": "",
+        "activities": [],
+        "semester_average": ""
+    }
+
+    if not fragment_html or not fragment_html.strip():
+        return details
+
+    document = lxml_html.fromstring(fragment_html)
+    modal_bodies = document.xpath("//*[@id='ModalBody']")
+    root = modal_bodies[0] if modal_bodies else document
+
+    # Öğretim elemanı
+    for header in root.xpath(f".//h4[{_has_class('alert')} and {_has_class('alert-info')}]"):
+        instructor_text = header.text_content()
+        if INSTRUCTOR_LABEL in instructor_text:
+            details["instructor"] = clean_text(instructor_text.replace(INSTRUCTOR_LABEL, ""))
+        break
+
+    # Aktiviteler
+    for row in root.xpath(f".//div[{_has_class('bg-warning')}]"):
+        columns = row.xpath(".//div[contains(@class, 'col-lg-')]")
+        if len(columns) >= 6:
+            details["activities"].append(CourseActivity(
+                activity_type=clean_text(columns[0].text_content()),
+                score=clean_text(columns[1].text_content()),
+                percentage=clean_text(columns[3].text_content()),
+                semester_effect=clean_text(columns[5].text_content())
+            ))
+
+    # Yarıyıl ortalaması
+    match = SEMESTER_AVERAGE_PATTERN.search(clean_text(root.text_content()))
+    if match:
+        details["semester_average"] = match.group(1)
+
+    return details
+
+
+def main():
+    """Kaydedilmiş bir HTML dosyasını ayrıştırıp JSON olarak yazdır (fikstür kontrolü için)"""
+    if len(sys.argv) != 3 or sys.argv[1] not in ("table", "detail"):
+        print("Kullanım: python html_parser.py table|detail <dosya.html>")
+        sys.exit(1)
+
+    with open(sys.argv[2], 'r', encoding='utf-8') as f:
+        page_html = f.read()
+
+    if sys.argv[1] == "table":
+        result = [course.to_dict() for course in parse_grade_table(page_html)]
+    else:
+        details = parse_course_details(page_html)
+        details["activities"] = [vars(activity) for activity in details["activities"]]
+        result = details
+
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
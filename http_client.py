@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - Tarayıcısız HTTP Arka Ucu
+reCAPTCHA girişinden sonra Selenium çerezleriyle sayfaları doğrudan HTTP üzerinden çeker
+"""
+
+from typing import Dict, Any, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import (
+    USER_AGENT, DEFAULT_TIMEOUT, MAIN_PAGE_URL, GRADES_PAGE_URL,
+    SEMESTER_GRADES_URL, COURSE_DETAIL_URL, HTTP_POOL_SIZE
+)
+from exceptions import NetworkError, TimeoutError, ServerError, SessionExpiredError, ParseError
+from logger import internal_progress
+from models import CourseInfo
+from html_parser import (
+    parse_semester_options, parse_selected_semester, parse_grade_table, parse_course_details,
+    has_detail_markup, is_login_page
+)
+from rate_governor import RateGovernor, get_governor
+
+
+class KOUHttpClient:
+    """Selenium oturum çerezleriyle çalışan keep-alive HTTP istemcisi"""
+
+    def __init__(self, cookies: List[Dict[str, Any]], timeout: int = DEFAULT_TIMEOUT,
+                 governor: Optional[RateGovernor] = None):
+        self.timeout = timeout
+        self.governor = governor or get_governor()
+        self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": USER_AGENT,
+            "Referer": MAIN_PAGE_URL,
+            "Connection": "keep-alive"
+        })
+
+        # Aynı sunucuya tekrarlanan istekler için bağlantı havuzu
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        for cookie in cookies:
+            try:
+                self.session.cookies.set(
+                    cookie["name"],
+                    cookie["value"],
+                    domain=cookie.get("domain"),
+                    path=cookie.get("path", "/")
+                )
+            except (KeyError, TypeError):
+                continue
+
+    @classmethod
+    def from_session_manager(cls, session_manager, fallback_driver=None) -> "KOUHttpClient":
+        """SessionManager'ın kaydettiği çerezlerle istemci oluştur"""
+        cookies = session_manager.get_saved_cookies() if session_manager else None
+        if not cookies and fallback_driver is not None:
+            cookies = fallback_driver.get_cookies()
+        if not cookies:
+            raise SessionExpiredError("HTTP arka ucu için kaydedilmiş oturum çerezi bulunamadı")
+        return cls(cookies)
+
+    def _get(self, url: str, timeout: Optional[float] = None, label: str = "navigation") -> str:
+        """GET isteğini hız düzenleyici üzerinden gönder (yük hatalarında geri çekilip yeniden dener)"""
+        return self.governor.call(label, self._fetch, url, timeout)
+
+    def _fetch(self, url: str, timeout: Optional[float] = None) -> str:
+        """GET isteği gönder ve gövdeyi döndür"""
+        try:
+            response = self.session.get(url, timeout=timeout or self.timeout)
+        except requests.exceptions.Timeout as e:
+            raise TimeoutError(f"İstek zaman aşımına uğradı: {url}") from e
+        except requests.exceptions.RequestException as e:
+            raise NetworkError(f"HTTP isteği başarısız: {e}") from e
+
+        if response.status_code >= 400:
+            raise ServerError(f"Sunucu hatası: {url}", response.status_code)
+
+        # Oturum düştüyse sunucu giriş formuna yönlendirir
+        body = response.text
+        if is_login_page(body):
+            raise SessionExpiredError()
+
+        return body
+
+    def fetch_grades_page(self) -> str:
+        """Yarıyıl Not Durumu sayfasını çek"""
+        page_html = self._get(GRADES_PAGE_URL)
+        if 'id="Donem"' not in page_html and "id='Donem'" not in page_html:
+            raise ParseError("Not sayfasında dönem listesi bulunamadı")
+        return page_html
+
+    def get_semesters(self, grades_page_html: Optional[str] = None) -> List[Dict[str, str]]:
+        """Kullanılabilir dönemleri al"""
+        if grades_page_html is None:
+            grades_page_html = self.fetch_grades_page()
+        return parse_semester_options(grades_page_html)
+
+    def fetch_semester_page(self, semester_value: str) -> str:
+        """Bir dönemin not tablosu sayfasını çek
+
+        Sunucu Donem parametresini yok sayıp güncel dönemi döndürürse sessizce yanlış dönem
+        kaydedilmesin diye sayfadaki seçili dönem doğrulanır; uyuşmazlıkta ParseError
+        fırlatılır ve toplayıcı tarayıcıya döner.
+        """
+        page_html = self._get(SEMESTER_GRADES_URL.format(semester=semester_value), label="semester_switch")
+        selected = parse_selected_semester(page_html)
+        if selected != semester_value:
+            raise ParseError(f"Dönem sayfası istenen dönemi göstermiyor (istenen {semester_value}, gelen {selected})")
+        return page_html
+
+    def get_semester_courses(self, semester_value: str) -> List[CourseInfo]:
+        """Bir dönemin not tablosunu çek ve ayrıştır"""
+        return parse_grade_table(self.fetch_semester_page(semester_value))
+
+    def get_course_details(self, detail_params: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Ders detay parçasını çek ve ayrıştır (iş parçacıkları arasında paylaşılabilir)"""
+        fragment_html = self._get(COURSE_DETAIL_URL.format(params=detail_params), timeout=timeout, label="detail")
+        if not has_detail_markup(fragment_html):
+            raise ParseError(f"Ders detay yanıtında detay içeriği yok: {detail_params}")
+        return parse_course_details(fragment_html)
+
+    def close(self):
+        """Bağlantı havuzunu kapat"""
+        try:
+            self.session.close()
+            internal_progress("HTTP oturumu kapatıldı")
+        except:
+            pass
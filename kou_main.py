@@ -5,7 +5,8 @@ Anında çevrimdışı erişimle hız için optimize edilmiştir
 """
 
 import time
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
 from rich.console import Console
@@ -16,7 +17,7 @@ from rich.columns import Columns
 from rich.text import Text
 
 # Optimize edilmiş modülleri içe aktar
-from config import DATA_DIR
+from config import DATA_DIR, INCREMENTAL_REFRESH, WARM_COLLECTOR_IDLE_TIMEOUT
 from logger import user_message, user_success, user_error, user_warning, internal_progress, console
 from utils import (
     load_user_data, 
@@ -25,9 +26,11 @@ from utils import (
     get_user_data_info,
     clear_user_data,
     format_file_size,
+    semester_summaries,
     format_time_ago
 )
-from main_with_session import KOUDataCollector, LoginCredentials
+from models import LoginCredentials
+from exceptions import KOUException
 
 __version__ = '6.1.4'
 
@@ -40,6 +43,11 @@ class KOUManager:
         self.cached_data = None
         self.data_info = None
         
+        # Yenilemeler arasında açık tutulan, girişi yapılmış toplayıcı
+        self._collector = None
+        self._collector_timer = None
+        self._collector_lock = threading.Lock()
+        
     def show_banner(self):
         """Optimize edilmiş uygulama banner'ını görüntüle"""
         banner = f"""
@@ -76,12 +84,16 @@ class KOUManager:
             size_str = format_file_size(self.data_info["file_size"])
             time_str = format_time_ago(self.data_info.get("last_updated"))
             
+            # Dönem bazlı sayılar veri dizininden gelir (veri dosyası okunmaz)
+            semesters = self.data_info.get("semesters") or []
+            current_line = f"\n• Güncel dönem: {semesters[0]['name']} ({semesters[0]['courses']} ders)" if semesters else ""
+            
             # Önbellek bilgisini göster
             cache_info = f"""
 [green]📂 Önbellek Bilgisi[/green]
 • Boyut: {size_str}
 • Dönem sayısı: {self.data_info.get('total_semesters', '—')}
-• Ders sayısı: {self.data_info.get('total_courses', '—')}
+• Ders sayısı: {self.data_info.get('total_courses', '—')}{current_line}
 • Son güncelleme: {time_str}
 """
             console.print(Panel(cache_info, border_style="green", title="[green]Veriler Mevcut[/green]"))
@@ -102,33 +114,40 @@ class KOUManager:
         
         if self.cached_data:
             semester_count = len(self.cached_data)
-            course_count = sum(len(sem_data.get("courses", [])) for sem_data in self.cached_data.values())
+            course_count = sum(summary["courses"] for summary in semester_summaries(self.cached_data))
             
             user_success(f"⚡ Veriler yüklendi: {semester_count} dönem, {course_count} ders ({load_time:.3f}s)")
             return True
         
         return False
 
-    def collect_fresh_data(self, existing_credentials=None) -> bool:
-        """İlerleme takibiyle taze veri toplama"""
+    def collect_fresh_data(self, existing_credentials=None, full_refresh: bool = False) -> bool:
+        """İlerleme takibiyle taze veri toplama (önbellek varsa varsayılan olarak artımlı)"""
         try:
-            # Eğer kimlik bilgileri önceden alınmışsa tekrar istemiyoruz
-            if existing_credentials:
-                credentials = existing_credentials
-            else:
-                credentials = self.get_credentials()
+            # Arka planda oturumu açık bir toplayıcı servisi varsa tarayıcı açılmaz
+            refreshed = self._refresh_via_daemon(full_refresh)
+            if refreshed is not None:
+                return refreshed
             
-            # Veri toplayıcıyı başlat
-            collector = KOUDataCollector(headless=False)
+            collector = self._reuse_warm_collector()
             
-            try:
-                # Oturum yönetimiyle giriş yap
-                if not collector.login_with_session(credentials):
+            if collector is None:
+                # Eğer kimlik bilgileri önceden alınmışsa tekrar istemiyoruz
+                if existing_credentials:
+                    credentials = existing_credentials
+                else:
+                    credentials = self.get_credentials()
+                
+                collector = self._new_collector(credentials, login_attempts=1)
+                if collector is None:
                     user_error("Giriş başarısız!")
                     return False
-                
+            
+            completed = False
+            try:
                 # İlerlemeyle tüm dönem verilerini topla
-                all_data = collector.collect_all_semester_data()
+                all_data = collector.collect_all_semester_data(self._incremental_base(full_refresh))
+                completed = True
                 
                 if all_data:
                     # Performans takibiyle kaydet
@@ -146,12 +165,147 @@ class KOUManager:
                     return False
                     
             finally:
-                collector.close()
+                self._release_collector(collector, keep=completed)
                 
         except Exception as e:
             user_error(f"Veri toplama hatası: {e}")
             return False
 
+    def watch_grades(self) -> bool:
+        """Güncel dönemi düzenli aralıklarla yokla ve yalnızca değişen notları göster"""
+        if not self.cached_data:
+            user_error("Takip için önce verileri toplayın!")
+            return False
+        
+        from grade_watch import GradeWatcher
+        from collector_daemon import running_daemon_for
+        
+        client = running_daemon_for(self.username)
+        collector = None
+        
+        if client is not None:
+            user_message("🔌 Toplayıcı servisi üzerinden takip ediliyor...")
+            
+            def refresh(current: Dict[str, Any]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+                result = client.refresh(current=True, fresh_details=True)
+                return result.get("current_semester"), load_user_data(self.username, DATA_DIR)
+        else:
+            collector = self._reuse_warm_collector()
+            if collector is None:
+                import getpass
+                password = getpass.getpass("Parola: ")
+                collector = self._new_collector(LoginCredentials(self.username, password), login_attempts=2)
+                if collector is None:
+                    user_error("Giriş başarısız! Takip başlatılamadı.")
+                    return False
+            
+            def refresh(current: Dict[str, Any]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+                data = collector.collect_all_semester_data(current, current_only=True, refresh_details=True)
+                if data and not save_user_data(self.username, data, DATA_DIR):
+                    user_warning("Takip verisi kaydedilemedi")
+                return collector.current_semester, data
+        
+        completed = False
+        try:
+            self.cached_data = GradeWatcher(self.username, refresh, self.cached_data).run()
+            completed = True
+        finally:
+            if collector is not None:
+                self._release_collector(collector, keep=completed)
+        return True
+
+    def _refresh_via_daemon(self, full_refresh: bool) -> Optional[bool]:
+        """Çalışan toplayıcı servisi varsa yenilemeyi ona yaptır; servis yoksa None döndür"""
+        from collector_daemon import running_daemon_for
+        
+        client = running_daemon_for(self.username)
+        if client is None:
+            return None
+        
+        user_message("🔌 Toplayıcı servisi bulundu, yenileme servise gönderildi...")
+        try:
+            result = client.refresh(full=full_refresh)
+        except KOUException as e:
+            user_warning(f"Servis yenilemesi başarısız ({e}), yerel toplayıcıya geçiliyor...")
+            return None
+        
+        # Servis verileri aynı kullanıcı dosyasına yazar
+        self.cached_data = load_user_data(self.username, DATA_DIR)
+        user_success(f"Servis {result['semesters']} dönem, {result['courses']} ders güncelledi ({result['duration']}s)")
+        return self.cached_data is not None
+
+    def _new_collector(self, credentials: LoginCredentials, login_attempts: int = 1):
+        """Yeni toplayıcı oluştur ve giriş yap; başarısızsa kapatıp None döndür"""
+        # Selenium yığını yalnızca burada yüklenir
+        from main_with_session import KOUDataCollector
+        collector = KOUDataCollector(headless=False)
+        
+        for attempt in range(login_attempts):
+            if collector.login_with_session(credentials):
+                return collector
+            if attempt < login_attempts - 1:
+                user_warning("Giriş başarısız, tekrar deneniyor...")
+                time.sleep(1)
+        
+        collector.close()
+        return None
+
+    def _reuse_warm_collector(self):
+        """Açık tutulan toplayıcı sağlıklıysa döndür; ölmüşse kapatıp None döndür"""
+        with self._collector_lock:
+            self._cancel_idle_timer()
+            collector, self._collector = self._collector, None
+        
+        if collector is None:
+            return None
+        
+        if collector.username == self.username and collector.health_check():
+            user_message("⚡ Açık oturum yeniden kullanılıyor...")
+            return collector
+        
+        internal_progress("Açık tutulan tarayıcı kullanılamıyor, yenisi başlatılacak")
+        collector.close()
+        return None
+
+    def _release_collector(self, collector, keep: bool):
+        """Toplayıcıyı boşta zaman aşımıyla sıcak tut veya kapat"""
+        if not keep or WARM_COLLECTOR_IDLE_TIMEOUT <= 0:
+            collector.close()
+            return
+        
+        with self._collector_lock:
+            self._collector = collector
+            self._collector_timer = threading.Timer(WARM_COLLECTOR_IDLE_TIMEOUT, self._idle_shutdown)
+            self._collector_timer.daemon = True
+            self._collector_timer.start()
+        internal_progress(f"Oturum {WARM_COLLECTOR_IDLE_TIMEOUT}s boyunca açık tutulacak")
+
+    def _cancel_idle_timer(self):
+        if self._collector_timer:
+            self._collector_timer.cancel()
+            self._collector_timer = None
+
+    def _idle_shutdown(self):
+        """Boşta zaman aşımı dolunca sıcak toplayıcıyı kapat"""
+        with self._collector_lock:
+            collector, self._collector, self._collector_timer = self._collector, None, None
+        if collector:
+            collector.close()
+
+    def shutdown(self):
+        """Uygulamadan çıkarken açık tarayıcıyı kapat"""
+        with self._collector_lock:
+            self._cancel_idle_timer()
+            collector, self._collector = self._collector, None
+        if collector:
+            collector.close()
+
+    def _incremental_base(self, full_refresh: bool) -> Optional[Dict[str, Any]]:
+        """Artımlı toplama için mevcut önbellek verisini döndür (tam yenilemede None)"""
+        if full_refresh or not INCREMENTAL_REFRESH:
+            return None
+        return self.cached_data or None
+
     def update_data(self) -> bool:
         """Önbelleğe alınmış verileri sunucudan gelen taze verilerle güncelle"""
         try:
@@ -174,36 +328,39 @@ class KOUManager:
                 user_message("Güncelleme iptal edildi.")
                 return False
             
-            # Kullanıcı adı zaten kayıtlı, sadece parola isteyelim
-            import getpass
-            password = getpass.getpass("Parola: ")
-            credentials = LoginCredentials(self.username, password)
+            # Varsayılan artımlı güncelleme; bitmiş dönemler dahil tam yenileme isteğe bağlı
+            full_refresh = not INCREMENTAL_REFRESH or Confirm.ask(
+                "[cyan]Bitmiş dönemler dahil tüm dönemler yeniden toplansın mı?[/cyan]",
+                default=False
+            )
+            
+            # Arka planda oturumu açık bir toplayıcı servisi varsa tarayıcı açılmaz
+            refreshed = self._refresh_via_daemon(full_refresh)
+            if refreshed is not None:
+                return refreshed
+            
+            # Açık oturum varsa parola sorulmadan hemen toplanır
+            collector = self._reuse_warm_collector()
+            
+            if collector is None:
+                # Kullanıcı adı zaten kayıtlı, sadece parola isteyelim
+                import getpass
+                password = getpass.getpass("Parola: ")
+                credentials = LoginCredentials(self.username, password)
             
             user_message("🔄 Veriler sunucudan güncelleniyor...")
             
-            # Veri toplayıcıyı başlat
-            collector = KOUDataCollector(headless=False)
+            if collector is None:
+                collector = self._new_collector(credentials, login_attempts=2)
+                if collector is None:
+                    user_error("Giriş başarısız! Güncelleme yapılamadı.")
+                    return False
             
+            completed = False
             try:
-                # Oturum yönetimiyle giriş yap
-                login_attempts = 2
-                login_success = False
-                
-                for attempt in range(login_attempts):
-                    if collector.login_with_session(credentials):
-                        login_success = True
-                        break
-                    elif attempt < login_attempts - 1:
-                        user_warning("Giriş başarısız, tekrar deneniyor...")
-                        time.sleep(1)
-                    else:
-                        user_error("Giriş başarısız! Güncelleme yapılamadı.")
-                
-                if not login_success:
-                    return False
-                
                 # Taze veri topla
-                all_data = collector.collect_all_semester_data()
+                all_data = collector.collect_all_semester_data(self._incremental_base(full_refresh))
+                completed = True
                 
                 if all_data:
                     # Güncellenmiş verileri kaydet
@@ -234,7 +391,7 @@ class KOUManager:
                     return False
                     
             finally:
-                collector.close()
+                self._release_collector(collector, keep=completed)
                 
         except Exception as e:
             user_error(f"Veri güncelleme hatası: {e}")
@@ -246,7 +403,8 @@ class KOUManager:
             "[green]1.[/green] 📊 Güncel dönem notları",
             "[green]2.[/green] 📅 Dönem seçimi",
             "[green]3.[/green] 🔄 Verileri güncelle",
-            "[green]4.[/green] ❌ Çıkış"
+            "[green]4.[/green] 👀 Not takibi (yalnızca değişiklikler)",
+            "[green]5.[/green] ❌ Çıkış"
         ]
         
         # Önbellek durum bilgisini ekle
@@ -276,15 +434,11 @@ class KOUManager:
             user_error("Veri yüklü değil!")
             return None
         
-        semesters = []
-        for key, data in self.cached_data.items():
-            semester_name = data.get("semester_name", key)
-            course_count = len(data.get("courses", []))
-            semesters.append({
-                "key": key,
-                "name": semester_name,
-                "course_count": course_count
-            })
+        # Seçim yalnızca dönem özetlerini kullanır; seçilen dönem gösterilirken çözülür
+        semesters = [
+            {"key": summary["key"], "name": summary["name"], "course_count": summary["courses"]}
+            for summary in semester_summaries(self.cached_data)
+        ]
         
         # Seçim menüsünü göster
         console.print("\n[cyan]📅 Dönem Seçimi[/cyan]")
@@ -417,7 +571,7 @@ class KOUManager:
                 
                 choice = Prompt.ask(
                     "[cyan]Seçiminizi yapın[/cyan]",
-                    choices=["1", "2", "3", "4"],
+                    choices=["1", "2", "3", "4", "5"],
                     default="1"
                 )
                 
@@ -450,6 +604,11 @@ class KOUManager:
                         user_error("Veri güncellemesi başarısız!")
                 
                 elif choice == "4":
+                    # Güncel dönemi izle
+                    self.watch_grades()
+                    self.data_info = get_user_data_info(self.username, DATA_DIR)
+                
+                elif choice == "5":
                     # Çıkış
                     if Confirm.ask("\n[yellow]Çıkmak istediğinizden emin misiniz?[/yellow]"):
                         console.print("[green]Görüşmek üzere! 👋[/green]")
@@ -506,6 +665,8 @@ class KOUManager:
             console.print("\n[yellow]İptal edildi.[/yellow]")
         except Exception as e:
             user_error(f"Uygulama hatası: {e}")
+        finally:
+            self.shutdown()
 
 
 def main():
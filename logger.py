@@ -4,6 +4,7 @@ KOU Not Bilgi Sistemi - Günlük Kaydı Modülü
 Rich konsol entegrasyonu ile merkezi günlük kayıt sistemi
 """
 
+import os
 import logging
 from rich.console import Console
 from rich.logging import RichHandler
@@ -13,6 +14,20 @@ from config import LOG_LEVEL, LOG_FILE, PRODUCTION_MODE, SHOW_USER_LOGS
 # Güzel günlük kaydı için Rich konsolu
 console = Console()
 
+
+class LazyFileHandler(logging.FileHandler):
+    """Dosyayı ve dizinini ilk kayıtta oluşturan dosya işleyicisi
+
+    Çevrimdışı modda hiç günlük yazılmazsa diske dokunulmaz.
+    """
+    
+    def __init__(self, filename, encoding: str = 'utf-8'):
+        super().__init__(filename, encoding=encoding, delay=True)
+    
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
 class KOULogger:
     """Üretim/geliştirme modları ile merkezi günlük kayıt sistemi"""
     
@@ -40,7 +55,7 @@ class KOULogger:
         
         # Kalıcı günlük kaydı için dosya işleyicisi
         if LOG_FILE:
-            file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
+            file_handler = LazyFileHandler(LOG_FILE)
             file_handler.setLevel(logging.DEBUG)
             
             file_formatter = logging.Formatter(
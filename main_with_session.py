@@ -14,8 +14,8 @@ warnings.filterwarnings('ignore')
 import time
 import json
 import concurrent.futures
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, asdict
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Callable
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -25,7 +25,6 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException, StaleElementReferenceException
-from webdriver_manager.chrome import ChromeDriverManager
 
 from rich.console import Console
 from rich.table import Table
@@ -33,76 +32,104 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 
 # Modülleri içe aktar
-from config import BASE_URL, MAIN_PAGE_URL, CHROME_OPTIONS, USER_AGENT, DEFAULT_TIMEOUT, PAGE_LOAD_TIMEOUT, DATA_DIR
-from logger import internal_progress, user_message, user_success, user_error, console
+from config import (
+    BASE_URL, MAIN_PAGE_URL, CHROME_OPTIONS, USER_AGENT, DEFAULT_TIMEOUT, PAGE_LOAD_TIMEOUT, DATA_DIR, COLLECTION_BACKEND,
+    DETAIL_MAX_WORKERS, DETAIL_WORKER_TIMEOUT, DETAIL_STRATEGY, COURSE_DETAIL_URL, TABLE_PARSE_MODE, CHROME_BINARY,
+    HEADLESS_HANDOFF, BLOCKED_RESOURCE_CATEGORIES, CHECKPOINT_ENABLED, CHECKPOINT_MAX_AGE
+)
+from logger import internal_progress, user_message, user_success, user_error, user_warning, console
+from exceptions import KOUException, SessionExpiredError, ParseError
 from session_manager import SessionManager
-from utils import clean_text
+from utils import (
+    clean_text, select_semesters_to_refresh, merge_semester_data, is_semester_finalized,
+    append_checkpoint, load_checkpoint, checkpoint_plan
+)
+from detail_cache import DetailCache
+from models import LoginCredentials, CourseActivity, CourseInfo
+from html_parser import parse_grade_table, parse_course_details, is_login_page, has_detail_markup, INSTRUCTOR_LABEL, SEMESTER_AVERAGE_PATTERN
+from wait_engine import PageWaiter
+from resource_blocker import ResourceBlocker
+from driver_resolver import resolve_chromedriver, record_startup
+from rate_governor import RateColumn, get_governor
 
 __version__ = '6.1.4'
 
-@dataclass
-class LoginCredentials:
-    """Kullanıcı giriş bilgileri"""
-    username: str
-    password: str
-
-@dataclass
-class CourseActivity:
-    """Ders aktivite bilgileri"""
-    activity_type: str
-    score: str
-    percentage: str
-    semester_effect: str
-
-@dataclass
-class CourseInfo:
-    """Tüm ders bilgileri"""
-    sequence: str
-    code: str
-    name: str
-    attendance: str
-    language: str
-    ects: str
-    yio: str
-    yys: str
-    but: str
-    bn: str
-    bd: str
-    instructor: str = ""
-    activities: List[CourseActivity] = None
-    semester_average: str = ""
-    detail_params: str = ""  # Toplu işleme için
-    
-    def __post_init__(self):
-        if self.activities is None:
-            self.activities = []
-    
-    def to_dict(self):
-        data = asdict(self)
-        # İç işleme alanını kaldır
-        if 'detail_params' in data:
-            del data['detail_params']
-        return data
-
 
 class KOUDataCollector:
     """Tüm dönem verilerini toplamak için KOU oturumu"""
     
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, backend: Optional[str] = None, detail_strategy: Optional[str] = None,
+                 handoff: Optional[bool] = None, show_progress: bool = True):
         self.driver = None
+        self.driver_headless = False
         self.username = None
         self.headless = headless
+        self.show_progress = show_progress  # Toplu toplamada kapalı: canlı gösterim iş parçacıkları arasında paylaşılamaz
+        self.handoff = HEADLESS_HANDOFF if handoff is None else handoff
+        self.backend = backend or COLLECTION_BACKEND
+        self.detail_strategy = detail_strategy or DETAIL_STRATEGY
+        self.parse_mode = TABLE_PARSE_MODE
         self.session_manager = None
-        self.detail_cache = {}  # Ders detayları için önbellek
-        self._setup_driver()
+        self.waiter = None
+        self.blocker = None
+        self.detail_cache = DetailCache()  # Ders detayları için önbellek (girişte diske bağlanır)
+        self._current_semester_key = None
+        self._refresh_details = False
+        self._current_only = False
+        self._checkpoint_plan = None
+        self.detail_client = None  # Paralel detay çekme için HTTP istemcisi
+        self._http_details_available = True
+        self.stage_timings: Dict[str, float] = {}  # Aşama başına toplam süre (kıyaslama için)
+        self.governor = get_governor()  # Sunucuya giden tüm istekler için paylaşılan hız düzenleyici
+        
+        # Devir modunda sürücü ihtiyaç anında kurulur (giriş için görünür, toplama için görünmez)
+        if not self.handoff:
+            self._ensure_driver()
+    
+    @contextmanager
+    def _timed(self, stage: str):
+        """Bir aşamanın süresini stage_timings'e ekle"""
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.stage_timings[stage] = self.stage_timings.get(stage, 0.0) + time.time() - start
+    
+    def _open_page(self, url: str, site: str):
+        """Sayfayı hız düzenleyici üzerinden aç ve hazır olmasını bekle"""
+        def load():
+            self.driver.get(url)
+            self.waiter.page_ready(site)
+            if self.waiter.last_capped:
+                self.governor.flag("sayfa zaman aşımı")
         
-    def _setup_driver(self):
+        self.governor.call("navigation", load)
+    
+    def _ensure_driver(self, headless: Optional[bool] = None):
+        """Sürücü yoksa kur; headless verilmezse toplayıcının modu kullanılır"""
+        if self.driver is None:
+            with self._timed("driver_startup"):
+                self._setup_driver(self.headless if headless is None else headless)
+        return self.driver
+    
+    def _quit_driver(self):
+        """Mevcut sürücüyü kapat ve bekleme motorunu bırak"""
+        if self.blocker:
+            self.blocker.persist()
+        driver, self.driver, self.waiter, self.blocker = self.driver, None, None, None
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        
+    def _setup_driver(self, headless: bool = False):
         """Chrome WebDriver'ı kur"""
         try:
             chrome_options = Options()
             
-            if self.headless:
-                chrome_options.add_argument('--headless')
+            if headless:
+                chrome_options.add_argument('--headless=new')
             
             # Yapılandırmadan tüm seçenekleri ekle
             for option, value in CHROME_OPTIONS.items():
@@ -119,22 +146,41 @@ class KOUDataCollector:
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
             
+            # Engelleme sayaçları performans günlüğündeki ağ olaylarından okunur
+            block_categories = self._block_categories()
+            if block_categories:
+                chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            
             # Sürücü günlüklerini bastır
             import logging
             logging.getLogger('WDM').setLevel(logging.NOTSET)
             os.environ['WDM_LOG'] = "false"
             
-            service = Service(ChromeDriverManager().install())
+            if CHROME_BINARY:
+                chrome_options.binary_location = CHROME_BINARY
+            
+            start = time.time()
+            driver_path, source = resolve_chromedriver()
+            resolve_time = time.time() - start
+            
+            service = Service(driver_path) if driver_path else Service()
             service.log_path = os.devnull
             
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.driver_headless = headless
+            startup = record_startup(source, time.time() - start)
             self.driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
             self.driver.implicitly_wait(2)  # Hız için azaltıldı
+            self.waiter = PageWaiter(self.driver)
+            self.blocker = ResourceBlocker(self.driver, block_categories) if block_categories else None
             
             # Webdriver özelliğini kaldır
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
-            internal_progress("Chrome WebDriver başlatıldı")
+            internal_progress(
+                f"Chrome WebDriver başlatıldı ({'görünmez' if headless else 'görünür'}, sürücü: {source}, çözümleme {resolve_time:.2f}s, "
+                f"soğuk {startup.get('cold', 0):.2f}s / sıcak {startup.get('warm', 0):.2f}s)"
+            )
             
         except Exception as e:
             user_error(f"WebDriver kurulumu başarısız: {e}")
@@ -142,17 +188,47 @@ class KOUDataCollector:
     
     def login_with_session(self, credentials: LoginCredentials) -> bool:
         """Oturum yönetimiyle giriş yap"""
+        with self._timed("login"):
+            logged_in = self._restore_or_login(credentials)
+        
+        # Giriş sayfası geride kaldı: tema kaynakları artık engellenebilir
+        if logged_in:
+            self._enable_resource_blocking()
+        return logged_in
+    
+    def _block_categories(self) -> List[str]:
+        """Engellenecek kaynak kategorileri (modal tıklama stratejisi görünürlük için CSS'e muhtaç)"""
+        categories = list(BLOCKED_RESOURCE_CATEGORIES)
+        if self.detail_strategy == "click" and "stylesheets" in categories:
+            categories.remove("stylesheets")
+        return categories
+    
+    def _enable_resource_blocking(self):
+        """Mevcut sürücüde kaynak engellemeyi aç"""
+        if self.driver is not None and self.blocker:
+            self.blocker.enable()
+    
+    def _restore_or_login(self, credentials: LoginCredentials) -> bool:
+        """Kaydedilmiş oturumu geri yükle, olmazsa reCAPTCHA ile giriş yap"""
         self.username = credentials.username
         self.session_manager = SessionManager(credentials.username)
+        self.detail_cache = DetailCache(credentials.username)
         
         # Önce kaydedilmiş oturumu dene
         if self.session_manager.has_valid_session():
             user_message("Kaydedilmiş oturum bulundu, yükleniyor...")
             
+            # HTTP arka ucunda oturum tarayıcı açmadan doğrulanır
+            if self.handoff and self.backend == "http" and self._verify_session_http():
+                user_success("Kaydedilmiş oturumla giriş başarılı!")
+                return True
+            
+            # Kayıtlı çerezlerle devam edilecekse reCAPTCHA gerekmez, pencere açılmaz
+            self._ensure_driver(headless=True if self.handoff else None)
+            
             try:
-                if self.session_manager.load_cookies(self.driver):
-                    self.driver.get(MAIN_PAGE_URL)
-                    time.sleep(1.5)  # Güvenilirlik için bekleme süresi artırıldı
+                if self.session_manager.has_valid_session() and self.session_manager.load_cookies(self.driver):
+                    self._open_page(MAIN_PAGE_URL, "Oturum geri yükleme")
                     
                     if self._check_login_status(credentials.username):
                         user_success("Kaydedilmiş oturumla giriş başarılı!")
@@ -161,17 +237,101 @@ class KOUDataCollector:
                         user_message("Kaydedilmiş oturum süresi dolmuş, yeniden giriş yapılıyor...")
                         # Süresi dolmuş oturumu temizle ve giriş sayfasına geri dön
                         self.session_manager.clear_session()
-                        self.driver.get(BASE_URL)  # Giriş sayfasına geri dön
-                        time.sleep(1)  # Sayfanın yüklenmesi için bekle
+                        self._open_page(BASE_URL, "Giriş sayfasına dönüş")  # Giriş sayfasına geri dön
             except Exception as e:
                 internal_progress(f"Oturum yükleme hatası: {e}")
                 user_message("Oturum bilgileri kullanılamıyor, yeni giriş yapılacak...")
                 self.session_manager.clear_session()
-                self.driver.get(BASE_URL)  # Giriş sayfasına geri dön
-                time.sleep(1)  # Sayfanın yüklenmesi için bekle
+                self._open_page(BASE_URL, "Giriş sayfasına dönüş")  # Giriş sayfasına geri dön
+        
+        # Yedek olarak normal giriş: reCAPTCHA için görünür tarayıcı gerekir
+        if self.driver is not None and self.driver_headless and not self.headless:
+            self._quit_driver()
+        self._ensure_driver()
+        
+        if not self._normal_login(credentials):
+            return False
         
-        # Yedek olarak normal giriş
-        return self._normal_login(credentials)
+        if self.handoff and not self.driver_headless:
+            self._handoff_to_headless()
+        return True
+    
+    def health_check(self) -> bool:
+        """Sıcak tutulan toplayıcının tarayıcısı ve oturumu hâlâ kullanılabilir mi"""
+        if not self.username or not self.session_manager:
+            return False
+        
+        # Tarayıcısız (HTTP) modda yalnızca oturum çerezleri doğrulanır
+        if self.driver is None:
+            return self.backend == "http" and self._verify_session_http()
+        
+        try:
+            # Ekrandaki eski sayfa yanıltmasın diye ana sayfa yeniden istenir
+            self._open_page(MAIN_PAGE_URL, "Sağlık kontrolü")
+        except WebDriverException as e:
+            internal_progress(f"Tarayıcıya ulaşılamıyor: {e}")
+            return False
+        
+        return self._check_login_status(self.username)
+    
+    def _verify_session_http(self) -> bool:
+        """Kaydedilmiş çerezlerin hâlâ geçerli olduğunu HTTP isteğiyle doğrula"""
+        from http_client import KOUHttpClient
+        
+        try:
+            client = KOUHttpClient.from_session_manager(self.session_manager)
+        except KOUException:
+            return False
+        
+        try:
+            client.fetch_grades_page()
+            return True
+        except SessionExpiredError:
+            internal_progress("Kaydedilmiş oturum sunucuda sona ermiş")
+            self.session_manager.clear_session()
+            return False
+        except KOUException as e:
+            internal_progress(f"HTTP oturum doğrulaması yapılamadı, tarayıcı deneniyor: {e}")
+            return False
+        finally:
+            client.close()
+    
+    def _start_headless_session(self, cookies: List[Dict[str, Any]]) -> bool:
+        """Görünmez sürücü başlatıp çerezleri aktar ve oturumun açık olduğunu doğrula"""
+        self._ensure_driver(headless=True)
+        SessionManager.apply_cookies(self.driver, cookies)
+        self._open_page(MAIN_PAGE_URL, "Görünmez oturum yükleme")
+        return self._check_login_status(self.username)
+    
+    def _handoff_to_headless(self):
+        """Girişten sonra görünür pencereyi kapat; toplama görünmez sürücüde veya HTTP ile sürer"""
+        cookies = self.driver.get_cookies()
+        visible, visible_waiter, visible_blocker = self.driver, self.waiter, self.blocker
+        
+        if self.backend == "http":
+            # HTTP arka ucu kaydedilmiş çerezleri kullanır; tarayıcı yalnızca geri dönüşte açılır
+            self._quit_driver()
+            user_message("Giriş tamamlandı, tarayıcı penceresi kapatıldı")
+            return
+        
+        if visible_blocker:
+            visible_blocker.persist()
+        self.driver, self.waiter, self.blocker = None, None, None
+        try:
+            if not self._start_headless_session(cookies):
+                raise SessionExpiredError("Çerezler görünmez tarayıcıda oturum açmadı")
+        except Exception as e:
+            user_warning(f"Görünmez tarayıcıya geçilemedi, görünür pencerede devam ediliyor: {e}")
+            self._quit_driver()
+            self.driver, self.waiter, self.blocker = visible, visible_waiter, visible_blocker
+            self.driver_headless = False
+            return
+        
+        try:
+            visible.quit()
+        except Exception:
+            pass
+        user_message("Giriş tamamlandı, toplama görünmez tarayıcıda sürüyor")
     
     def _check_login_status(self, username: str) -> bool:
         """Giriş yapılıp yapılmadığını kontrol et - sağlam uygulama"""
@@ -239,8 +399,7 @@ class KOUDataCollector:
                 # Giriş sayfasında olduğumuzdan emin olalım
                 current_url = self.driver.current_url
                 if BASE_URL not in current_url:
-                    self.driver.get(BASE_URL)
-                    time.sleep(1.5)  # Sayfanın yüklenmesi için bekle
+                    self._open_page(BASE_URL, "Giriş sayfası yükleme")
                 
                 # Kimlik bilgilerini gir
                 username_field = WebDriverWait(self.driver, DEFAULT_TIMEOUT).until(
@@ -268,7 +427,7 @@ class KOUDataCollector:
                         )
                         
                         # Giriş durumunu tekrar kontrol et
-                        time.sleep(1.5)  # Sayfanın stabilize olması için bir an bekle
+                        self.waiter.page_ready("Giriş sonrası sayfa")
                         if self._check_login_status(credentials.username):
                             user_success("Giriş başarılı!")
                             
@@ -278,8 +437,7 @@ class KOUDataCollector:
                             
                             # Ana sayfada olduğumuzdan emin olalım
                             if "AnaGiris.cfm" not in self.driver.current_url:
-                                self.driver.get(MAIN_PAGE_URL)
-                                time.sleep(1)  # Sayfanın yüklenmesi için bekle
+                                self._open_page(MAIN_PAGE_URL, "Ana sayfa yükleme")
                             
                             return True
                         else:
@@ -291,8 +449,7 @@ class KOUDataCollector:
                             user_error("Giriş zaman aşımına uğradı, tekrar deneniyor...")
                             # Çerezleri temizle ve tekrar dene
                             self.driver.delete_all_cookies()
-                            self.driver.get(BASE_URL)
-                            time.sleep(1)  # Sayfanın yüklenmesi için bekle
+                            self._open_page(BASE_URL, "Giriş sayfası yükleme")
                             continue
                         else:
                             user_error("Giriş zaman aşımına uğradı, lütfen daha sonra tekrar deneyin.")
@@ -305,8 +462,7 @@ class KOUDataCollector:
                 user_error(f"Giriş formu bulunamadı: {e}")
                 # Giriş formu bulunamazsa, sayfayı yenile ve tekrar dene
                 if attempt < max_retries - 1:
-                    self.driver.get(BASE_URL)
-                    time.sleep(1.5)  # Sayfanın yüklenmesi için bekle
+                    self._open_page(BASE_URL, "Giriş sayfası yükleme")
                     continue
                 return False
                 
@@ -314,56 +470,261 @@ class KOUDataCollector:
                 user_error(f"Giriş hatası: {e}")
                 if attempt < max_retries - 1:
                     user_message("Tekrar deneniyor...")
-                    self.driver.get(BASE_URL)
-                    time.sleep(1.5)  # Sayfanın yüklenmesi için bekle
+                    self._open_page(BASE_URL, "Giriş sayfası yükleme")
                     continue
                 return False
         
         return False  # Buraya ulaşırsak, tüm denemeler başarısız olmuş demektir
     
-    def collect_all_semester_data(self) -> Dict[str, List[CourseInfo]]:
-        """Tüm dönemlerden veri topla"""
-        user_message("Tüm dönem verileri toplanıyor...")
+    def collect_all_semester_data(self, existing_data: Optional[Dict[str, Any]] = None,
+                                  only_semesters: Optional[List[str]] = None,
+                                  refresh_details: bool = False, current_only: bool = False) -> Dict[str, List[CourseInfo]]:
+        """Tüm dönemlerden veri topla
+
+        existing_data verilirse artımlı yenileme yapılır: yalnızca güncel ve notları
+        tamamlanmamış dönemler toplanıp mevcut verilerle birleştirilir.
+        only_semesters verilirse yalnızca bu dönem anahtarları toplanır.
+        current_only verilirse yalnızca sunucudaki güncel dönem (dönem menüsünün ilk
+        seçeneği) toplanır; anahtarı toplamadan sonra current_semester'dadır.
+        refresh_details detay önbelleğini atlar (not takibinde yeni aktivite notları için).
+        """
+        self._refresh_details = refresh_details
+        self._current_only = current_only
+        user_message("Tüm dönem verileri toplanıyor..." if not existing_data else "Değişebilecek dönemler güncelleniyor...")
+        
+        if self.backend == "http":
+            try:
+                return self._collect_via_http(existing_data, only_semesters)
+            except KOUException as e:
+                user_warning(f"HTTP modu kullanılamadı ({e}), tarayıcı moduna geçiliyor...")
+                
+                # Devir modunda tarayıcı kapatılmış olabilir: kayıtlı çerezlerle görünmez başlat
+                if self.driver is None:
+                    cookies = self.session_manager.get_saved_cookies() if self.session_manager else None
+                    if not cookies or not self._start_headless_session(cookies):
+                        user_error("Tarayıcı moduna geçilemedi: oturum çerezi yok veya geçersiz")
+                        return {}
+                    self._enable_resource_blocking()
+        
+        with self._timed("navigation"):
+            if not self._navigate_to_grades():
+                return {}
+            
+            # Kullanılabilir dönemleri al
+            available_semesters = self._get_available_semesters()
         
-        if not self._navigate_to_grades():
+        if not available_semesters:
+            user_error("Dönem bilgileri alınamadı")
             return {}
         
-        # Kullanılabilir dönemleri al
-        semesters = self._get_available_semesters()
+        semesters = self._plan_semesters(available_semesters, existing_data, only_semesters)
         if not semesters:
-            user_error("Dönem bilgileri alınamadı")
             return {}
+        semesters, all_data = self._resume_from_checkpoint(semesters)
         
-        all_data = {}
+        # HTTP detay stratejisi sayfaya ihtiyaç duymaz: önce tüm dönem sayfaları alınır,
+        # ayrıştırma arka planda sürerken tarayıcı bir sonraki döneme geçer
+        defer_details = self.parse_mode == "page_source" and self.detail_strategy == "http"
+        deferred = []
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=console
-        ) as progress:
+        with self._create_progress() as progress, self._interrupt_notice(all_data), \
+                concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="kou-parse") as parser:
             
             main_task = progress.add_task("Dönemler işleniyor...", total=len(semesters))
             
             for semester in semesters:
                 progress.update(main_task, description=f"İşleniyor: {semester['text']}")
                 
-                courses = self._load_semester_grades_fast(semester["value"])
-                if courses:
-                    # Hız için toplu detay çıkarma
-                    self._batch_extract_details(courses, progress)
+                if self.parse_mode == "page_source":
+                    page_source = self._load_semester_page_source(semester["value"])
+                    parsed = parser.submit(self._parse_page_source, page_source) if page_source else None
+                    
+                    if defer_details:
+                        deferred.append((semester, parsed))
+                        continue
                     
-                    all_data[semester["value"]] = {
-                        "semester_name": semester["text"],
-                        "courses": [course.to_dict() for course in courses]
-                    }
+                    courses = self._resolve_parsed_courses(parsed)
+                else:
+                    courses = self._load_semester_grades_fast(semester["value"])
+                
+                # Hız için toplu detay çıkarma
+                self._store_semester(all_data, semester, courses, progress)
+                progress.update(main_task, advance=1)
+            
+            for semester, parsed in deferred:
+                progress.update(main_task, description=f"Detaylar: {semester['text']}")
+                courses = self._resolve_parsed_courses(parsed)
+                
+                # Tarayıcı son dönemde bekliyor: modal tıklamaya düşülürse önce bu dönemin sayfasına dönülür
+                self._store_semester(all_data, semester, courses, progress,
+                                     select_page=lambda value=semester["value"]: self._select_semester(value))
                 
                 progress.update(main_task, advance=1)
         
+        self.waiter.report()
+        self.governor.report()
+        if self.blocker:
+            self.blocker.report()
+        return self._finish_collection(available_semesters, existing_data, all_data)
+    
+    @property
+    def current_semester(self) -> Optional[str]:
+        """Son toplamada sunucunun gösterdiği güncel dönem (dönem menüsünün ilk seçeneği)"""
+        return self._current_semester_key
+    
+    def _plan_semesters(self, semesters: List[Dict[str, str]], existing_data: Optional[Dict[str, Any]],
+                        only_semesters: Optional[List[str]] = None) -> List[Dict[str, str]]:
+        """Artımlı modda toplanacak dönemleri belirle"""
+        self._current_semester_key = semesters[0]["value"] if semesters else None
+        
+        if self._current_only:
+            return semesters[:1]
+        
+        if only_semesters:
+            selected = [semester for semester in semesters if semester["value"] in only_semesters]
+            if not selected:
+                user_error(f"İstenen dönem bulunamadı: {', '.join(only_semesters)}")
+            return selected
+        
+        if not existing_data:
+            return semesters
+        
+        selected = select_semesters_to_refresh(semesters, existing_data)
+        user_message(f"Artımlı yenileme: {len(selected)}/{len(semesters)} dönem toplanacak, diğerleri donduruldu")
+        return selected
+    
+    def _finish_collection(self, semesters: List[Dict[str, str]], existing_data: Optional[Dict[str, Any]],
+                           all_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Toplanan dönemleri (artımlı modda mevcut verilerle birleştirerek) döndür"""
         user_success(f"Toplam {len(all_data)} dönem verisi toplandı")
-        return all_data
+        self.detail_cache.flush()
+        
+        if not existing_data:
+            # Kontrol noktasından sürdürülen dönemler önce eklenmiş olabilir: menü sırasını koru
+            ordered = {semester["value"]: all_data[semester["value"]] for semester in semesters if semester["value"] in all_data}
+            return {**ordered, **all_data}
+        if not all_data:
+            return {}
+        return merge_semester_data(semesters, existing_data, all_data)
+    
+    def _store_semester(self, all_data: Dict[str, Any], semester: Dict[str, str], courses: List[CourseInfo],
+                        progress: Progress, detail_client=None, select_page: Optional[Callable[[], None]] = None) -> None:
+        """Dönemin ders detaylarını çıkar ve sonuç sözlüğüne ekle
+        
+        select_page verilirse modal tıklamadan hemen önce çağrılır (sayfada başka dönem açıkken).
+        """
+        if not courses:
+            return
+        
+        # Bitmiş geçmiş dönemlerin detayları uzun, diğerleri kısa süre önbellekte kalır
+        frozen = semester["value"] != self._current_semester_key and is_semester_finalized(
+            {"courses": [{"bn": course.bn, "bd": course.bd} for course in courses]}
+        )
+        self.detail_cache.active_policy = "frozen" if frozen else "current"
+        
+        with self._timed("detail_extraction"):
+            self._batch_extract_details(courses, progress, detail_client=detail_client, select_page=select_page)
+        
+        all_data[semester["value"]] = {
+            "semester_name": semester["text"],
+            "courses": [course.to_dict() for course in courses]
+        }
+        
+        # Dönem hemen diske eklenir; çökme veya Ctrl+C'de toplanan dönemler kaybolmaz
+        if CHECKPOINT_ENABLED and self.username:
+            append_checkpoint(self.username, semester["value"], all_data[semester["value"]], DATA_DIR,
+                              plan=self._checkpoint_plan)
+    
+    def _resume_from_checkpoint(self, semesters: List[Dict[str, str]]):
+        """Yarıda kalan toplamanın kontrol noktasındaki dönemlerini al; kalan dönemleri ve alınan veriyi döndür"""
+        # Kontrol noktası toplanacak dönem listesine bağlanır: farklı listeyle (ör. tek dönem
+        # yenilemesi) yazılmış kontrol noktasından sürdürülmez
+        self._checkpoint_plan = checkpoint_plan([semester["value"] for semester in semesters])
+        
+        # Not takibi taze detay ister, kontrol noktasından sürdürmez
+        if not CHECKPOINT_ENABLED or not self.username or self._refresh_details:
+            return semesters, {}
+        
+        checkpoint = load_checkpoint(self.username, DATA_DIR, CHECKPOINT_MAX_AGE, plan=self._checkpoint_plan)
+        resumed = {semester["value"]: checkpoint[semester["value"]] for semester in semesters if semester["value"] in checkpoint}
+        if resumed:
+            user_message(f"♻️ Yarıda kalan toplama sürdürülüyor: {len(resumed)}/{len(semesters)} dönem kontrol noktasından alındı")
+        
+        return [semester for semester in semesters if semester["value"] not in resumed], resumed
+    
+    @contextmanager
+    def _interrupt_notice(self, all_data: Dict[str, Any]):
+        """Ctrl+C'de önbelleği yaz ve toplananların kontrol noktasında olduğunu bildir"""
+        try:
+            yield
+        except KeyboardInterrupt:
+            self.detail_cache.flush()
+            if CHECKPOINT_ENABLED and all_data:
+                user_warning(f"Toplama yarıda kesildi: {len(all_data)} dönem kaydedildi, sonraki güncellemede kaldığı yerden sürecek")
+            raise
+    
+    @staticmethod
+    def _resolve_parsed_courses(parsed) -> List[CourseInfo]:
+        """Arka plan ayrıştırma sonucunu al"""
+        if parsed is None:
+            return []
+        try:
+            return parsed.result()
+        except Exception as e:
+            internal_progress(f"Tablo ayrıştırma hatası: {e}")
+            return []
+    
+    def _create_progress(self) -> Progress:
+        """Dönem toplama için ilerleme çubuğu oluştur"""
+        return Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeElapsedColumn(),
+            RateColumn(self.governor),
+            console=console,
+            disable=not self.show_progress
+        )
+    
+    def _collect_via_http(self, existing_data: Optional[Dict[str, Any]] = None,
+                          only_semesters: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Tarayıcı yerine oturum çerezleriyle HTTP üzerinden tüm dönemleri topla"""
+        from http_client import KOUHttpClient
+        
+        internal_progress("⚡ HTTP modu: tarayıcısız veri toplama...")
+        client = KOUHttpClient.from_session_manager(self.session_manager, fallback_driver=self.driver)
+        
+        try:
+            with self._timed("navigation"):
+                available_semesters = client.get_semesters()
+            if not available_semesters:
+                user_error("Dönem bilgileri alınamadı")
+                return {}
+            
+            semesters = self._plan_semesters(available_semesters, existing_data, only_semesters)
+            if not semesters:
+                return {}
+            semesters, all_data = self._resume_from_checkpoint(semesters)
+            
+            with self._create_progress() as progress, self._interrupt_notice(all_data):
+                main_task = progress.add_task("Dönemler işleniyor...", total=len(semesters))
+                
+                for semester in semesters:
+                    progress.update(main_task, description=f"İşleniyor: {semester['text']}")
+                    
+                    with self._timed("semester_switch"):
+                        page_html = client.fetch_semester_page(semester["value"])
+                    courses = self._parse_page_source(page_html)
+                    self._store_semester(all_data, semester, courses, progress, detail_client=client)
+                    
+                    progress.update(main_task, advance=1)
+            
+            self.governor.report()
+            return self._finish_collection(available_semesters, existing_data, all_data)
+            
+        finally:
+            client.close()
     
     def _navigate_to_grades(self) -> bool:
         """Not sayfasına git"""
@@ -372,20 +733,21 @@ class KOUDataCollector:
             
             current_url = self.driver.current_url
             if "AnaGiris.cfm" not in current_url:
-                self.driver.get(MAIN_PAGE_URL)
-                time.sleep(1)  # Azaltılmış bekleme
+                self._open_page(MAIN_PAGE_URL, "Ana sayfa yükleme")
             
             wait = WebDriverWait(self.driver, DEFAULT_TIMEOUT)
             
             # "Ders İşlemleri" açılır menüsüne tıkla
             ders_islemleri = wait.until(EC.element_to_be_clickable((By.ID, "DersIslemleri")))
             ders_islemleri.click()
-            time.sleep(0.3)  # Azaltılmış bekleme
             
             # "Yarıyıl Not Durumu" bağlantısına tıkla
             yaril_not = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[@name='YariyilNotDurumuYeni/DersIslemleri']")))
-            yaril_not.click()
-            time.sleep(1.5)  # Azaltılmış bekleme
+            with self.governor.request("navigation") as ticket:
+                yaril_not.click()
+                self.waiter.ajax_idle("Not sayfası AJAX")
+                if self.waiter.last_capped:
+                    ticket.fail("not sayfası zaman aşımı")
             
             # Sayfanın yüklenip yüklenmediğini kontrol et
             try:
@@ -429,15 +791,41 @@ class KOUDataCollector:
             user_error(f"Dönem bilgileri hatası: {e}")
             return []
     
-    def _load_semester_grades_fast(self, semester_value: str) -> List[CourseInfo]:
-        """Belirli bir dönem için notları hızlı bir şekilde yükle"""
-        try:
+    def _select_semester(self, semester_value: str) -> None:
+        """Donem menüsünden dönemi seç ve tablonun yenilenmesini bekle"""
+        with self._timed("semester_switch"):
             wait = WebDriverWait(self.driver, DEFAULT_TIMEOUT)
             
-            # Dönem seç
+            # Dönem seç (zaten seçiliyse AJAX tetiklenmez, beklemeye gerek yok)
             semester_select = wait.until(EC.presence_of_element_located((By.ID, "Donem")))
-            Select(semester_select).select_by_value(semester_value)
-            time.sleep(1.5)  # AJAX için bekle
+            select = Select(semester_select)
+            previous_signature = self.waiter.table_signature()
+            if select.first_selected_option.get_attribute("value") != semester_value or not previous_signature:
+                with self.governor.request("semester_switch") as ticket:
+                    select.select_by_value(semester_value)
+                    self.waiter.table_changed("Dönem değişimi (AJAX)", previous_signature)
+                    if self.waiter.last_capped:
+                        ticket.fail("dönem tablosu zaman aşımı")
+    
+    def _parse_page_source(self, page_html: str) -> List[CourseInfo]:
+        """Sayfa kaynağındaki not tablosunu lxml ile ayrıştır (arka plan iş parçacığında da çalışır)"""
+        with self._timed("table_parse"):
+            return parse_grade_table(page_html)
+    
+    def _load_semester_page_source(self, semester_value: str) -> Optional[str]:
+        """Dönemi seç ve sayfa kaynağını tek çağrıda al (ayrıştırma tarayıcı dışında yapılır)"""
+        try:
+            self._select_semester(semester_value)
+            with self._timed("semester_switch"):
+                return self.driver.page_source
+        except Exception as e:
+            internal_progress(f"Dönem yükleme hatası: {e}")
+            return None
+    
+    def _load_semester_grades_fast(self, semester_value: str) -> List[CourseInfo]:
+        """Belirli bir dönem için notları hızlı bir şekilde yükle"""
+        try:
+            self._select_semester(semester_value)
             
             # Tabloyu bul
             table_selectors = [
@@ -465,7 +853,8 @@ class KOUDataCollector:
                 return []
             
             # JavaScript tabanlı hızlı ayrıştırma
-            courses = self._fast_table_parse(table)
+            with self._timed("table_parse"):
+                courses = self._fast_table_parse(table)
             return courses
             
         except Exception as e:
@@ -540,8 +929,9 @@ class KOUDataCollector:
             internal_progress(f"❌ Hızlı parsing hatası: {e}")
             return []
     
-    def _batch_extract_details(self, courses: List[CourseInfo], progress: Progress) -> None:
-        """Optimize edilmiş gruplarla paralel işleme ile ders detaylarını çıkar"""
+    def _batch_extract_details(self, courses: List[CourseInfo], progress: Progress, detail_client=None,
+                               select_page: Optional[Callable[[], None]] = None) -> None:
+        """Seçilen stratejiyle (HTTP havuzu, sayfa içi fetch veya modal tıklama) ders detaylarını çıkar"""
         if not courses:
             return
         
@@ -551,105 +941,261 @@ class KOUDataCollector:
         
         detail_task = progress.add_task("Ders detayları çekiliyor...", total=len(courses_with_details))
         
+        # Süper hız için önce önbelleği kontrol et
+        pending = []
         for course in courses_with_details:
+            if not self._refresh_details and course.detail_params in self.detail_cache:
+                self._apply_details(course, self.detail_cache[course.detail_params])
+                progress.update(detail_task, advance=1)
+            else:
+                pending.append(course)
+        
+        if not pending:
+            return
+        
+        if detail_client is None and self.detail_strategy == "async_script":
+            pending = self._prefetch_details_in_page(pending, progress, detail_task)
+            if not pending:
+                return
+        elif detail_client is None and self.detail_strategy == "http":
+            detail_client = self._get_detail_client()
+        
+        if detail_client is not None:
+            fetched = self._extract_details_parallel(pending, detail_client, progress, detail_task)
+            if fetched:
+                return
+            if detail_client is not self.detail_client:
+                # HTTP arka ucunda hiçbir detay alınamadıysa dönem detaysız kaydedilip dondurulmasın:
+                # hata toplayıcıyı tarayıcı moduna döndürür
+                raise ParseError("HTTP ile hiçbir ders detayı alınamadı")
+            
+            # Tarayıcı modunda HTTP detayları hiç çalışmadıysa modal tıklamaya dön
+            internal_progress("HTTP detay çekme başarısız, modal tıklama moduna geçiliyor...")
+            self._http_details_available = False
+            progress.reset(detail_task, total=len(courses_with_details), completed=len(courses_with_details) - len(pending))
+        
+        if select_page is not None:
+            select_page()
+        
+        for course in pending:
             try:
-                # Süper hız için önce önbelleği kontrol et
-                if course.detail_params in self.detail_cache:
-                    cached_details = self.detail_cache[course.detail_params]
-                    course.instructor = cached_details.get("instructor", "")
-                    course.activities = cached_details.get("activities", [])
-                    course.semester_average = cached_details.get("semester_average", "")
-                    progress.update(detail_task, advance=1)
-                    continue
-                
-                # Hızlı detay çıkarma
                 details = self._quick_extract_course_details(course.detail_params)
-                
-                # Dersi güncelle
-                course.instructor = details.get("instructor", "")
-                course.activities = details.get("activities", [])
-                course.semester_average = details.get("semester_average", "")
+                self._apply_details(course, details)
                 
                 # Gelecekte kullanım için önbelleğe al
-                self.detail_cache[course.detail_params] = details
-                
-                progress.update(detail_task, advance=1)
-                
+                self._cache_details(course.detail_params, details)
             except Exception as e:
+                internal_progress(f"Detay alınamadı ({course.code}): {e}")
+            finally:
                 progress.update(detail_task, advance=1)
+    
+    def _extract_details_parallel(self, courses: List[CourseInfo], detail_client, progress: Progress, detail_task) -> int:
+        """Detay sayfalarını havuzda eşzamanlı çek, başarılı ders sayısını döndür"""
+        workers = max(1, min(DETAIL_MAX_WORKERS, len(courses)))
+        # Her işçi en fazla DETAIL_WORKER_TIMEOUT bekler; aşama bütçesi dalga sayısıyla ölçeklenir
+        stage_timeout = DETAIL_WORKER_TIMEOUT * (-(-len(courses) // workers) + 1)
+        fetched = 0
+        
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kou-detail")
+        futures = {
+            executor.submit(detail_client.get_course_details, course.detail_params, DETAIL_WORKER_TIMEOUT): course
+            for course in courses
+        }
+        
+        try:
+            for future in concurrent.futures.as_completed(futures, timeout=stage_timeout):
+                course = futures[future]
+                try:
+                    details = future.result()
+                    self._apply_details(course, details)
+                    self._cache_details(course.detail_params, details)
+                    fetched += 1
+                except Exception as e:
+                    internal_progress(f"Detay alınamadı ({course.code}): {e}")
+                finally:
+                    progress.update(detail_task, advance=1)
+        except concurrent.futures.TimeoutError:
+            internal_progress("Detay aşaması zaman aşımına uğradı, kalan dersler atlanıyor")
+            for future in futures:
+                future.cancel()
+        finally:
+            executor.shutdown(wait=False)
+        
+        return fetched
+    
+    def _prefetch_details_in_page(self, courses: List[CourseInfo], progress: Progress, detail_task) -> List[CourseInfo]:
+        """Tüm detay parçalarını tek bir execute_async_script ile sayfa içinden çek, başarısızları döndür"""
+        # Tüm istekler Promise.all ile eşzamanlı gider, sonuç tek WebDriver yanıtında döner
+        js_code = """
+        var params = arguments[0], template = arguments[1], timeoutMs = arguments[2];
+        var done = arguments[arguments.length - 1];
+        function fetchOne(p) {
+            var ctrl = window.AbortController ? new AbortController() : null;
+            var timer = ctrl ? setTimeout(function() { ctrl.abort(); }, timeoutMs) : null;
+            return fetch(template.replace('{params}', p), {credentials: 'same-origin', signal: ctrl ? ctrl.signal : undefined})
+                .then(function(r) { return r.ok ? r.text() : null; })
+                .catch(function() { return null; })
+                .then(function(body) { if (timer) { clearTimeout(timer); } return [p, body]; });
+        }
+        Promise.all(params.map(fetchOne)).then(function(results) {
+            var out = {};
+            results.forEach(function(r) { out[r[0]] = r[1]; });
+            done(out);
+        });
+        """
+        
+        try:
+            # Sayfa içindeki eşzamanlı istekler de ders başına bir token harcar
+            with self.governor.request("detail", tokens=len(courses)) as ticket:
+                self.driver.set_script_timeout(DETAIL_WORKER_TIMEOUT * 2)
+                fragments = self.driver.execute_async_script(
+                    js_code,
+                    [course.detail_params for course in courses],
+                    COURSE_DETAIL_URL,
+                    DETAIL_WORKER_TIMEOUT * 1000
+                ) or {}
+                if sum(1 for body in fragments.values() if not body) > len(courses) // 2:
+                    ticket.fail("detay isteklerinin çoğu başarısız")
+        except Exception as e:
+            internal_progress(f"Sayfa içi detay çekme hatası: {e}")
+            return courses
+        
+        failed = []
+        for course in courses:
+            body = fragments.get(course.detail_params)
+            if not body or is_login_page(body) or not has_detail_markup(body):
+                failed.append(course)
                 continue
+            
+            details = parse_course_details(body)
+            self._apply_details(course, details)
+            self._cache_details(course.detail_params, details)
+            progress.update(detail_task, advance=1)
+        
+        if failed:
+            internal_progress(f"{len(failed)} ders için modal tıklama moduna dönülüyor")
+        return failed
+    
+    def _get_detail_client(self):
+        """Tarayıcı modunda detaylar için oturum çerezleriyle HTTP istemcisi oluştur"""
+        if self.detail_client is None and self._http_details_available:
+            try:
+                from http_client import KOUHttpClient
+                self.detail_client = KOUHttpClient(self.driver.get_cookies())
+            except Exception as e:
+                internal_progress(f"Paralel detay istemcisi oluşturulamadı: {e}")
+                self._http_details_available = False
+        
+        return self.detail_client if self._http_details_available else None
+    
+    def _cache_details(self, detail_params: str, details: Dict[str, Any]) -> None:
+        """Yalnızca içerik taşıyan detayları önbelleğe al: açılmayan modal veya boş yanıt
+        önbelleğe yazılırsa donmuş dönemde uzun süre boş detay olarak kalır"""
+        if details.get("activities") or details.get("instructor"):
+            self.detail_cache[detail_params] = details
+    
+    @staticmethod
+    def _apply_details(course: CourseInfo, details: Dict[str, Any]) -> None:
+        """Çıkarılan detayları ders nesnesine yaz"""
+        course.instructor = details.get("instructor", "")
+        course.activities = details.get("activities", [])
+        course.semester_average = details.get("semester_average", "")
     
     def _quick_extract_course_details(self, detail_params: str) -> Dict[str, Any]:
-        """Ultra-hızlı ders detayı çıkarma"""
+        """Ultra-hızlı ders detayı çıkarma: açma ve ayrıştırma birer execute_script çağrısı
+        
+        WebDriver hataları çağırana iletilir; yarım kalan detay uygulanmaz ve önbelleğe yazılmaz.
+        """
         details = {
             "instructor": "",
             "activities": [],
             "semester_average": ""
         }
         
-        try:
-            # Ders bağlantısını bul ve tıkla
-            course_links = self.driver.find_elements(By.XPATH, f"//a[@name='{detail_params}']")
-            if course_links:
-                course_link = course_links[0]
-                course_link.click()
-                time.sleep(0.3)  # Minimum bekleme
-                
-                # Hızlı modal algılama ve çıkarma
-                try:
-                    wait = WebDriverWait(self.driver, 2)  # Kısa zaman aşımı
-                    modal_body = wait.until(EC.presence_of_element_located((By.ID, "ModalBody")))
-                    
-                    # Ultra-hızlı öğretim elemanı çıkarma
-                    try:
-                        instructor_elements = modal_body.find_elements(By.CSS_SELECTOR, "h4.alert.alert-info")
-                        if instructor_elements:
-                            instructor_text = instructor_elements[0].text
-                            if "Dersin Öğretim Elemanı:" in instructor_text:
-                                details["instructor"] = instructor_text.replace("Dersin Öğretim Elemanı:", "").strip()
-                    except:
-                        pass
-                    
-                    # Yıldırım hızında aktivite çıkarma
-                    try:
-                        activity_rows = modal_body.find_elements(By.CSS_SELECTOR, "div.bg-warning")
-                        
-                        for row in activity_rows:
-                            try:
-                                columns = row.find_elements(By.CSS_SELECTOR, "div[class*='col-lg-']")
-                                
-                                if len(columns) >= 6:
-                                    activity = CourseActivity(
-                                        activity_type=clean_text(columns[0].text),
-                                        score=clean_text(columns[1].text),
-                                        percentage=clean_text(columns[3].text),
-                                        semester_effect=clean_text(columns[5].text)
-                                    )
-                                    details["activities"].append(activity)
-                            except:
-                                continue
-                    except:
-                        pass
-                    
-                    # Süper hızlı modal kapatma
-                    try:
-                        self.driver.execute_script("$('#Modal').modal('hide');")
-                        time.sleep(0.1)  # Minimum bekleme
-                    except:
-                        pass
-                        
-                except TimeoutException:
-                    pass
+        # Ders bağlantısını bul, önceki modal içeriğini al ve tıkla - tek WebDriver çağrısı
+        open_js = """
+        var links = document.getElementsByName(arguments[0]);
+        for (var i = 0; i < links.length; i++) {
+            if (links[i].tagName === 'A') {
+                var body = document.getElementById('ModalBody');
+                var previous = body ? body.innerHTML : '';
+                links[i].click();
+                return previous;
+            }
+        }
+        return null;
+        """
+        with self.governor.request("detail") as ticket:
+            previous_body = self.driver.execute_script(open_js, detail_params)
+            if previous_body is None:
+                return details
+            
+            # Hızlı modal algılama: önceki dersin içeriği yerine yenisini bekle
+            self.waiter.element_content_changed("Ders detay modalı", "ModalBody", previous_body, cap=2)
+            if self.waiter.last_capped:
+                ticket.fail("detay modalı zaman aşımı")
         
-        except:
-            pass
+        # Öğretim elemanı, tüm aktiviteler ve ortalama tek çağrıda; modal aynı betikte kapanır
+        extract_js = """
+        var body = document.getElementById('ModalBody');
+        if (!body) { return null; }
+        var label = arguments[0];
+        var result = {instructor: '', activities: [], semesterAverage: ''};
+        
+        var header = body.querySelector('h4.alert.alert-info');
+        if (header && header.innerText.indexOf(label) !== -1) {
+            result.instructor = header.innerText.replace(label, '');
+        }
+        
+        var rows = body.querySelectorAll('div.bg-warning');
+        for (var i = 0; i < rows.length; i++) {
+            var cols = rows[i].querySelectorAll("div[class*='col-lg-']");
+            if (cols.length >= 6) {
+                result.activities.push([cols[0].innerText, cols[1].innerText, cols[3].innerText, cols[5].innerText]);
+            }
+        }
+        
+        var match = body.innerText.replace(/\\s+/g, ' ').match(new RegExp(arguments[1], 'i'));
+        if (match) { result.semesterAverage = match[1]; }
+        
+        if (window.jQuery) { window.jQuery('#Modal').modal('hide'); }
+        return result;
+        """
+        extracted = self.driver.execute_script(extract_js, INSTRUCTOR_LABEL, SEMESTER_AVERAGE_PATTERN.pattern)
+        if not extracted:
+            return details
+        
+        details["instructor"] = clean_text(extracted.get("instructor", ""))
+        details["semester_average"] = clean_text(extracted.get("semesterAverage", ""))
+        details["activities"] = [
+            CourseActivity(
+                activity_type=clean_text(activity_type),
+                score=clean_text(score),
+                percentage=clean_text(percentage),
+                semester_effect=clean_text(semester_effect)
+            )
+            for activity_type, score, percentage, semester_effect in extracted.get("activities", [])
+        ]
+        
+        try:
+            self.waiter.element_hidden("Modal kapanışı", "Modal", cap=0.5)
+        except Exception as e:
+            internal_progress(f"Modal kapanış hatası: {e}")
         
         return details
     
     def close(self):
         """WebDriver'ı kapat"""
+        self.detail_cache.flush()
+        
+        if self.detail_client:
+            self.detail_client.close()
+            self.detail_client = None
+        
         try:
             if self.driver:
+                if self.blocker:
+                    self.blocker.persist()
                 self.driver.quit()
                 internal_progress("Tarayıcı kapatıldı")
         except:
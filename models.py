@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - Veri Modelleri
+Tarayıcı ve HTML ayrıştırıcı tarafından ortak kullanılan veri sınıfları
+"""
+
+from typing import List
+from dataclasses import dataclass, asdict
+
+
+@dataclass
+class LoginCredentials:
+    """Kullanıcı giriş bilgileri"""
+    username: str
+    password: str
+
+@dataclass
+class CourseActivity:
+    """Ders aktivite bilgileri"""
+    activity_type: str
+    score: str
+    percentage: str
+    semester_effect: str
+
+@dataclass
+class CourseInfo:
+    """Tüm ders bilgileri"""
+    sequence: str
+    code: str
+    name: str
+    attendance: str
+    language: str
+    ects: str
+    yio: str
+    yys: str
+    but: str
+    bn: str
+    bd: str
+    instructor: str = ""
+    activities: List[CourseActivity] = None
+    semester_average: str = ""
+    detail_params: str = ""  # Toplu işleme için
+    
+    def __post_init__(self):
+        if self.activities is None:
+            self.activities = []
+    
+    def to_dict(self):
+        data = asdict(self)
+        # İç işleme alanını kaldır
+        if 'detail_params' in data:
+            del data['detail_params']
+        return data
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - Uyarlanır İstek Hızı Düzenleyici
+Sunucuya giden her istek (gezinme, dönem değişimi, detay) tek bir token bucket'tan
+geçer; hız sınırı gözlenen gecikme ve hatalara göre AIMD ile ayarlanır, zaman aşımı
+ve sunucu hatalarında üstel geri çekilme uygulanır
+"""
+
+import time
+import random
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, Optional
+
+from rich.progress import ProgressColumn
+from rich.text import Text
+
+from config import (
+    RATE_LIMIT_ENABLED, RATE_LIMIT, RATE_LIMIT_MIN, RATE_LIMIT_MAX, RATE_BURST,
+    RATE_TARGET_LATENCY, RATE_BACKOFF_BASE, RATE_BACKOFF_MAX, RATE_RETRIES
+)
+from exceptions import NetworkError, ServerError
+from logger import internal_progress, log_info
+
+# AIMD katsayıları: başarıda sınır yaklaşık saniyede bir istek/s artar, yavaşlama ve hatada çarpanla düşer
+ADDITIVE_INCREASE = 1.0
+SLOW_DECREASE = 0.8
+ERROR_DECREASE = 0.5
+LATENCY_SMOOTHING = 0.2
+# Etkin hız bu pencerede tamamlanan isteklerden hesaplanır (saniye)
+RATE_WINDOW = 10.0
+
+
+def is_throttle_error(error: BaseException) -> bool:
+    """Sunucunun yük altında olduğunu gösteren hata mı (zaman aşımı, ağ, 429/5xx)"""
+    if isinstance(error, ServerError):
+        return error.status_code is None or error.status_code == 429 or error.status_code >= 500
+    if isinstance(error, NetworkError):
+        return True
+    # Selenium sayfa yükleme zaman aşımı (selenium burada içe aktarılmaz)
+    return type(error).__name__ == "TimeoutException"
+
+
+class RequestTicket:
+    """Tek bir isteğin kaydı; yanıt hata işareti taşıyorsa fail() ile bildirilir"""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.failed_reason: Optional[str] = None
+
+    def fail(self, reason: str):
+        self.failed_reason = reason
+
+
+class RateGovernor:
+    """İş parçacıkları arasında paylaşılan token bucket ve uyarlanır hız sınırı"""
+
+    def __init__(self, rate: float = RATE_LIMIT, min_rate: float = RATE_LIMIT_MIN, max_rate: float = RATE_LIMIT_MAX,
+                 burst: int = RATE_BURST, target_latency: float = RATE_TARGET_LATENCY,
+                 backoff_base: float = RATE_BACKOFF_BASE, backoff_max: float = RATE_BACKOFF_MAX,
+                 enabled: bool = RATE_LIMIT_ENABLED):
+        self.enabled = enabled
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.target_latency = target_latency
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._completed = deque()
+        self._local = threading.local()
+
+        self.latency: Optional[float] = None
+        self.consecutive_failures = 0
+        self.requests = 0
+        self.errors = 0
+        self.waited = 0.0
+        self.backoff_total = 0.0
+        self.by_label: Dict[str, int] = {}
+
+    def _refill(self, now: float):
+        self._tokens = min(float(self.burst), self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def acquire(self, tokens: int = 1) -> float:
+        """Token alınana kadar bekle (geri çekilme sürüyorsa o da beklenir), bekleme süresini döndür"""
+        if not self.enabled:
+            return 0.0
+
+        start = time.monotonic()
+        for _ in range(max(1, tokens)):
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    if now < self._blocked_until:
+                        delay = self._blocked_until - now
+                    else:
+                        self._refill(now)
+                        if self._tokens >= 1:
+                            self._tokens -= 1
+                            break
+                        delay = (1 - self._tokens) / self.rate
+                time.sleep(delay)
+
+        waited = time.monotonic() - start
+        with self._lock:
+            self.waited += waited
+        return waited
+
+    def _decrease(self, now: float, factor: float):
+        """Sınırı düşür; eşzamanlı yanıtlar aynı olayı çoğaltmasın diye gecikme başına bir kez"""
+        if now - self._last_decrease >= max(self.latency or 0.0, 1.0):
+            self.rate = max(self.min_rate, self.rate * factor)
+            self._last_decrease = now
+
+    def _complete(self, label: str, now: float):
+        self.requests += 1
+        self.by_label[label] = self.by_label.get(label, 0) + 1
+        self._completed.append(now)
+        while self._completed and now - self._completed[0] > RATE_WINDOW:
+            self._completed.popleft()
+
+    def record_success(self, label: str, latency: float):
+        """Başarılı yanıt: gecikme hedefin altındaysa sınırı artır, üstündeyse azalt"""
+        with self._lock:
+            now = time.monotonic()
+            self._complete(label, now)
+            self.consecutive_failures = 0
+            self.latency = latency if self.latency is None else \
+                (1 - LATENCY_SMOOTHING) * self.latency + LATENCY_SMOOTHING * latency
+
+            if self.latency > self.target_latency:
+                self._decrease(now, SLOW_DECREASE)
+            else:
+                self.rate = min(self.max_rate, self.rate + ADDITIVE_INCREASE / max(self.rate, 1.0))
+
+    def record_failure(self, label: str, reason: str):
+        """Zaman aşımı veya sunucu hatası: sınırı yarıya indir ve tüm istekleri üstel olarak beklet"""
+        with self._lock:
+            now = time.monotonic()
+            self._complete(label, now)
+            self.errors += 1
+            self.consecutive_failures += 1
+            self._decrease(now, ERROR_DECREASE)
+
+            delay = min(self.backoff_max, self.backoff_base * 2 ** (self.consecutive_failures - 1))
+            delay *= random.uniform(0.75, 1.25)
+            self._blocked_until = max(self._blocked_until, now + delay)
+            self.backoff_total += delay
+
+        internal_progress(f"🐢 {label}: {reason}, {delay:.1f}s geri çekiliniyor (sınır {self.rate:.1f}/s)")
+
+    @contextmanager
+    def request(self, label: str, tokens: int = 1):
+        """İsteği sınırla ve sonucunu kaydet; hata işareti için ticket.fail() çağrılabilir"""
+        self.acquire(tokens)
+        ticket = RequestTicket(label)
+        previous, self._local.ticket = getattr(self._local, "ticket", None), ticket
+        start = time.monotonic()
+
+        try:
+            yield ticket
+        except Exception as e:
+            if is_throttle_error(e):
+                self.record_failure(label, type(e).__name__)
+            else:
+                with self._lock:
+                    self._complete(label, time.monotonic())
+            raise
+        finally:
+            self._local.ticket = previous
+
+        if ticket.failed_reason:
+            self.record_failure(label, ticket.failed_reason)
+        else:
+            self.record_success(label, time.monotonic() - start)
+
+    def flag(self, reason: str):
+        """Bu iş parçacığında süren isteği hatalı say (ör. sayfa beklemesi üst sınıra takıldı)"""
+        ticket = getattr(self._local, "ticket", None)
+        if ticket is not None:
+            ticket.fail(reason)
+
+    def call(self, label: str, fn: Callable, *args, retries: int = RATE_RETRIES, **kwargs):
+        """fn'i sınır altında çalıştır; yük kaynaklı hatalarda geri çekilip yeniden dene"""
+        for attempt in range(retries + 1):
+            try:
+                with self.request(label):
+                    return fn(*args, **kwargs)
+            except Exception as e:
+                if attempt >= retries or not is_throttle_error(e):
+                    raise
+
+    def effective_rate(self) -> float:
+        """Son pencerede tamamlanan istek/s"""
+        with self._lock:
+            now = time.monotonic()
+            while self._completed and now - self._completed[0] > RATE_WINDOW:
+                self._completed.popleft()
+            if len(self._completed) < 2:
+                return float(len(self._completed))
+            span = max(now - self._completed[0], 1.0)
+            return len(self._completed) / span
+
+    def stats(self) -> Dict[str, Any]:
+        """Anlık istatistikler"""
+        effective = self.effective_rate()
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "effective_rate": round(effective, 2),
+                "rate_limit": round(self.rate, 2),
+                "latency": round(self.latency, 3) if self.latency is not None else None,
+                "requests": self.requests,
+                "errors": self.errors,
+                "waited": round(self.waited, 2),
+                "backoff": round(self.backoff_total, 2),
+                "by_label": dict(self.by_label)
+            }
+
+    def status_line(self) -> str:
+        """İlerleme çubuğu için kısa durum metni"""
+        stats = self.stats()
+        latency = f"{stats['latency'] * 1000:.0f} ms" if stats["latency"] is not None else "—"
+        limit = f"{stats['rate_limit']:.1f}/s" if self.enabled else "sınırsız"
+        errors = f" · {stats['errors']} hata" if stats["errors"] else ""
+        return f"{stats['effective_rate']:.1f} istek/s (sınır {limit}) · {latency}{errors}"
+
+    def report(self):
+        """Toplama sonunda istek hızı özetini yaz"""
+        stats = self.stats()
+        if not stats["requests"]:
+            return
+
+        internal_progress(
+            f"📶 {stats['requests']} istek, etkin {stats['effective_rate']:.1f}/s, son sınır {stats['rate_limit']:.1f}/s, "
+            f"{stats['errors']} hata, sınır beklemesi {stats['waited']:.1f}s, geri çekilme {stats['backoff']:.1f}s"
+        )
+        log_info(f"Hız düzenleyici: {stats}")
+
+
+class RateColumn(ProgressColumn):
+    """Rich ilerleme çubuğunda canlı etkin istek hızı"""
+
+    def __init__(self, governor: RateGovernor):
+        super().__init__()
+        self.governor = governor
+
+    def render(self, task) -> Text:
+        return Text(self.governor.status_line(), style="dim")
+
+
+_shared_governor: Optional[RateGovernor] = None
+_shared_lock = threading.Lock()
+
+
+def get_governor() -> RateGovernor:
+    """Süreç genelinde paylaşılan düzenleyici (toplu toplamadaki tüm toplayıcılar dahil)"""
+    global _shared_governor
+    with _shared_lock:
+        if _shared_governor is None:
+            _shared_governor = RateGovernor()
+        return _shared_governor
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - Tarayıcı Kaynak Engelleme
+Giriş sonrasında kullanılmayan tema kaynaklarını (görsel, yazı tipi, analitik, stil)
+Chrome DevTools Protocol ile engeller ve kaçınılan istek/bayt sayısını raporlar
+"""
+
+import json
+from fnmatch import fnmatch
+from typing import Dict, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from config import BLOCKED_URL_PATTERNS, RESOURCE_SIZES_FILE
+from file_io import atomic_write_json
+from logger import internal_progress, log_info
+
+# Öğrenilen kaynak boyutlarının üst sınırı (dosya küçük kalsın)
+MAX_KNOWN_SIZES = 500
+
+
+class ResourceBlocker:
+    """Network.setBlockedURLs ile kaynak engelleme ve performans günlüğünden sayaçlar
+
+    Engellenen bir isteğin boyutu, aynı kaynağın engellenmeden yüklendiği önceki
+    ölçümlerden (ör. giriş sayfası) tahmin edilir; bilinmiyorsa kategori ortalaması kullanılır.
+    """
+
+    def __init__(self, driver, categories: List[str]):
+        self.driver = driver
+        self.patterns: Dict[str, List[str]] = {
+            category: BLOCKED_URL_PATTERNS[category]
+            for category in categories if category in BLOCKED_URL_PATTERNS
+        }
+        self.enabled = False
+        self.blocked_requests: Dict[str, int] = {}
+        self.blocked_bytes = 0
+        self.known_sizes: Dict[str, int] = self._load_sizes()
+        self._request_urls: Dict[str, str] = {}
+
+    @staticmethod
+    def _load_sizes() -> Dict[str, int]:
+        try:
+            with open(RESOURCE_SIZES_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_sizes(self):
+        try:
+            sizes = dict(list(self.known_sizes.items())[-MAX_KNOWN_SIZES:])
+            atomic_write_json(RESOURCE_SIZES_FILE, sizes, separators=(',', ':'))
+        except OSError as e:
+            internal_progress(f"Kaynak boyutları yazılamadı: {e}")
+
+    def category_of(self, url: str) -> Optional[str]:
+        """URL'nin hangi engelleme kategorisine girdiğini bul"""
+        for category, patterns in self.patterns.items():
+            if any(fnmatch(url, pattern) for pattern in patterns):
+                return category
+        return None
+
+    def enable(self) -> bool:
+        """Engellemeyi etkinleştir (giriş tamamlandıktan sonra çağrılır)"""
+        if self.enabled or not self.patterns:
+            return self.enabled
+
+        # Giriş sırasında engellenmeden yüklenen kaynakların boyutlarını öğren
+        self.drain()
+
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {
+                'urls': [pattern for patterns in self.patterns.values() for pattern in patterns]
+            })
+            self.enabled = True
+            internal_progress(f"🚫 Kaynak engelleme etkin: {', '.join(self.patterns)}")
+        except (WebDriverException, AttributeError) as e:
+            internal_progress(f"Kaynak engelleme desteklenmiyor: {e}")
+
+        return self.enabled
+
+    def drain(self):
+        """Performans günlüğünü işle: yüklenen boyutları öğren, engellenenleri say"""
+        try:
+            entries = self.driver.get_log('performance')
+        except (WebDriverException, ValueError):
+            return
+
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+
+            method = message.get('method')
+            params = message.get('params', {})
+
+            if method == 'Network.requestWillBeSent':
+                self._request_urls[params.get('requestId')] = params.get('request', {}).get('url', '')
+
+            elif method == 'Network.loadingFinished':
+                url = self._request_urls.pop(params.get('requestId'), '')
+                if url and self.category_of(url):
+                    self.known_sizes[url] = int(params.get('encodedDataLength', 0))
+
+            elif method == 'Network.loadingFailed' and params.get('blockedReason') == 'inspector':
+                url = self._request_urls.pop(params.get('requestId'), '')
+                category = self.category_of(url) or 'other'
+                self.blocked_requests[category] = self.blocked_requests.get(category, 0) + 1
+                self.blocked_bytes += self._estimate_size(url, category)
+
+    def _estimate_size(self, url: str, category: str) -> int:
+        """Engellenen kaynağın boyutunu önceki ölçümlerden tahmin et"""
+        if url in self.known_sizes:
+            return self.known_sizes[url]
+
+        same_category = [size for known_url, size in self.known_sizes.items() if self.category_of(known_url) == category]
+        return sum(same_category) // len(same_category) if same_category else 0
+
+    @property
+    def total_blocked(self) -> int:
+        return sum(self.blocked_requests.values())
+
+    def persist(self):
+        """Bekleyen günlükleri işle ve öğrenilen boyutları kaydet (sürücü kapanmadan önce)"""
+        self.drain()
+        self._save_sizes()
+
+    def report(self):
+        """Bu çalıştırmada kaçınılan istek ve bayt miktarını özetle"""
+        self.persist()
+
+        if not self.enabled:
+            return
+
+        breakdown = ", ".join(f"{category}: {count}" for category, count in sorted(self.blocked_requests.items()))
+        internal_progress(
+            f"🚫 Engellenen kaynak: {self.total_blocked} istek, ~{self.blocked_bytes / 1024:.1f} KB"
+            + (f" ({breakdown})" if breakdown else "")
+        )
+        log_info(f"Kaynak engelleme: {self.blocked_requests}, {self.blocked_bytes} bayt")
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - Dönem Bazlı Segmentli Veri Dosyası
+Her dönem dosyada ayrı bir segment olarak tutulur; sondaki tablo (ve özet dizini)
+segmentlerin konumlarını verir. Yükleme yalnızca tabloyu okur, bir dönem ilk kez
+istendiğinde yalnızca onun segmenti (mümkünse mmap ile) okunup çözülür.
+
+Dosya düzeni:
+    KOUSEG1\\n | segment 0 | segment 1 | ... | tablo (JSON) | tablo konumu (8 bayt, little-endian)
+
+Segmentler düz JSON veya data_codec sıkı biçimindedir; her segment başlığından tanınır.
+Tablo her segmentin SHA-1 özetini taşır; özet yalnızca o segment okunduğunda doğrulanır,
+yükleme tüm dosyayı okumaz.
+"""
+
+import os
+import json
+import mmap
+import struct
+import hashlib
+from pathlib import Path
+from collections.abc import Mapping
+from typing import Dict, Any, List, Optional, Tuple, Iterator, Callable
+
+from data_codec import pack, unpack
+from file_io import atomic_write
+
+MAGIC = b"KOUSEG1\n"
+TRAILER = struct.Struct("<Q")
+
+
+def encode_semester(semester_data: Dict[str, Any], data_format: str = "json", compression: str = "none") -> bytes:
+    """Tek bir dönemi segment baytlarına çevir"""
+    if data_format == "compact":
+        return pack(semester_data, compression)
+    return json.dumps(semester_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def decode_semester(raw: bytes) -> Dict[str, Any]:
+    """Segment baytlarını dönem sözlüğüne çevir (biçim başlıktan tanınır)"""
+    return unpack(raw)
+
+
+def build_segmented(data: Mapping, metadata: Dict[str, Any], data_format: str = "json",
+                    compression: str = "none") -> Tuple[bytes, List[Dict[str, Any]]]:
+    """Dosya içeriğini ve segment tablosunu üret"""
+    parts = [MAGIC]
+    table = []
+    offset = len(MAGIC)
+
+    for key, semester_data in data.items():
+        raw = encode_semester(semester_data, data_format, compression)
+        table.append({
+            "key": key,
+            "name": semester_data.get("semester_name", ""),
+            "courses": len(semester_data.get("courses", [])),
+            "frozen": bool(semester_data.get("frozen")),
+            "offset": offset,
+            "length": len(raw),
+            "sha1": hashlib.sha1(raw).hexdigest()
+        })
+        parts.append(raw)
+        offset += len(raw)
+
+    footer = json.dumps({"metadata": metadata, "segments": table}, ensure_ascii=False, separators=(',', ':'))
+    parts.append(footer.encode('utf-8'))
+    parts.append(TRAILER.pack(offset))
+    return b"".join(parts), table
+
+
+def write_segmented(file_path: Path, data: Mapping, metadata: Dict[str, Any], data_format: str = "json",
+                    compression: str = "none", keep_backup: bool = False) -> Tuple[bytes, List[Dict[str, Any]]]:
+    """Segmentli dosyayı atomik yaz; açık tembel okuyucular eski dosyayı görmeye devam eder"""
+    payload, table = build_segmented(data, metadata, data_format, compression)
+    atomic_write(file_path, payload, keep_backup)
+    return payload, table
+
+
+def _read_footer(f) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Açık dosyanın sonundaki segment tablosunu oku"""
+    size = os.fstat(f.fileno()).st_size
+    if size < len(MAGIC) + TRAILER.size:
+        raise ValueError("Segmentli dosya eksik")
+
+    f.seek(size - TRAILER.size)
+    (footer_offset,) = TRAILER.unpack(f.read(TRAILER.size))
+    if not len(MAGIC) <= footer_offset < size - TRAILER.size:
+        raise ValueError("Segment tablosu konumu geçersiz")
+
+    f.seek(footer_offset)
+    footer = json.loads(f.read(size - TRAILER.size - footer_offset))
+    return footer.get("metadata", {}), footer["segments"]
+
+
+def read_footer(file_path: Path) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Dosyadaki metadata ve segment tablosu (özet dizini yoksa kullanılır)"""
+    with open(file_path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError("Segmentli dosya değil")
+        return _read_footer(f)
+
+
+def _identity(stat_result) -> Tuple[int, int]:
+    return stat_result.st_size, stat_result.st_mtime_ns
+
+
+class LazySemesterData(Mapping):
+    """Dönemleri ilk erişimde çözen salt okunur sözlük
+
+    keys()/len()/'in' ve summaries() yalnızca segment tablosunu kullanır; [key], get(),
+    values() ve items() ilgili segmentleri okuyup özetini doğrular ve bir kez çözer.
+
+    Bozuk segmentte on_corrupt(self, hata) verilmişse bir kez çağrılır; döndürdüğü (onarılmış
+    dosyadan açılmış) LazySemesterData ile devam edilir, None dönerse ValueError fırlatılır.
+    """
+
+    def __init__(self, file_path: Path, table: List[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None,
+                 on_corrupt: Optional[Callable[["LazySemesterData", Exception], Optional["LazySemesterData"]]] = None):
+        self.file_path = Path(file_path)
+        self.metadata = metadata or {}
+        self.on_corrupt = on_corrupt
+        self._set_table(table)
+        self._identity = _identity(self.file_path.stat())
+
+    @classmethod
+    def open(cls, file_path: Path, table: Optional[List[Dict[str, Any]]] = None,
+             metadata: Optional[Dict[str, Any]] = None,
+             on_corrupt: Optional[Callable[["LazySemesterData", Exception], Optional["LazySemesterData"]]] = None) -> "LazySemesterData":
+        """Dosyayı aç; özet dizinindeki tablo verilmezse dosya sonundan okunur"""
+        if table is None:
+            metadata, table = read_footer(file_path)
+        return cls(file_path, table, metadata, on_corrupt)
+
+    def _set_table(self, table: List[Dict[str, Any]]):
+        self._entries = {entry["key"]: entry for entry in table}
+        self._order = [entry["key"] for entry in table]
+        self._decoded: Dict[str, Dict[str, Any]] = {}
+
+    def _read_segment(self, key: str) -> bytes:
+        """Segmenti oku; dosya başka bir süreçte yeniden yazıldıysa tabloyu tazele"""
+        with open(self.file_path, 'rb') as f:
+            current = _identity(os.fstat(f.fileno()))
+            if current != self._identity:
+                self.metadata, table = _read_footer(f)
+                self._set_table(table)
+                self._identity = current
+
+            entry = self._entries[key]
+            start, end = entry["offset"], entry["offset"] + entry["length"]
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return mapped[start:end]
+            except (ValueError, OSError):
+                f.seek(start)
+                return f.read(entry["length"])
+
+    def is_current(self) -> bool:
+        """Dosya son okunan tablodan beri değişmemiş mi"""
+        try:
+            return _identity(self.file_path.stat()) == self._identity
+        except OSError:
+            return False
+
+    def _decode_segment(self, key: str) -> Dict[str, Any]:
+        """Segmenti oku, özetini doğrula ve çöz; bozuksa ValueError"""
+        raw = self._read_segment(key)
+        expected = self._entries[key].get("sha1")
+        if expected and hashlib.sha1(raw).hexdigest() != expected:
+            raise ValueError(f"{key} dönem segmenti özetiyle eşleşmiyor")
+        return decode_semester(raw)
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        if key not in self._decoded:
+            if key not in self._entries:
+                raise KeyError(key)
+            try:
+                self._decoded[key] = self._decode_segment(key)
+            except ValueError as e:
+                # Onarım bir kez denenir; geri yüklenen sürüm de bozuksa hata iletilir
+                on_corrupt, self.on_corrupt = self.on_corrupt, None
+                recovered = on_corrupt(self, e) if on_corrupt else None
+                if recovered is None:
+                    raise
+                self.file_path, self.metadata, self._identity = recovered.file_path, recovered.metadata, recovered._identity
+                self._set_table([recovered._entries[name] for name in recovered._order])
+                return self[key]
+        return self._decoded[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._order))
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @property
+    def decoded_count(self) -> int:
+        """Şu ana kadar çözülen dönem sayısı"""
+        return len(self._decoded)
+
+    def summaries(self) -> List[Dict[str, Any]]:
+        """Dönem adı ve ders sayıları (segment okunmadan)"""
+        return [
+            {"key": key, "name": self._entries[key].get("name") or key, "courses": self._entries[key].get("courses", 0)}
+            for key in self._order
+        ]
+
+    def __repr__(self) -> str:
+        return f"LazySemesterData({self.file_path.name}, {len(self)} dönem, {self.decoded_count} çözüldü)"
@@ -10,6 +10,9 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, List
 from pathlib import Path
 
+from config import SERVER_URL, SESSION_TIMEOUT_HOURS
+from file_io import atomic_write, atomic_write_json, file_lock
+
 
 class SessionManager:
     """Tarayıcı oturumlarını ve çerezleri yönet"""
@@ -21,52 +24,77 @@ class SessionManager:
         self.session_dir.mkdir(exist_ok=True)
         self.cookie_file = self.session_dir / f"{username}_cookies.pkl"
         self.session_info_file = self.session_dir / f"{username}_session.json"
+        # Çerez ve oturum bilgisi dosyaları birlikte değişir; süreçler arası tek kilitle korunur
+        self.lock_file = self.session_dir / f"{username}_session.lock"
     
     def save_cookies(self, driver) -> bool:
         """Selenium sürücüsünden çerezleri kaydet"""
         try:
-            cookies = driver.get_cookies()
-            with open(self.cookie_file, 'wb') as f:
-                pickle.dump(cookies, f)
-            
+            return self.save_cookie_list(driver.get_cookies())
+        except Exception as e:
+            print(f"Cookie kaydetme hatası: {e}")
+            return False
+    
+    def save_cookie_list(self, cookies: List[Dict]) -> bool:
+        """Selenium biçimindeki çerez listesini oturum dosyalarına kaydet"""
+        try:
             # Oturum bilgilerini kaydet
             session_info = {
                 "username": self.username,
                 "saved_at": datetime.now().isoformat(),
-                "expires_at": (datetime.now() + timedelta(hours=2)).isoformat()
+                "expires_at": (datetime.now() + timedelta(hours=SESSION_TIMEOUT_HOURS)).isoformat()
             }
-            with open(self.session_info_file, 'w') as f:
-                json.dump(session_info, f)
+            
+            # Yarım yazılmış çerez dosyası geçerli oturumu bozmasın diye atomik yazılır
+            with file_lock(self.lock_file):
+                atomic_write(self.cookie_file, pickle.dumps(cookies))
+                atomic_write_json(self.session_info_file, session_info)
             
             return True
         except Exception as e:
             print(f"Cookie kaydetme hatası: {e}")
             return False
     
+    def get_saved_cookies(self) -> Optional[List[Dict]]:
+        """Kaydedilmiş çerezleri Selenium formatında döndür (HTTP arka ucu için)"""
+        try:
+            with file_lock(self.lock_file, shared=True):
+                if not self.has_valid_session():
+                    return None
+                
+                with open(self.cookie_file, 'rb') as f:
+                    return pickle.load(f)
+        except Exception as e:
+            print(f"Cookie okuma hatası: {e}")
+            return None
+    
     def load_cookies(self, driver) -> bool:
         """Çerezleri Selenium sürücüsüne yükle"""
         try:
-            if not self.has_valid_session():
+            cookies = self.get_saved_cookies()
+            if cookies is None:
                 return False
             
-            with open(self.cookie_file, 'rb') as f:
-                cookies = pickle.load(f)
-            
-            # Önce alan adına git
-            driver.get("https://ogr.kocaeli.edu.tr")
-            
-            # Çerezleri ekle
-            for cookie in cookies:
-                try:
-                    driver.add_cookie(cookie)
-                except:
-                    continue
-            
-            return True
+            return self.apply_cookies(driver, cookies)
         except Exception as e:
             print(f"Cookie yükleme hatası: {e}")
             return False
     
+    @staticmethod
+    def apply_cookies(driver, cookies: List[Dict]) -> bool:
+        """Çerez listesini bir sürücüye aktar (ör. görünür tarayıcıdan görünmez olana)"""
+        # Önce alan adına git
+        driver.get(SERVER_URL)
+        
+        # Çerezleri ekle
+        for cookie in cookies:
+            try:
+                driver.add_cookie(cookie)
+            except:
+                continue
+        
+        return True
+    
     def has_valid_session(self) -> bool:
         """Geçerli bir kaydedilmiş oturumumuz olup olmadığını kontrol et"""
         if not self.cookie_file.exists() or not self.session_info_file.exists():
@@ -83,7 +111,8 @@ class SessionManager:
     
     def clear_session(self):
         """Kaydedilmiş oturum verilerini temizle"""
-        if self.cookie_file.exists():
-            self.cookie_file.unlink()
-        if self.session_info_file.exists():
-            self.session_info_file.unlink() 
\ No newline at end of file
+        with file_lock(self.lock_file):
+            if self.cookie_file.exists():
+                self.cookie_file.unlink()
+            if self.session_info_file.exists():
+                self.session_info_file.unlink() 
\ No newline at end of file
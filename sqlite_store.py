@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - SQLite Not Deposu
+Kullanıcı verilerini DATA_DIR altındaki tek bir SQLite veritabanında kullanıcı, dönem,
+ders ve aktivite tablolarında tutar; kayıtta yalnızca içeriği değişen dönemler
+tek işlemde (transaction) güncellenir
+
+Kullanım (mevcut JSON ve segmentli kullanıcı dosyalarını tek seferde aktarma):
+    python sqlite_store.py migrate
+"""
+
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from collections.abc import Mapping
+from typing import Dict, Any, Optional, List, Iterable, Tuple
+
+from config import DATA_DIR, SQLITE_DB_FILE
+from logger import internal_progress, user_message, user_success, user_error
+from file_io import file_lock
+from data_codec import unpack
+from segment_store import LazySemesterData
+
+# Veri sürümü (JSON metadata ile aynı)
+DATA_VERSION = "6.1.4"
+
+COURSE_COLUMNS = (
+    "sequence", "code", "name", "attendance", "language", "ects",
+    "yio", "yys", "but", "bn", "bd", "instructor"
+)
+ACTIVITY_COLUMNS = ("activity_type", "score", "percentage", "semester_effect")
+
+# Her sürüm bir öncekinin üzerine uygulanır; PRAGMA user_version uygulanan son sürümü tutar.
+# Yarıda kalmış bir yükseltme yeniden uygulanabilsin diye adımlar IF NOT EXISTS kullanır
+MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY,
+        user_hash TEXT NOT NULL UNIQUE,
+        username TEXT NOT NULL,
+        last_updated REAL,
+        version TEXT,
+        data_size INTEGER NOT NULL DEFAULT 0
+    );
+
+    CREATE TABLE IF NOT EXISTS semesters (
+        id INTEGER PRIMARY KEY,
+        user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+        semester_key TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        semester_name TEXT,
+        frozen INTEGER,
+        extra TEXT,
+        content_hash TEXT NOT NULL,
+        content_size INTEGER NOT NULL DEFAULT 0,
+        course_count INTEGER NOT NULL DEFAULT 0,
+        updated_at REAL,
+        UNIQUE (user_id, semester_key)
+    );
+    CREATE INDEX IF NOT EXISTS idx_semesters_user ON semesters(user_id, position);
+
+    CREATE TABLE IF NOT EXISTS courses (
+        id INTEGER PRIMARY KEY,
+        semester_id INTEGER NOT NULL REFERENCES semesters(id) ON DELETE CASCADE,
+        position INTEGER NOT NULL,
+        sequence TEXT, code TEXT NOT NULL, name TEXT, attendance TEXT, language TEXT, ects TEXT,
+        yio TEXT, yys TEXT, but TEXT, bn TEXT, bd TEXT, instructor TEXT,
+        semester_average TEXT,
+        extra TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_courses_semester ON courses(semester_id, position);
+    CREATE INDEX IF NOT EXISTS idx_courses_code ON courses(code);
+
+    CREATE TABLE IF NOT EXISTS activities (
+        id INTEGER PRIMARY KEY,
+        course_id INTEGER NOT NULL REFERENCES courses(id) ON DELETE CASCADE,
+        position INTEGER NOT NULL,
+        activity_type TEXT, score TEXT, percentage TEXT, semester_effect TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_activities_course ON activities(course_id, position);
+    """
+]
+
+
+def username_hash(username: str) -> str:
+    """JSON dosya adlarıyla aynı kısa kullanıcı özeti"""
+    return hashlib.md5(username.encode()).hexdigest()[:12]
+
+
+def _semester_digest(semester_data: Dict[str, Any]) -> Tuple[str, int]:
+    """Dönem içeriğinin kararlı özeti ve boyutu (değişmeyen dönemler yeniden yazılmaz)"""
+    canonical = json.dumps(semester_data, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha1(canonical).hexdigest(), len(canonical)
+
+
+class SQLiteStore:
+    """Kullanıcı verileri için SQLite deposu
+
+    Her işlem kendi bağlantısını açar; böylece toplu toplamadaki iş parçacıkları ve ayrı
+    süreçler (CLI, servis) aynı veritabanını WAL kipinde güvenle paylaşır.
+    """
+
+    _migrated_paths = set()
+    _migration_lock = threading.Lock()
+
+    def __init__(self, db_path: Path = SQLITE_DB_FILE):
+        self.db_path = Path(db_path)
+
+    @contextmanager
+    def _connect(self):
+        """Şeması güncel bir bağlantı aç; blok hatasız biterse işlemi onayla"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._ensure_schema(conn)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _ensure_schema(self, conn: sqlite3.Connection):
+        """Eksik şema sürümlerini uygula (süreç başına bir kez kontrol edilir, süreçler arası kilitle)"""
+        key = str(self.db_path.resolve())
+        if key in self._migrated_paths:
+            return
+
+        # Süreç içi kilit iş parçacıklarını, kilit dosyası aynı veritabanını ilk kez açan
+        # süreçleri (servis, CLI, toplu toplama) sıralar; sürüm kilit alındıktan sonra okunur
+        with self._migration_lock, file_lock(self.db_path.with_name(self.db_path.name + ".lock")):
+            conn.execute("PRAGMA journal_mode = WAL")
+            current = conn.execute("PRAGMA user_version").fetchone()[0]
+            for version, script in enumerate(MIGRATIONS[current:], start=current + 1):
+                internal_progress(f"SQLite şeması sürüm {version}'e yükseltiliyor...")
+                conn.executescript(f"BEGIN; {script} PRAGMA user_version = {version}; COMMIT;")
+            self._migrated_paths.add(key)
+
+    @staticmethod
+    def _user_id(conn: sqlite3.Connection, username: str) -> Optional[int]:
+        row = conn.execute("SELECT id FROM users WHERE user_hash = ?", (username_hash(username),)).fetchone()
+        return row[0] if row else None
+
+    def save(self, username: str, data: Dict[str, Any]) -> int:
+        """Verileri tek işlemde kaydet; yalnızca değişen dönemleri yazar, değişen dönem sayısını döndürür"""
+        changed = 0
+        now = time.time()
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO users (user_hash, username, last_updated, version) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(user_hash) DO UPDATE SET username = excluded.username, "
+                "last_updated = excluded.last_updated, version = excluded.version",
+                (username_hash(username), username, now, DATA_VERSION)
+            )
+            user_id = self._user_id(conn, username)
+
+            stored = {
+                key: (semester_id, content_hash)
+                for semester_id, key, content_hash in conn.execute(
+                    "SELECT id, semester_key, content_hash FROM semesters WHERE user_id = ?", (user_id,)
+                )
+            }
+
+            for position, (key, semester_data) in enumerate(data.items()):
+                content_hash, content_size = _semester_digest(semester_data)
+                existing = stored.pop(key, None)
+
+                if existing and existing[1] == content_hash:
+                    conn.execute("UPDATE semesters SET position = ? WHERE id = ?", (position, existing[0]))
+                    continue
+
+                if existing:
+                    # Eski dersler ve aktiviteler ON DELETE CASCADE ile silinir
+                    conn.execute("DELETE FROM semesters WHERE id = ?", (existing[0],))
+                self._insert_semester(conn, user_id, key, position, semester_data, content_hash, content_size, now)
+                changed += 1
+
+            # Sunucudan artık gelmeyen dönemler
+            for semester_id, _ in stored.values():
+                conn.execute("DELETE FROM semesters WHERE id = ?", (semester_id,))
+                changed += 1
+
+            conn.execute(
+                "UPDATE users SET data_size = (SELECT COALESCE(SUM(content_size), 0) FROM semesters WHERE user_id = ?) "
+                "WHERE id = ?", (user_id, user_id)
+            )
+
+        return changed
+
+    @staticmethod
+    def _insert_semester(conn: sqlite3.Connection, user_id: int, key: str, position: int,
+                         semester_data: Dict[str, Any], content_hash: str, content_size: int, now: float):
+        """Bir dönemi dersleri ve aktiviteleriyle ekle"""
+        courses = semester_data.get("courses", [])
+        extra = {k: v for k, v in semester_data.items() if k not in ("semester_name", "courses", "frozen")}
+        frozen = semester_data.get("frozen")
+
+        semester_id = conn.execute(
+            "INSERT INTO semesters (user_id, semester_key, position, semester_name, frozen, extra, "
+            "content_hash, content_size, course_count, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (user_id, key, position, semester_data.get("semester_name"),
+             None if frozen is None else int(bool(frozen)),
+             json.dumps(extra, ensure_ascii=False) if extra else None,
+             content_hash, content_size, len(courses), now)
+        ).lastrowid
+
+        known = set(COURSE_COLUMNS) | {"activities", "semester_average"}
+        for course_position, course in enumerate(courses):
+            extra = {k: v for k, v in course.items() if k not in known}
+            course_id = conn.execute(
+                f"INSERT INTO courses (semester_id, position, {', '.join(COURSE_COLUMNS)}, semester_average, extra) "
+                f"VALUES ({', '.join('?' * (len(COURSE_COLUMNS) + 4))})",
+                (semester_id, course_position, *(course.get(column, "") for column in COURSE_COLUMNS),
+                 course.get("semester_average", ""), json.dumps(extra, ensure_ascii=False) if extra else None)
+            ).lastrowid
+
+            conn.executemany(
+                f"INSERT INTO activities (course_id, position, {', '.join(ACTIVITY_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (course_id, activity_position, *(activity.get(column, "") for column in ACTIVITY_COLUMNS))
+                    for activity_position, activity in enumerate(course.get("activities") or [])
+                ]
+            )
+
+    def load(self, username: str, semester_keys: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+        """Kullanıcı verilerini (isteğe bağlı yalnızca belirli dönemleri) menü sırasıyla yükle"""
+        with self._connect() as conn:
+            user_id = self._user_id(conn, username)
+            if user_id is None:
+                return None
+
+            query = "SELECT id, semester_key, semester_name, frozen, extra FROM semesters WHERE user_id = ?"
+            params: List[Any] = [user_id]
+            if semester_keys is not None:
+                semester_keys = list(semester_keys)
+                query += f" AND semester_key IN ({', '.join('?' * len(semester_keys))})"
+                params.extend(semester_keys)
+            semesters = conn.execute(query + " ORDER BY position", params).fetchall()
+            if not semesters:
+                return {} if semester_keys is not None else None
+
+            semester_ids = [row[0] for row in semesters]
+            placeholders = ', '.join('?' * len(semester_ids))
+
+            activities: Dict[int, List[Dict[str, str]]] = {}
+            for row in conn.execute(
+                f"SELECT a.course_id, {', '.join('a.' + column for column in ACTIVITY_COLUMNS)} FROM activities a "
+                f"JOIN courses c ON c.id = a.course_id WHERE c.semester_id IN ({placeholders}) "
+                f"ORDER BY a.course_id, a.position", semester_ids
+            ):
+                activities.setdefault(row[0], []).append(dict(zip(ACTIVITY_COLUMNS, row[1:])))
+
+            courses: Dict[int, List[Dict[str, Any]]] = {}
+            for row in conn.execute(
+                f"SELECT semester_id, id, {', '.join(COURSE_COLUMNS)}, semester_average, extra FROM courses "
+                f"WHERE semester_id IN ({placeholders}) ORDER BY semester_id, position", semester_ids
+            ):
+                course = dict(zip(COURSE_COLUMNS, row[2:2 + len(COURSE_COLUMNS)]))
+                course["activities"] = activities.get(row[1], [])
+                course["semester_average"] = row[-2]
+                if row[-1]:
+                    course.update(json.loads(row[-1]))
+                courses.setdefault(row[0], []).append(course)
+
+        data = {}
+        for semester_id, key, name, frozen, extra in semesters:
+            semester_data = {"semester_name": name, "courses": courses.get(semester_id, [])}
+            if frozen is not None:
+                semester_data["frozen"] = bool(frozen)
+            if extra:
+                semester_data.update(json.loads(extra))
+            data[key] = semester_data
+        return data
+
+    def has(self, username: str) -> bool:
+        """Kullanıcının kayıtlı dönemi var mı"""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT 1 FROM semesters s JOIN users u ON u.id = s.user_id WHERE u.user_hash = ? LIMIT 1",
+                (username_hash(username),)
+            ).fetchone() is not None
+
+    def info(self, username: str) -> Optional[Dict[str, Any]]:
+        """get_user_data_info ile aynı biçimde özet (yalnızca özet sütunlarından)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT u.last_updated, u.version, u.data_size, COUNT(s.id), COALESCE(SUM(s.course_count), 0) "
+                "FROM users u LEFT JOIN semesters s ON s.user_id = u.id WHERE u.user_hash = ? GROUP BY u.id",
+                (username_hash(username),)
+            ).fetchone()
+            semesters = conn.execute(
+                "SELECT s.semester_key, s.semester_name, s.course_count, s.frozen FROM semesters s "
+                "JOIN users u ON u.id = s.user_id WHERE u.user_hash = ? ORDER BY s.position",
+                (username_hash(username),)
+            ).fetchall()
+
+        if row is None or not row[3]:
+            return None
+
+        last_updated, version, data_size, total_semesters, total_courses = row
+        return {
+            "file_size": data_size,
+            "last_modified": last_updated,
+            "last_updated": last_updated,
+            "version": version,
+            "total_semesters": total_semesters,
+            "total_courses": total_courses,
+            "semesters": [
+                {"key": key, "name": name or "", "courses": courses, "frozen": bool(frozen)}
+                for key, name, courses, frozen in semesters
+            ]
+        }
+
+    def clear(self, username: str) -> bool:
+        """Kullanıcıyı ve tüm verilerini sil"""
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM users WHERE user_hash = ?", (username_hash(username),)).rowcount > 0
+
+    def import_json_file(self, file_path: Path) -> Optional[str]:
+        """Eski user_<hash>.json veya user_<hash>.seg dosyasını aktar ve .migrated olarak yeniden
+        adlandır; kullanıcı adını döndür"""
+        file_path = Path(file_path)
+        # Aktarım sürerken aynı kullanıcı dosyası başka bir süreçte yeniden yazılmasın
+        with file_lock(file_path.with_suffix(".lock")):
+            metadata, semesters = _read_legacy_file(file_path)
+
+            username = metadata.get("username") if isinstance(metadata, dict) else None
+            if not username or not isinstance(semesters, Mapping):
+                internal_progress(f"Aktarılamadı (kullanıcı adı veya dönem yok): {file_path.name}")
+                return None
+
+            self.save(username, semesters)
+
+            # Son güncelleme zamanı dosyadaki değer olarak korunur
+            last_updated = metadata.get("last_updated")
+            if last_updated:
+                with self._connect() as conn:
+                    conn.execute("UPDATE users SET last_updated = ? WHERE user_hash = ?",
+                                 (last_updated, username_hash(username)))
+
+            file_path.rename(file_path.with_name(file_path.name + ".migrated"))
+            # Özet dizini artık var olmayan dosyayı tarif eder
+            file_path.with_name(file_path.stem + ".idx.json").unlink(missing_ok=True)
+        return username
+
+    def migrate_json(self, data_dir: Path = DATA_DIR) -> int:
+        """DATA_DIR'daki tüm JSON ve segmentli kullanıcı dosyalarını tek seferde aktar"""
+        migrated = 0
+        for file_path in sorted(legacy_user_files(data_dir)):
+            try:
+                if self.import_json_file(file_path):
+                    migrated += 1
+            except (OSError, ValueError, sqlite3.Error) as e:
+                user_error(f"{file_path.name} aktarılamadı: {e}")
+        return migrated
+
+
+def legacy_user_files(data_dir) -> List[Path]:
+    """Dosya tabanlı depolamanın kullanıcı veri dosyaları (özet dizinleri hariç)"""
+    data_dir = Path(data_dir)
+    files = [path for path in data_dir.glob("user_*.json") if not path.name.endswith(".idx.json")]
+    return files + list(data_dir.glob("user_*.seg"))
+
+
+def _read_legacy_file(file_path: Path) -> Tuple[Dict[str, Any], Any]:
+    """Kullanıcı dosyasının metadata'sını ve dönemlerini oku; segmentli dosyada dönemler
+    aktarım sırasında tek tek çözülür"""
+    if file_path.suffix == ".seg":
+        semesters = LazySemesterData.open(file_path)
+        return semesters.metadata, semesters
+
+    # Sıkı kodlanmış (KOUB1) veya eski düz JSON; biçim başlıktan tanınır
+    payload = unpack(file_path.read_bytes())
+    if not isinstance(payload, dict):
+        return {}, None
+    return payload.get("metadata") or {}, payload.get("semesters")
+
+
+def get_store(data_dir) -> SQLiteStore:
+    """Verilen veri dizinindeki depo (varsayılan dizinde SQLITE_DB_FILE)"""
+    if Path(data_dir).resolve() == Path(DATA_DIR).resolve():
+        return SQLiteStore(SQLITE_DB_FILE)
+    return SQLiteStore(Path(data_dir) / SQLITE_DB_FILE.name)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    if not args or args[0] != "migrate":
+        print("Kullanım: python sqlite_store.py migrate [veri_dizini]")
+        return 1
+
+    data_dir = Path(args[1]) if len(args) > 1 else DATA_DIR
+    store = get_store(data_dir)
+    user_message(f"JSON dosyaları {store.db_path} veritabanına aktarılıyor...")
+    migrated = store.migrate_json(data_dir)
+    user_success(f"{migrated} kullanıcı aktarıldı")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,9 +9,21 @@ import sys
 # Üretim modunu etkinleştir
 os.environ['KOU_PRODUCTION'] = 'true'
 
+# Servis komutları: python start.py daemon start|status|refresh|stop
+DAEMON_COMMAND = 'daemon'
+# Toplu toplama: python start.py batch hesaplar.txt [--workers N]
+BATCH_COMMAND = 'batch'
+
 # Ana programı başlat
 if __name__ == '__main__':
     try:
+        if len(sys.argv) > 1 and sys.argv[1] == DAEMON_COMMAND:
+            from collector_daemon import main as daemon_main
+            sys.exit(daemon_main(sys.argv[2:]))
+        if len(sys.argv) > 1 and sys.argv[1] == BATCH_COMMAND:
+            from batch_collector import main as batch_main
+            sys.exit(batch_main(sys.argv[2:]))
+        
         from kou_main import main
         main()
     except ImportError as e:
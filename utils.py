@@ -10,9 +10,14 @@ import json
 import hashlib
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from collections.abc import Mapping
+from typing import Dict, Any, Optional, List
 
-from logger import internal_progress, user_success, user_error
+from config import STORAGE_ENGINE, DATA_LAYOUT, DATA_FORMAT, DATA_COMPRESSION
+from data_codec import pack, unpack
+from file_io import atomic_write, atomic_write_json, backup_path, file_lock
+from logger import internal_progress, user_success, user_error, user_warning
+from segment_store import MAGIC as SEGMENT_MAGIC, LazySemesterData, write_segmented, read_footer
 
 
 def clean_text(text: str) -> str:
@@ -52,28 +57,221 @@ def get_data_file_path(username: str, data_dir: str) -> Path:
     return file_path
 
 
+def get_segment_file_path(username: str, data_dir: str) -> Path:
+    """Segmentli düzendeki veri dosyası (user_<hash>.seg)"""
+    return get_data_file_path(username, data_dir).with_suffix(".seg")
+
+
+def get_active_data_file(username: str, data_dir: str) -> Path:
+    """Kullanıcının mevcut veri dosyası: segmentli dosya varsa o, yoksa JSON dosyası"""
+    segment_path = get_segment_file_path(username, data_dir)
+    return segment_path if segment_path.exists() else get_data_file_path(username, data_dir)
+
+
+def get_index_file_path(username: str, data_dir: str) -> Path:
+    """Veri dosyasının özetini tutan küçük dizin dosyası (user_<hash>.idx.json)"""
+    data_path = get_data_file_path(username, data_dir)
+    return data_path.with_name(data_path.stem + ".idx.json")
+
+
+def get_lock_path(username: str, data_dir: str) -> Path:
+    """Kullanıcının veri dosyalarına süreçler arası erişimi sıralayan kilit dosyası (user_<hash>.lock)"""
+    return get_data_file_path(username, data_dir).with_suffix(".lock")
+
+
+def write_data_index(username: str, data: Dict[str, Any], metadata: Dict[str, Any], data_file: Path,
+                     content_hash: str, segments: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Veri dosyası yazıldıktan sonra özet dizinini yaz (dosya boyutu ve zamanıyla eşlenir)
+
+    Segmentli düzende dönem girdileri segment konumlarını da taşır; yükleme yalnızca bu dizini okur.
+    """
+    stat = data_file.stat()
+    index = {
+        **metadata,
+        "content_hash": content_hash,
+        "data_size": stat.st_size,
+        "data_mtime": stat.st_mtime,
+        "layout": "segmented" if segments is not None else "monolithic",
+        "semesters": segments if segments is not None else [
+            {
+                "key": key,
+                "name": semester_data.get("semester_name", ""),
+                "courses": len(semester_data.get("courses", [])),
+                "frozen": bool(semester_data.get("frozen"))
+            }
+            for key, semester_data in data.items()
+        ]
+    }
+    
+    atomic_write_json(get_index_file_path(username, data_file.parent), index, separators=(',', ':'))
+    return index
+
+
+def read_data_index(username: str, data_dir: str) -> Optional[Dict[str, Any]]:
+    """Özet dizinini oku; veri dosyasıyla eşleşmiyorsa (eski sürüm veya dışarıdan değişiklik) None"""
+    try:
+        with open(get_index_file_path(username, data_dir), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        stat = get_active_data_file(username, data_dir).stat()
+    except (OSError, ValueError):
+        return None
+    
+    if index.get("data_size") != stat.st_size or index.get("data_mtime") != stat.st_mtime:
+        return None
+    return index
+
+
+def _remove_data_index(username: str, data_dir: str) -> None:
+    try:
+        get_index_file_path(username, data_dir).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def get_checkpoint_path(username: str, data_dir: str) -> Path:
+    """Yarıda kalan toplamanın dönem bazlı kontrol noktası dosyası"""
+    username_hash = hashlib.md5(username.encode()).hexdigest()[:12]
+    return ensure_data_directory(data_dir) / f"checkpoint_{username_hash}.jsonl"
+
+
+def checkpoint_plan(semester_keys: List[str]) -> str:
+    """Toplanacak dönem listesinin imzası; kontrol noktası yalnızca aynı listeyle sürdürülür"""
+    return hashlib.sha1("\n".join(semester_keys).encode('utf-8')).hexdigest()[:16]
+
+
+def append_checkpoint(username: str, semester_key: str, semester_data: Dict[str, Any], data_dir: str,
+                      plan: Optional[str] = None) -> bool:
+    """Toplanan bir dönemi kontrol noktasına ekle (satır başına bir dönem, hemen diske yazılır)"""
+    try:
+        line = json.dumps({"key": semester_key, "plan": plan, "at": time.time(), "data": semester_data},
+                          ensure_ascii=False, separators=(',', ':'))
+        with open(get_checkpoint_path(username, data_dir), 'a', encoding='utf-8') as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        return True
+    except Exception as e:
+        internal_progress(f"Kontrol noktası yazılamadı: {e}")
+        return False
+
+
+def load_checkpoint(username: str, data_dir: str, max_age: float, plan: Optional[str] = None) -> Dict[str, Any]:
+    """Kontrol noktasındaki dönemleri oku; max_age saniyeden eskiyse veya başka bir dönem
+    listesiyle (plan) yazılmışsa yok say ve sil"""
+    try:
+        file_path = get_checkpoint_path(username, data_dir)
+        if not file_path.exists():
+            return {}
+        
+        semesters, started, matches = {}, None, True
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    semesters[entry["key"]] = entry["data"]
+                    started = entry["at"] if started is None else started
+                    matches = matches and entry.get("plan") == plan
+                except (ValueError, KeyError, TypeError):
+                    # Çökme anında yarım kalmış son satır
+                    continue
+        
+        if started is None or not matches or time.time() - started > max_age:
+            clear_checkpoint(username, data_dir)
+            return {}
+        
+        return semesters
+        
+    except Exception as e:
+        internal_progress(f"Kontrol noktası okunamadı: {e}")
+        return {}
+
+
+def clear_checkpoint(username: str, data_dir: str) -> None:
+    """Kontrol noktasını sil (tam veri kaydedildikten sonra)"""
+    try:
+        get_checkpoint_path(username, data_dir).unlink()
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        internal_progress(f"Kontrol noktası silinemedi: {e}")
+
+
+def _sqlite_store(username: str, data_dir: str):
+    """SQLite deposu; kullanıcının eski JSON veya segmentli dosyası varsa ilk erişimde depoya aktarılır"""
+    from sqlite_store import get_store
+    
+    store = get_store(data_dir)
+    for legacy_path in (get_segment_file_path(username, data_dir), get_data_file_path(username, data_dir)):
+        if not legacy_path.exists():
+            continue
+        try:
+            store.import_json_file(legacy_path)
+            internal_progress(f"Dosya verisi SQLite deposuna aktarıldı: {legacy_path.name}")
+        except Exception as e:
+            internal_progress(f"Dosya verisi aktarılamadı: {e}")
+    return store
+
+
+def _save_user_data_sqlite(username: str, data: Dict[str, Any], data_dir: str) -> bool:
+    """Yalnızca değişen dönemleri tek işlemde SQLite deposuna yaz"""
+    try:
+        start_time = time.time()
+        changed = _sqlite_store(username, data_dir).save(username, data)
+        
+        internal_progress(f"💾 SQLite: {changed}/{len(data)} dönem güncellendi ({time.time() - start_time:.2f}s)")
+        user_success(f"Veriler kaydedildi: {changed} dönem güncellendi")
+        clear_checkpoint(username, data_dir)
+        return True
+        
+    except Exception as e:
+        user_error(f"Veri kaydetme hatası: {e}")
+        return False
+
+
 def save_user_data(username: str, data: Dict[str, Any], data_dir: str) -> bool:
     """Yüksek performans optimizasyonları ile kullanıcı verilerini kaydet"""
+    if STORAGE_ENGINE == "sqlite":
+        return _save_user_data_sqlite(username, data, data_dir)
+    
     try:
         file_path = get_data_file_path(username, data_dir)
+        segment_path = get_segment_file_path(username, data_dir)
         
         # Performans takibi için metadata ekle
-        optimized_data = {
-            "metadata": {
-                "username": username,
-                "last_updated": time.time(),
-                "version": "6.1.4",
-                "total_semesters": len(data),
-                "total_courses": sum(len(semester_data.get("courses", [])) for semester_data in data.values())
-            },
-            "semesters": data
+        metadata = {
+            "username": username,
+            "last_updated": time.time(),
+            "version": "6.1.4",
+            "total_semesters": len(data),
+            "total_courses": sum(len(semester_data.get("courses", [])) for semester_data in data.values())
         }
         
-        # Hızlı JSON serileştirme
+        # Sıkı kodlama (veya okunabilir JSON) ile serileştirme
         start_time = time.time()
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(optimized_data, f, ensure_ascii=False, indent=2, separators=(',', ':'))
+        # Aynı kullanıcı için başka bir süreç (CLI, servis, toplu toplama) yazıyorsa beklenir;
+        # dosya atomik olarak değişir ve önceki sürüm .bak olarak kalır
+        with file_lock(get_lock_path(username, data_dir)):
+            if DATA_LAYOUT == "segmented":
+                # Dönem başına segment: yükleyici yalnızca istenen dönemi çözer
+                payload, segments = write_segmented(segment_path, data, metadata, DATA_FORMAT, DATA_COMPRESSION,
+                                                    keep_backup=True)
+                stale_path, file_path = file_path, segment_path
+            else:
+                optimized_data = {"metadata": metadata, "semesters": dict(data)}
+                if DATA_FORMAT == "compact":
+                    payload = pack(optimized_data, DATA_COMPRESSION)
+                else:
+                    payload = json.dumps(optimized_data, ensure_ascii=False, indent=2, separators=(',', ':')).encode('utf-8')
+                atomic_write(file_path, payload, keep_backup=True)
+                segments, stale_path = None, segment_path
+            
+            # Diğer düzendeki eski dosya kalırsa yükleyici onu seçebilir
+            if stale_path.exists():
+                stale_path.unlink()
+            
+            # Özet bilgisi için veri dosyasını bir daha açmaya gerek kalmasın
+            write_data_index(username, data, metadata, file_path, hashlib.sha1(payload).hexdigest(), segments)
         
         save_time = time.time() - start_time
         file_size = file_path.stat().st_size
@@ -81,6 +279,9 @@ def save_user_data(username: str, data: Dict[str, Any], data_dir: str) -> bool:
         internal_progress(f"💾 Veri kaydedildi: {file_size/1024:.1f}KB ({save_time:.2f}s)")
         user_success(f"Veriler kaydedildi: {file_path.name}")
         
+        # Tam veri diskte: yarıda kalan toplamaya dönmeye gerek yok
+        clear_checkpoint(username, data_dir)
+        
         return True
         
     except Exception as e:
@@ -90,50 +291,142 @@ def save_user_data(username: str, data: Dict[str, Any], data_dir: str) -> bool:
 
 def load_user_data(username: str, data_dir: str) -> Optional[Dict[str, Any]]:
     """Önbellekleme ve doğrulama ile kullanıcı verilerini yükle"""
-    try:
-        file_path = get_data_file_path(username, data_dir)
-        
-        if not file_path.exists():
-            return None
-        
-        # Boyut kontrolü ile hızlı yükleme
-        file_size = file_path.stat().st_size
-        if file_size == 0:
-            internal_progress("Boş veri dosyası siliniyor...")
-            file_path.unlink()
+    if STORAGE_ENGINE == "sqlite":
+        try:
+            start_time = time.time()
+            data = _sqlite_store(username, data_dir).load(username)
+            if data:
+                internal_progress(f"📂 SQLite: {len(data)} dönem yüklendi ({time.time() - start_time:.3f}s)")
+            return data
+        except Exception as e:
+            internal_progress(f"Veri yükleme hatası: {e}")
             return None
+    
+    try:
+        # Okurlar paylaşımlı kilitle birbirini beklemez, yalnızca yazım sürerken beklenir
+        with file_lock(get_lock_path(username, data_dir), shared=True):
+            file_path = get_active_data_file(username, data_dir)
+            
+            if not file_path.exists():
+                return None
+            
+            try:
+                return _read_data_file(username, data_dir, file_path)
+            except (ValueError, KeyError, TypeError) as e:
+                error = e
         
-        start_time = time.time()
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        load_time = time.time() - start_time
+        return _recover_locked(username, data_dir, error)
         
-        # Veri yapısını doğrula
-        if not isinstance(data, dict) or "semesters" not in data:
-            internal_progress("Geçersiz veri formatı, siliniyor...")
-            file_path.unlink()
+    except Exception as e:
+        internal_progress(f"Veri yükleme hatası: {e}")
+        return None
+
+
+def _recover_locked(username: str, data_dir: str, error: Exception) -> Optional[Dict[str, Any]]:
+    """Özel kilitle dosyayı yeniden dene, hâlâ okunamıyorsa son sağlam nesle dön"""
+    # Paylaşımlı kilit yükseltilemez: bırakılıp özel kilit alınır; bu arada başka bir süreç
+    # dosyayı yeniden yazmış olabileceğinden onarımdan önce bir kez daha okunur
+    with file_lock(get_lock_path(username, data_dir)):
+        file_path = get_active_data_file(username, data_dir)
+        if not file_path.exists():
             return None
         
-        # Metadata kontrol et
-        metadata = data.get("metadata", {})
-        total_semesters = metadata.get("total_semesters", 0)
-        total_courses = metadata.get("total_courses", 0)
-        
-        internal_progress(f"📂 Veri yüklendi: {file_size/1024:.1f}KB, {total_semesters} dönem, {total_courses} ders ({load_time:.3f}s)")
-        
-        return data["semesters"]
+        try:
+            return _read_data_file(username, data_dir, file_path)
+        except (ValueError, KeyError, TypeError) as e:
+            return _recover_data_file(username, data_dir, file_path, e)
+
+
+def _read_data_file(username: str, data_dir: str, file_path: Path) -> Dict[str, Any]:
+    """Veri dosyasını oku; boş, yarım veya bozuksa ValueError/KeyError fırlatır"""
+    # Boyut kontrolü ile hızlı yükleme
+    file_size = file_path.stat().st_size
+    if file_size == 0:
+        raise ValueError("boş veri dosyası")
+    
+    start_time = time.time()
+    
+    if file_path.suffix == ".seg":
+        # Yalnızca segment tablosu okunur (özet dizininden, yoksa dosya sonundan); segment
+        # özetleri dönem ilk okunduğunda doğrulanır, bozuksa son sağlam nesle dönülür
+        index = read_data_index(username, data_dir)
+        segments = index.get("semesters") if index and index.get("layout") == "segmented" else None
+        lazy_data = LazySemesterData.open(file_path, segments, index,
+                                          on_corrupt=lambda lazy, error: _recover_segment(username, data_dir, lazy, error))
         
+        internal_progress(f"📂 Veri dizini yüklendi: {file_size/1024:.1f}KB, {len(lazy_data)} dönem "
+                          f"(dönemler ilk erişimde çözülür, {time.time() - start_time:.3f}s)")
+        return lazy_data
+    
+    # Biçim dosya başlığından tanınır: sıkı kodlama veya eski düz JSON
+    data = unpack(file_path.read_bytes())
+    
+    load_time = time.time() - start_time
+    
+    # Veri yapısını doğrula
+    if not isinstance(data, dict) or not isinstance(data.get("semesters"), dict):
+        raise ValueError("beklenen veri yapısı yok")
+    
+    # Metadata kontrol et
+    metadata = data.get("metadata", {})
+    total_semesters = metadata.get("total_semesters", 0)
+    total_courses = metadata.get("total_courses", 0)
+    
+    internal_progress(f"📂 Veri yüklendi: {file_size/1024:.1f}KB, {total_semesters} dönem, {total_courses} ders ({load_time:.3f}s)")
+    
+    return data["semesters"]
+
+
+def _recover_segment(username: str, data_dir: str, lazy: LazySemesterData,
+                     error: Exception) -> Optional[LazySemesterData]:
+    """Tembel okumada bozuk çıkan segment için onarım; segmentli veri dönmezse None"""
+    try:
+        with file_lock(get_lock_path(username, data_dir)):
+            file_path = lazy.file_path
+            if not file_path.exists():
+                return None
+            # Bu arada başka bir süreç dosyayı yeniden yazdıysa onarım yerine yeni dosya okunur
+            if lazy.is_current():
+                recovered = _recover_data_file(username, data_dir, file_path, error)
+            else:
+                recovered = _read_data_file(username, data_dir, file_path)
     except Exception as e:
-        internal_progress(f"Veri yükleme hatası: {e}")
+        internal_progress(f"Veri onarılamadı: {e}")
+        return None
+    return recovered if isinstance(recovered, LazySemesterData) else None
+
+
+def _recover_data_file(username: str, data_dir: str, file_path: Path, error: Exception) -> Optional[Dict[str, Any]]:
+    """Bozuk dosyayı silmeden kenara al ve son sağlam nesle (.bak) dön; tam yeniden toplama gerekmesin"""
+    corrupt_path = file_path.with_name(file_path.name + ".corrupt")
+    os.replace(file_path, corrupt_path)
+    _remove_data_index(username, data_dir)
+    
+    backup = backup_path(file_path)
+    if not backup.exists():
+        user_warning(f"Veri dosyası okunamadı ({error}); {corrupt_path.name} olarak saklandı, yedek yok")
         return None
+    
+    try:
+        atomic_write(file_path, backup.read_bytes())
+        data = _read_data_file(username, data_dir, file_path)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        internal_progress(f"Yedek de okunamadı: {e}")
+        file_path.unlink(missing_ok=True)
+        user_warning(f"Veri dosyası okunamadı ({error}); {corrupt_path.name} olarak saklandı, yedek de bozuk")
+        return None
+    
+    user_warning(f"Veri dosyası okunamadı ({error}); son sağlam sürüm geri yüklendi, sonraki güncelleme eksikleri tamamlar")
+    return data
 
 
 def has_user_data(username: str, data_dir: str) -> bool:
     """Kullanıcının önbelleğe alınmış verisi olup olmadığını hızlıca kontrol et"""
     try:
-        file_path = get_data_file_path(username, data_dir)
+        if STORAGE_ENGINE == "sqlite":
+            return _sqlite_store(username, data_dir).has(username)
+        
+        file_path = get_active_data_file(username, data_dir)
         return file_path.exists() and file_path.stat().st_size > 0
     except:
         return False
@@ -142,63 +435,162 @@ def has_user_data(username: str, data_dir: str) -> bool:
 def get_user_data_info(username: str, data_dir: str) -> Optional[Dict[str, Any]]:
     """Kullanıcının önbelleğe alınmış verisi hakkında hızlı bilgi al"""
     try:
-        file_path = get_data_file_path(username, data_dir)
+        if STORAGE_ENGINE == "sqlite":
+            return _sqlite_store(username, data_dir).info(username)
+        
+        file_path = get_active_data_file(username, data_dir)
         
         if not file_path.exists():
             return None
         
         stat = file_path.stat()
         
-        # Tam dosyayı yüklemeden metadata okumaya çalış
-        with open(file_path, 'r', encoding='utf-8') as f:
-            # Metadata'yı almak için sadece başlangıcı oku
-            chunk = f.read(512)
-            if '"metadata"' in chunk:
-                f.seek(0)
-                try:
-                    data = json.load(f)
-                    metadata = data.get("metadata", {})
-                    
-                    return {
-                        "file_size": stat.st_size,
-                        "last_modified": stat.st_mtime,
-                        "last_updated": metadata.get("last_updated"),
-                        "version": metadata.get("version"),
-                        "total_semesters": metadata.get("total_semesters", 0),
-                        "total_courses": metadata.get("total_courses", 0)
-                    }
-                except:
-                    pass
-        
-        # Yedek bilgi
+        # Yalnızca küçük dizin dosyası okunur; dizinsiz eski dosyalar için bir kez oluşturulur
+        index = read_data_index(username, data_dir) or _rebuild_data_index(username, file_path)
+        if index is None:
+            return {
+                "file_size": stat.st_size,
+                "last_modified": stat.st_mtime,
+                "total_semesters": "bilinmiyor",
+                "total_courses": "bilinmiyor"
+            }
+        
         return {
             "file_size": stat.st_size,
             "last_modified": stat.st_mtime,
-            "total_semesters": "bilinmiyor",
-            "total_courses": "bilinmiyor"
+            "last_updated": index.get("last_updated"),
+            "version": index.get("version"),
+            "total_semesters": index.get("total_semesters", 0),
+            "total_courses": index.get("total_courses", 0),
+            "semesters": index.get("semesters", []),
+            "content_hash": index.get("content_hash")
         }
         
     except:
         return None
 
 
+def _rebuild_data_index(username: str, file_path: Path) -> Optional[Dict[str, Any]]:
+    """Dizini olmayan veya dizini eskimiş veri dosyasını bir kez okuyup dizinini yaz"""
+    try:
+        raw = file_path.read_bytes()
+        
+        if raw.startswith(SEGMENT_MAGIC):
+            # Segment tablosu dönem özetlerini zaten taşıyor, dönemler çözülmez
+            metadata, segments = read_footer(file_path)
+            data = dict.fromkeys(entry["key"] for entry in segments)
+            metadata.setdefault("total_semesters", len(segments))
+            metadata.setdefault("total_courses", sum(entry.get("courses", 0) for entry in segments))
+        else:
+            payload = unpack(raw)
+            data = payload["semesters"]
+            metadata = payload.get("metadata") or {}
+            metadata.setdefault("total_semesters", len(data))
+            metadata.setdefault("total_courses", sum(len(semester.get("courses", [])) for semester in data.values()))
+            segments = None
+        
+        internal_progress(f"Veri dizini oluşturuluyor: {file_path.name}")
+        return write_data_index(username, data, metadata, file_path, hashlib.sha1(raw).hexdigest(), segments)
+    except Exception as e:
+        internal_progress(f"Veri dizini oluşturulamadı: {e}")
+        return None
+
+
 def clear_user_data(username: str, data_dir: str) -> bool:
     """Kullanıcının önbelleğe alınmış verisini temizle"""
     try:
         file_path = get_data_file_path(username, data_dir)
         
-        if file_path.exists():
-            file_path.unlink()
-            internal_progress("Önbellek temizlendi")
-            return True
+        clear_checkpoint(username, data_dir)
         
-        return False
+        if STORAGE_ENGINE == "sqlite":
+            cleared = _sqlite_store(username, data_dir).clear(username)
+            if cleared:
+                internal_progress("Önbellek temizlendi")
+            return cleared
+        
+        removed = False
+        with file_lock(get_lock_path(username, data_dir)):
+            _remove_data_index(username, data_dir)
+            
+            # Yedek ve kenara alınmış bozuk nesiller de temizlenir
+            for path in (file_path, get_segment_file_path(username, data_dir)):
+                for generation in (path, backup_path(path), path.with_name(path.name + ".corrupt")):
+                    if generation.exists():
+                        generation.unlink()
+                        removed = True
+        
+        if removed:
+            internal_progress("Önbellek temizlendi")
+        return removed
         
     except Exception as e:
         user_error(f"Önbellek temizleme hatası: {e}")
         return False
 
 
+def is_semester_finalized(semester_data: Dict[str, Any]) -> bool:
+    """Dönemdeki tüm derslerin bn/bd notu girilmiş mi kontrol et"""
+    courses = semester_data.get("courses", [])
+    return bool(courses) and all(course.get("bn") or course.get("bd") for course in courses)
+
+
+def select_semesters_to_refresh(semesters: List[Dict[str, str]], existing_data: Dict[str, Any]) -> List[Dict[str, str]]:
+    """Artımlı yenilemede toplanması gereken dönemleri seç
+
+    Güncel dönem (Donem menüsündeki ilk seçenek), önbellekte olmayan dönemler ve
+    notları henüz tamamlanmamış dönemler yeniden toplanır; diğerleri dondurulmuş sayılır.
+    """
+    if not semesters:
+        return []
+    
+    current_key = semesters[0]["value"]
+    selected = []
+    
+    for semester in semesters:
+        cached = existing_data.get(semester["value"])
+        if semester["value"] == current_key or not cached:
+            selected.append(semester)
+        elif not (cached.get("frozen") or is_semester_finalized(cached)):
+            selected.append(semester)
+    
+    return selected
+
+
+def merge_semester_data(semesters: List[Dict[str, str]], existing_data: Dict[str, Any], fresh_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Taze dönemleri mevcut önbellekle birleştir ve bitmiş dönemleri dondur"""
+    current_key = semesters[0]["value"] if semesters else None
+    merged = {}
+    
+    # Menü sırasını koru; toplanamayan dönemlerde önbellekteki veri kalır
+    for semester in semesters:
+        key = semester["value"]
+        semester_data = fresh_data.get(key) or existing_data.get(key)
+        if not semester_data:
+            continue
+        
+        semester_data = dict(semester_data)
+        semester_data["frozen"] = key != current_key and is_semester_finalized(semester_data)
+        merged[key] = semester_data
+    
+    for key, semester_data in existing_data.items():
+        if key not in merged:
+            merged[key] = semester_data
+    
+    return merged
+
+
+def semester_summaries(data: Mapping) -> List[Dict[str, Any]]:
+    """Dönem adı ve ders sayıları; tembel veride segmentler çözülmeden tablodan okunur"""
+    if hasattr(data, "summaries"):
+        return data.summaries()
+    
+    return [
+        {"key": key, "name": semester_data.get("semester_name") or key, "courses": len(semester_data.get("courses", []))}
+        for key, semester_data in data.items()
+    ]
+
+
 def format_file_size(size_bytes: int) -> str:
     """Dosya boyutunu görüntüleme için biçimlendir"""
     if size_bytes < 1024:
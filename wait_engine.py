@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+KOU Not Bilgi Sistemi - Olay Tabanlı Bekleme Motoru
+Sabit time.sleep çağrıları yerine sayfa hazır olduğu anda biten beklemeler
+"""
+
+import time
+from typing import Callable, Dict, Any, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from config import WAIT_POLL_INTERVAL, WAIT_QUIET_MS, WAIT_SETTLE_MS, DEFAULT_TIMEOUT
+from logger import log_info, internal_progress
+
+
+# XHR/fetch sayacı ve DOM değişim zaman damgası; her sayfa yüklemesinden sonra yeniden kurulur
+HOOK_SCRIPT = """
+if (!window.__kouWait) {
+    var w = window.__kouWait = {pending: 0, lastMutation: Date.now()};
+    var origSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        var settled = false;
+        w.pending++;
+        this.addEventListener('loadend', function() {
+            if (!settled) { settled = true; w.pending--; w.lastMutation = Date.now(); }
+        });
+        return origSend.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var origFetch = window.fetch;
+        window.fetch = function() {
+            w.pending++;
+            return origFetch.apply(this, arguments).finally(function() {
+                w.pending--; w.lastMutation = Date.now();
+            });
+        };
+    }
+    if (window.MutationObserver && document.documentElement) {
+        new MutationObserver(function() { w.lastMutation = Date.now(); })
+            .observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+    }
+}
+"""
+
+STATE_SCRIPT = HOOK_SCRIPT + """
+var w = window.__kouWait;
+return {
+    ready: document.readyState,
+    jquery: (window.jQuery && window.jQuery.active) || 0,
+    pending: w.pending,
+    quietMs: Date.now() - w.lastMutation
+};
+"""
+
+# _load_semester_grades_fast'taki tablo seçicileriyle aynı sırada imza üret (kancaları da kurar,
+# böylece dönem seçiminden önce alınan imza sonraki XHR'ın sayılmasını sağlar)
+TABLE_SIGNATURE_SCRIPT = HOOK_SCRIPT + """
+var selectors = ["table.table.table-condensed", "table[border='1']", "div#AlinanDersler table", "table"];
+for (var i = 0; i < selectors.length; i++) {
+    var tables = document.querySelectorAll(selectors[i]);
+    for (var j = 0; j < tables.length; j++) {
+        var rows = tables[j].getElementsByTagName('tr');
+        if (rows.length > 1) {
+            return rows.length + ':' + tables[j].textContent.length + ':' + rows[1].textContent.trim().slice(0, 40);
+        }
+    }
+}
+return '';
+"""
+
+
+class PageWaiter:
+    """Sayfa, AJAX ve DOM sinyallerine göre bekleyen ve süreleri kaydeden yardımcı"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self.last_capped = False  # Son bekleme üst sınıra takıldı mı (hız düzenleyici için zaman aşımı işareti)
+
+    def _record(self, site: str, elapsed: float, satisfied: bool) -> float:
+        """Bekleme süresini bekleme noktası bazında kaydet"""
+        entry = self.stats.setdefault(site, {"count": 0, "total": 0.0, "max": 0.0, "capped": 0})
+        entry["count"] += 1
+        entry["total"] += elapsed
+        entry["max"] = max(entry["max"], elapsed)
+        if not satisfied:
+            entry["capped"] += 1
+        self.last_capped = not satisfied
+
+        log_info(f"⏱ {site}: {elapsed:.3f}s{'' if satisfied else ' (üst sınır)'}")
+        return elapsed
+
+    def wait_until(self, site: str, condition: Callable[[], bool], cap: float = DEFAULT_TIMEOUT) -> float:
+        """Koşul sağlanana kadar kısa aralıklarla yokla; cap yalnızca son çare üst sınırdır"""
+        start = time.time()
+        satisfied = False
+
+        while True:
+            try:
+                if condition():
+                    satisfied = True
+                    break
+            except WebDriverException:
+                # Sayfa geçişi sırasında betik çalışmayabilir, tekrar dene
+                pass
+
+            if time.time() - start >= cap:
+                break
+            time.sleep(WAIT_POLL_INTERVAL)
+
+        return self._record(site, time.time() - start, satisfied)
+
+    def _page_state(self) -> Dict[str, Any]:
+        """Sayfanın yüklenme/AJAX/DOM durumunu tek çağrıyla al"""
+        return self.driver.execute_script(STATE_SCRIPT) or {}
+
+    def _is_idle(self, quiet_ms: int) -> bool:
+        state = self._page_state()
+        return (
+            state.get("ready") == "complete"
+            and not state.get("jquery")
+            and not state.get("pending")
+            and state.get("quietMs", 0) >= quiet_ms
+        )
+
+    def page_ready(self, site: str, cap: float = DEFAULT_TIMEOUT, quiet_ms: int = WAIT_QUIET_MS) -> float:
+        """Belge yüklendi, bekleyen XHR/jQuery isteği yok ve DOM sakinleşti"""
+        return self.wait_until(site, lambda: self._is_idle(quiet_ms), cap)
+
+    def ajax_idle(self, site: str, cap: float = DEFAULT_TIMEOUT, quiet_ms: int = WAIT_QUIET_MS) -> float:
+        """AJAX tetikleyen bir tıklamadan sonra ağ ve DOM boşta olana kadar bekle"""
+        return self.page_ready(site, cap, quiet_ms)
+
+    def table_signature(self) -> str:
+        """Not tablosunun satır sayısı/içerik imzasını al"""
+        try:
+            return self.driver.execute_script(TABLE_SIGNATURE_SCRIPT) or ""
+        except WebDriverException:
+            return ""
+
+    def table_changed(self, site: str, previous_signature: str, cap: float = DEFAULT_TIMEOUT) -> float:
+        """Tablo imzası değişip sayfa boşta kalana kadar bekle
+
+        Boş dönemlerde tablo hiç değişmeyebilir; AJAX bitip DOM WAIT_SETTLE_MS boyunca
+        sakin kaldıysa da bekleme tamamlanmış sayılır.
+        """
+        def changed() -> bool:
+            signature = self.driver.execute_script(TABLE_SIGNATURE_SCRIPT) or ""
+            if signature and signature != previous_signature:
+                return self._is_idle(WAIT_QUIET_MS)
+            return self._is_idle(WAIT_SETTLE_MS)
+
+        return self.wait_until(site, changed, cap)
+
+    def element_content_changed(self, site: str, element_id: str, previous_html: Optional[str],
+                                cap: float = DEFAULT_TIMEOUT) -> float:
+        """Bir öğenin içeriği öncekinden farklı ve dolu olana kadar bekle (ör. ModalBody)"""
+        script = "var e = document.getElementById(arguments[0]); return e ? e.innerHTML : null;"
+
+        def changed() -> bool:
+            current = self.driver.execute_script(script, element_id)
+            return bool(current and current.strip()) and current != previous_html and self._is_idle(WAIT_QUIET_MS)
+
+        return self.wait_until(site, changed, cap)
+
+    def element_hidden(self, site: str, element_id: str, cap: float = 1.0) -> float:
+        """Bir öğe gizlenene veya kaldırılana kadar bekle (ör. modal kapanışı)"""
+        script = """
+        var e = document.getElementById(arguments[0]);
+        return !e || e.offsetParent === null || getComputedStyle(e).display === 'none';
+        """
+        return self.wait_until(site, lambda: bool(self.driver.execute_script(script, element_id)), cap)
+
+    def total_wait(self) -> float:
+        """Toplam bekleme süresi"""
+        return sum(entry["total"] for entry in self.stats.values())
+
+    def report(self):
+        """Bekleme noktası başına gerçek bekleme sürelerini özetle"""
+        if not self.stats:
+            return
+
+        internal_progress(f"⏱ Toplam bekleme: {self.total_wait():.2f}s")
+        for site, entry in sorted(self.stats.items(), key=lambda item: item[1]["total"], reverse=True):
+            internal_progress(
+                f"   {site}: {entry['count']}x, toplam {entry['total']:.2f}s, "
+                f"en uzun {entry['max']:.2f}s, üst sınıra takılan {entry['capped']}"
+            )